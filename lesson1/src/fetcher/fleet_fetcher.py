@@ -0,0 +1,131 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from fetcher.token_bucket import TokenBucket
+
+
+class FleetFetcher:
+    """
+    複数エッジ並列取得
+
+    全エッジの計測リストと、各計測の位置情報を並列に取得する
+    - 同時リクエスト数は max_in_flight まで
+    - リクエスト開始はトークンバケットでレート制限（固定スリープの代わり）
+    - 結果はエッジ・計測の指定順に連結する（逐次取得と同じ出力）
+    - list_windows 指定時は計測を時間窓に分割し、時間窓ごとのリクエストも
+      同じワーカーで取得する（同時リクエスト数は max_in_flight のまま）
+
+    Attributes:
+        list_measurements (Callable[[str], list]): エッジUUID → 計測リスト
+        get_coordinates (Callable[[dict], list]): 計測 → 位置情報リスト
+        max_in_flight (int): 同時リクエスト数
+        bucket (TokenBucket): レート制限
+        list_windows (Optional[Callable[[dict], Optional[list]]]):
+            計測 → 時間窓リスト（分割できない場合はNoneで get_coordinates を使う）
+        get_window (Optional[Callable[[dict, Any], Optional[tuple]]]):
+            計測・時間窓 → 位置情報（ない場合はNone）
+    """
+
+    def __init__(
+        self,
+        list_measurements: Callable[[str], list],
+        get_coordinates: Callable[[dict], list],
+        max_in_flight: int = 4,
+        rate: float = 2.0,
+        burst: int = 4,
+        list_windows: Optional[Callable[[dict], Optional[list]]] = None,
+        get_window: Optional[Callable[[dict, Any], Optional[tuple]]] = None,
+    ) -> None:
+        self.list_measurements = list_measurements
+        self.get_coordinates = get_coordinates
+        self.max_in_flight = max_in_flight
+        self.bucket = TokenBucket(rate, burst)
+        self.list_windows = list_windows
+        self.get_window = get_window
+
+    def fetch_measurements(
+        self,
+        edge_uuids: List[str],
+        skip: Optional[Callable[[dict], bool]] = None,
+    ) -> List[Tuple[str, dict, Optional[list]]]:
+        """
+        計測ごとの位置情報取得
+
+        Args:
+            edge_uuids (List[str]): エッジUUIDリスト
+            skip (Optional[Callable[[dict], bool]]): Trueを返した計測は位置情報を取得しない
+
+        Returns:
+            list: (エッジUUID, 計測, 位置情報のリスト) のリスト（取得しなかった計測はNone）
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="FleetFetcher"
+        ) as executor:
+            meas_futures = [
+                executor.submit(self._call, self.list_measurements, edge_uuid)
+                for edge_uuid in edge_uuids
+            ]
+
+            # 計測リストを受け取ったエッジから位置情報の取得を登録
+            coord_futures: List[Tuple[str, dict, Optional[List[Future]]]] = []
+            for edge_uuid, meas_future in zip(edge_uuids, meas_futures):
+                meas_list = meas_future.result()
+                logging.info(
+                    f"Got measurements list edge_uuid: {edge_uuid}, meas_list: {len(meas_list)}"
+                )
+                for meas in meas_list:
+                    futures = None
+                    if skip is None or not skip(meas):
+                        futures = self._submit(executor, meas)
+                    coord_futures.append((edge_uuid, meas, futures))
+
+            results: List[Tuple[str, dict, Optional[list]]] = []
+            count = 0
+            for edge_uuid, meas, futures in coord_futures:
+                if futures is None:
+                    logging.info(f"Skipped meas: {meas['uuid']}")
+                    results.append((edge_uuid, meas, None))
+                    continue
+                coordinates = [c for future in futures for c in future.result()]
+                count += len(coordinates)
+                logging.info(f"Added meas: {meas['uuid']} coordinates: {count}")
+                results.append((edge_uuid, meas, coordinates))
+        return results
+
+    def _submit(self, executor: ThreadPoolExecutor, meas: dict) -> List[Future]:
+        """
+        計測の位置情報取得登録
+
+        Args:
+            executor (ThreadPoolExecutor): ワーカー
+            meas (dict): 計測
+
+        Returns:
+            List[Future]: 位置情報リストのFuture（時間窓に分割した場合は時間窓ごと）
+        """
+        windows = self.list_windows(meas) if self.list_windows else None
+        if windows is None or self.get_window is None:
+            return [executor.submit(self._call, self.get_coordinates, meas)]
+
+        get_window = self.get_window
+
+        def fetch_window(window: Any) -> list:
+            coord = get_window(meas, window)
+            return [coord] if coord else []
+
+        return [executor.submit(self._call, fetch_window, w) for w in windows]
+
+    def _call(self, fn: Callable[[Any], Any], arg: Any) -> Any:
+        """
+        レート制限付き呼び出し（ワーカースレッド）
+
+        Args:
+            fn (Callable): 取得関数
+            arg (Any): 引数
+
+        Returns:
+            Any: 取得結果
+        """
+        self.bucket.acquire()
+        return fn(arg)
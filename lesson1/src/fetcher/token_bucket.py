@@ -0,0 +1,50 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    トークンバケット
+
+    一定レートでトークンを補充し、リクエスト開始ごとに1トークン消費する
+    - 最大 capacity 個までため込めるため、短時間のバーストを許容する
+    - トークンがなければ補充されるまで待機する（スレッドセーフ）
+
+    Attributes:
+        rate (float): 1秒あたりの補充トークン数
+        capacity (int): 最大トークン数
+        _tokens (float): 現在のトークン数
+        _updated (float): 最終補充時刻（time.monotonic）
+        _lock (threading.Lock): 排他
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        トークン取得
+
+        Returns:
+            float: 待機した時間（秒）
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
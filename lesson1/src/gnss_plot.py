@@ -1,21 +1,28 @@
 import argparse
-import base64
 import json
 import logging
-import struct
 import sys
-import time
 import traceback
+from datetime import timedelta
 from math import atan2, cos, radians, sin, sqrt
+from pathlib import Path
+from typing import Optional
 
 import folium
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
-
-from intdash import ApiClient, Configuration
-from intdash.api import (
-    measurement_service_data_points_api,
-    measurement_service_measurements_api,
+import numpy as np
+from client.client_factory import ClientFactory
+from fetcher.fleet_fetcher import FleetFetcher
+from nmea.batch_parser import parse_data_points
+from render.grid_renderer import GridRenderer
+from summary.measurement_summary import SummaryStore, summarize
+
+from intdash.api.measurement_service_data_points_api import (
+    MeasurementServiceDataPointsApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 
 # ログ設定
@@ -31,35 +38,23 @@ MAP_ZOOM_START = 8
 CIRCLE_RADIUS = 3
 CIRCLE_OPACITY = 0.8
 SAMPLE_INTERVAL = 600  # 1/1sec > 1/10min
+SPARSE_WINDOW = 10  # 間引き取得の時間窓（秒）
+SPARSE_LIMIT = 20  # 間引き取得の時間窓あたりの最大データポイント数
+DATA_ID_FILTER = [
+    "#:0/GNRMC",  # NMEA
+    "#:1/gnss_coordinates",  # intdash Motion
+]
 CMAP = plt.get_cmap("jet")
 NORM = mcolors.Normalize(vmin=0, vmax=250)
 LIMIT = 10
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
-def get_meas_list(client: ApiClient, project_uuid: str, edge_uuid: str) -> list:
+def get_meas_list(factory: ClientFactory, project_uuid: str, edge_uuid: str) -> list:
     """
     エッジ計測リスト取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         edge_uuid: エッジUUID
 
@@ -67,97 +62,137 @@ def get_meas_list(client: ApiClient, project_uuid: str, edge_uuid: str) -> list:
         list: 計測リスト
     """
 
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     measurements = api.list_project_measurements(
         project_uuid=project_uuid, edge_uuid=edge_uuid, limit=LIMIT
     )
     return measurements["items"]
 
 
-def parse_gnrmc(gnrmc: str) -> tuple:
+def get_coordinates(factory: ClientFactory, project_uuid: str, meas_uuid: str) -> list:
     """
-    GNRMCパース
+    位置情報取得
 
-    緯度（ddmm.mmmm）・N/S・経度（ddmm.mmmm）・E/Wを抽出し、緯度（float）と経度（float）に変換
-    変換できない場合はNoneを返す
+    計測のGNSSデータのうち、"#:0/GNRMC"のみ取得
+    SAMPLE_INTERVALごとにサンプリングし、サンプリングしたデータポイント（JSONLines形式）の
+    ["data"]["s"]（GNRMC形式）・["data"]["d"]（iSCPv2）をまとめてパースして位置情報に変換
 
     Args:
-        gnrmc: GNRMC文字列
+        factory: APIクライアント生成
+        project_uuid: プロジェクトUUID
+        meas_uuid: 計測UUID
 
     Returns:
-        tuple: (緯度, 経度)
+        list: 位置情報（緯度・経度）のリスト
     """
-    fields = gnrmc.split(",")
-    if len(fields) < 10:
-        raise ValueError("Invalid GNRMC string")
 
-    raw_latitude, lat_direction = fields[3], fields[4]
-    raw_longitude, lon_direction = fields[5], fields[6]
+    api = factory.api(MeasurementServiceDataPointsApi)
+    stream = api.list_project_data_points(
+        project_uuid=project_uuid,
+        name=meas_uuid,
+        data_id_filter=DATA_ID_FILTER,
+    )
 
-    if not raw_latitude or not lat_direction or not raw_longitude or not lon_direction:
-        return None, None
+    sampled = []
+    sample_count = 0
+    while True:
+        line = stream.readline()
+        if not line:
+            break
 
-    lat = int(raw_latitude[:2]) + float(raw_latitude[2:]) / 60
-    if lat_direction == "S":
-        lat = -lat
-    lon = int(raw_longitude[:3]) + float(raw_longitude[3:]) / 60
-    if lon_direction == "W":
-        lon = -lon
+        if sample_count % SAMPLE_INTERVAL == 0:
+            sampled.append(json.loads(line.decode()))
+        sample_count += 1
 
-    return lat, lon
+    return to_coordinates(*parse_data_points(sampled))
 
 
-def get_coordinates(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
+def to_coordinates(lat: np.ndarray, lon: np.ndarray, valid: np.ndarray) -> list:
     """
-    位置情報取得
+    パース結果 → 位置情報リスト
 
-    計測のGNSSデータのうち、"#:0/GNRMC"のみ取得
-    データポイント（JSONLines形式）ごとの["data"]["s"]（GNRMC形式）をパースして位置情報に変換
-    SAMPLE_INTERVALごとにサンプリング
+    緯度・経度のいずれかが0の位置情報は除外する
 
     Args:
-        client: APIクライアント
-        project_uuid: プロジェクトUUID
-        meas_uuid: 計測UUID
+        lat: 緯度の配列
+        lon: 経度の配列
+        valid: 有効フラグ
 
     Returns:
         list: 位置情報（緯度・経度）のリスト
     """
+    mask = valid & (lat != 0) & (lon != 0)
+    return list(zip(lat[mask].tolist(), lon[mask].tolist()))
 
-    api = measurement_service_data_points_api.MeasurementServiceDataPointsApi(client)
+
+def get_window_coordinate(
+    factory: ClientFactory,
+    project_uuid: str,
+    meas_uuid: str,
+    start: str,
+    end: str,
+) -> Optional[tuple]:
+    """
+    時間窓の位置情報取得
+
+    時間窓のデータポイント（最大SPARSE_LIMIT件）をまとめてパースし、最初の位置情報を返す
+
+    Args:
+        factory: APIクライアント生成
+        project_uuid: プロジェクトUUID
+        meas_uuid: 計測UUID
+        start: 開始時刻（RFC3339形式）
+        end: 終了時刻（RFC3339形式）
+
+    Returns:
+        Optional[tuple]: 位置情報（緯度・経度）、時間窓内になければNone
+    """
+    api = factory.api(MeasurementServiceDataPointsApi)
     stream = api.list_project_data_points(
         project_uuid=project_uuid,
         name=meas_uuid,
-        data_id_filter=[
-            "#:0/GNRMC",  # NMEA
-            "#:1/gnss_coordinates",  # intdash Motion
-        ],
+        data_id_filter=DATA_ID_FILTER,
+        start=start,
+        end=end,
+        limit=SPARSE_LIMIT,
     )
 
-    coordinates = []
-    sample_count = 0
+    data_points = []
     while True:
         line = stream.readline()
         if not line:
             break
+        data_points.append(json.loads(line.decode()))
 
-        line_json = json.loads(line.decode())
-        if "data" in line_json:
-            # iSCPv1 NMEA
-            if "s" in line_json["data"]:
-                x, y = parse_gnrmc(line_json["data"]["s"])
+    coordinates = to_coordinates(*parse_data_points(data_points))
+    return coordinates[0] if coordinates else None
 
-            # iSCPv2
-            elif "d" in line_json["data"]:
-                base64_encoded = line_json["data"]["d"]
-                bin_data = base64.b64decode(base64_encoded)
-                x, y = struct.unpack(">dd", bin_data)
 
-            if x and y and sample_count % SAMPLE_INTERVAL == 0:
-                coordinates.append((x, y))
-        sample_count += 1
+def list_sparse_windows(meas: dict) -> Optional[list]:
+    """
+    間引き取得の時間窓リスト
+
+    計測をSAMPLE_INTERVAL秒ごとに区切り、各区間の先頭SPARSE_WINDOW秒を時間窓とする
+    転送量は生データのサンプリングレートではなく、地図の解像度（区間数）に比例する
 
-    return coordinates
+    Args:
+        meas: 計測（uuid, basetime, duration）
+
+    Returns:
+        Optional[list]: 時間窓（開始時刻, 終了時刻）のリスト、計測の長さが不明（計測中など）の場合はNone
+    """
+    duration = meas.get("duration")
+    if not duration:
+        return None
+
+    basetime = meas["basetime"]
+    return [
+        (
+            (basetime + timedelta(seconds=t)).isoformat(),
+            (basetime + timedelta(seconds=t + SPARSE_WINDOW)).isoformat(),
+        )
+        for t in range(0, int(duration / 1000) + 1, SAMPLE_INTERVAL)
+    ]
 
 
 def calculate_distance(coord1: tuple, coord2: tuple) -> float:
@@ -183,39 +218,47 @@ def calculate_distance(coord1: tuple, coord2: tuple) -> float:
     return R * 2 * atan2(sqrt(a), sqrt(1 - a))
 
 
-def total_distance(coordinates: list) -> float:
-    """
-    総走行距離
-
-    Args:
-        coordinates: 座標リスト
-
-    Returns:
-        float: 総走行距離 (km)
-    """
-    return sum(
-        calculate_distance(coordinates[i], coordinates[i - 1])
-        for i in range(1, len(coordinates))
-    )
-
-
-def main(api_url: str, api_token: str, project_uuid: str, edge_uuids: str) -> None:
+def main(
+    api_url: str,
+    api_token: str,
+    project_uuid: str,
+    edge_uuids: list,
+    max_in_flight: int = 4,
+    rate: float = 2.0,
+    sparse: bool = False,
+    render: str = "points",
+    summary_file: Optional[Path] = None,
+    report_only: bool = False,
+) -> None:
     """
     メイン
 
     - 入力
       - 位置情報取得
-        - サーバー負荷軽減のためのスリープ
+        - 全エッジの計測リスト・位置情報を max_in_flight 並列で取得
+        - サーバー負荷軽減のため、リクエスト開始を rate 回/秒に制限
+        - sparse 指定時はSAMPLE_INTERVAL秒ごとの短い時間窓のみ取得（時間窓も同じ並列数で取得）
     - 出力
       - 地図保存
         - jetカラーマップ 0km：青〜250km：赤 で位置情報を点としてマッピング
+        - render が heatmap / raster の場合はグリッドに集計してから描画
+          （地図の大きさは点数によらずグリッドのビン数で決まる）
       - 総走行距離計算
+        - 計測ごとの経路長の合計（計測・エッジをまたいで点をつながない）
+        - summary_file 指定時は完了した計測のサマリーを保存し、次回以降は再計算しない
+        - report_only 指定時は地図を保存せず、サマリー未計算の計測のみ位置情報を取得
 
     Args:
         api_url: intdash APIのURL
         api_token: 認証用のAPIトークン
         project_uuid: プロジェクトUUID
         edge_uuids: エッジUUIDリスト
+        max_in_flight: 同時リクエスト数
+        rate: 1秒あたりのリクエスト開始数
+        sparse: 時間窓による間引き取得
+        render: 描画方法（points/heatmap/raster）
+        summary_file: 計測サマリーの保存先
+        report_only: 総走行距離のみ計算（地図を保存しない）
     """
 
     try:
@@ -223,43 +266,74 @@ def main(api_url: str, api_token: str, project_uuid: str, edge_uuids: str) -> No
         logging.info(
             f"Processing project_uuid: {project_uuid}, edge_uuid: {edge_uuids}"
         )
-        client = get_client(api_url, api_token)
-        coordinates = []
-        for edge_uuid in edge_uuids:
-            meas_list = get_meas_list(client, project_uuid, edge_uuid)
-            logging.info(
-                f"Got measurements list edge_uuid: {edge_uuid}, meas_list: {len(meas_list)}"
-            )
-            for meas in meas_list:
-                meas_uuid = meas["uuid"]
-                coordinates.extend(get_coordinates(client, project_uuid, meas_uuid))
-                logging.info(f"Added meas: {meas_uuid} coordinates: {len(coordinates)}")
-                time.sleep(1)
+        factory = ClientFactory(api_url, api_token, max_in_flight)
+        fetcher = FleetFetcher(
+            lambda edge_uuid: get_meas_list(factory, project_uuid, edge_uuid),
+            lambda meas: get_coordinates(factory, project_uuid, meas["uuid"]),
+            max_in_flight=max_in_flight,
+            rate=rate,
+            list_windows=list_sparse_windows if sparse else None,
+            get_window=lambda meas, window: get_window_coordinate(
+                factory, project_uuid, meas["uuid"], *window
+            ),
+        )
+        resolution = f"{'sparse' if sparse else 'full'}:{SAMPLE_INTERVAL}"
+        store = SummaryStore(summary_file).load() if summary_file else None
+        results = fetcher.fetch_measurements(
+            edge_uuids,
+            skip=(
+                (lambda meas: store.get(meas["uuid"], resolution) is not None)
+                if store and report_only
+                else None
+            ),
+        )
+
+        # 総走行距離計算
+        total_dist = 0.0
+        for edge_uuid, meas, coords in results:
+            summary = store.get(meas["uuid"], resolution) if store else None
+            if summary is None:
+                summary = summarize(meas["uuid"], edge_uuid, resolution, coords or [])
+                if store and meas.get("ended"):
+                    store.put(summary)
+            total_dist += summary.path_length
+        if store:
+            store.save()
+
+        if report_only:
+            logging.info(f"総走行距離: {total_dist:.2f} km")
+            return
 
         # 地図保存
+        coordinates = [coord for _, _, coords in results for coord in coords or []]
         m = folium.Map(location=ORIGIN, zoom_start=MAP_ZOOM_START)
-        for coord in coordinates:
-            distance = calculate_distance(ORIGIN, coord)
-            distance = NORM(distance)
-            color = CMAP(distance)
-            color_hex = "#{:02x}{:02x}{:02x}".format(
-                int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
-            )
-            folium.CircleMarker(
-                location=coord,
-                radius=CIRCLE_RADIUS,
-                color=color_hex,
-                fill=True,
-                fill_color=color_hex,
-                fill_opacity=CIRCLE_OPACITY,
-            ).add_to(m)
+        if render == "heatmap":
+            bins = GridRenderer(ORIGIN, CMAP, NORM).add_heatmap(m, coordinates)
+            logging.info(f"Rendered heatmap bins: {bins}")
+        elif render == "raster":
+            bins = GridRenderer(ORIGIN, CMAP, NORM).add_raster(m, coordinates)
+            logging.info(f"Rendered raster bins: {bins}")
+        else:
+            for coord in coordinates:
+                distance = calculate_distance(ORIGIN, coord)
+                distance = NORM(distance)
+                color = CMAP(distance)
+                color_hex = "#{:02x}{:02x}{:02x}".format(
+                    int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
+                )
+                folium.CircleMarker(
+                    location=coord,
+                    radius=CIRCLE_RADIUS,
+                    color=color_hex,
+                    fill=True,
+                    fill_color=color_hex,
+                    fill_opacity=CIRCLE_OPACITY,
+                ).add_to(m)
 
         map_file = "map.html"
         m.save(map_file)
         logging.info(f"Map saved to {map_file}")
 
-        # 総走行距離計算
-        total_dist = total_distance(coordinates)
         logging.info(f"総走行距離: {total_dist:.2f} km")
 
     except Exception as e:
@@ -277,6 +351,52 @@ if __name__ == "__main__":
         help="Project UUID (default: 00000000-0000-0000-0000-000000000000)",
     )
     parser.add_argument("--edge_uuids", nargs="+", required=True, help="Edge UUID")
+    parser.add_argument(
+        "--max_in_flight",
+        type=int,
+        default=4,
+        help="Max concurrent requests (default: 4)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Max requests started per second (default: 2.0)",
+    )
+
+    parser.add_argument(
+        "--render",
+        choices=["points", "heatmap", "raster"],
+        default="points",
+        help="Map rendering: one marker per point, or aggregated into a grid (default: points)",
+    )
+    parser.add_argument(
+        "--summary_file",
+        type=Path,
+        default=None,
+        help="JSON file to cache per-measurement summaries of completed measurements",
+    )
+    parser.add_argument(
+        "--report_only",
+        action="store_true",
+        help="Only report total distance; fetch coordinates of uncached measurements",
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Fetch only a short time window per sample interval",
+    )
 
     args = parser.parse_args()
-    main(args.api_url, args.api_token, args.project_uuid, args.edge_uuids)
+    main(
+        args.api_url,
+        args.api_token,
+        args.project_uuid,
+        args.edge_uuids,
+        args.max_in_flight,
+        args.rate,
+        args.sparse,
+        args.render,
+        args.summary_file,
+        args.report_only,
+    )
@@ -0,0 +1,234 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# パース結果（緯度, 経度, 有効フラグ）
+Coordinates = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# GNRMCのフィールド番号
+GNRMC_MIN_FIELDS = 10
+LAT_FIELD, LAT_DIR_FIELD = 3, 4
+LON_FIELD, LON_DIR_FIELD = 5, 6
+
+# iSCPv2 位置情報（緯度・経度 float64 ビッグエンディアン）
+COORDINATES_SIZE = 16
+COORDINATES_BASE64_SIZE = 24
+
+COMMA, DOT, ZERO, NINE = ord(","), ord("."), ord("0"), ord("9")
+
+# base64文字 → 6bit値（無効文字は255）
+BASE64_TABLE = np.full(256, 255, dtype=np.uint8)
+BASE64_TABLE[
+    np.frombuffer(
+        b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+        dtype=np.uint8,
+    )
+] = np.arange(64, dtype=np.uint8)
+
+
+def to_matrix(values: Sequence[str]) -> np.ndarray:
+    """
+    文字列リスト → 文字コード行列
+
+    Args:
+        values: ASCII文字列のリスト
+
+    Returns:
+        np.ndarray: (件数, 最大文字数) のuint8行列（不足分は0埋め）
+    """
+    if not values:
+        return np.zeros((0, 1), dtype=np.uint8)
+    try:
+        array = np.array(values, dtype=np.bytes_)
+    except UnicodeEncodeError:
+        array = np.array([v.encode("ascii", "replace") for v in values])
+    width = max(array.dtype.itemsize, 1)
+    return np.frombuffer(array.tobytes(), dtype=np.uint8).reshape(len(values), width)
+
+
+def parse_field_numbers(
+    mat: np.ndarray, fields: np.ndarray, field: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    数値フィールド一括変換
+
+    Args:
+        mat: 文字コード行列
+        fields: 文字ごとのフィールド番号
+        field: 対象フィールド番号
+
+    Returns:
+        tuple: (数値, 有効フラグ) 空または数字・小数点以外を含む場合は無効
+    """
+    cols = np.arange(mat.shape[1])
+    mask = (fields == field) & (mat != COMMA) & (mat != 0)
+    digits = mask & (mat >= ZERO) & (mat <= NINE)
+    dots = mask & (mat == DOT)
+    present = mask.any(axis=1)
+
+    # 小数点の位置（なければフィールド末尾）を基準に桁を決める
+    end = np.where(present, mat.shape[1] - np.argmax(mask[:, ::-1], axis=1), 0)
+    point = np.where(dots.any(axis=1), np.argmax(dots, axis=1), end)[:, None]
+    exponent = np.where(cols < point, point - cols - 1, point - cols)
+    values = np.where(digits, (mat.astype(np.float64) - ZERO) * 10.0**exponent, 0)
+
+    valid = present & ~(mask & ~digits & ~dots).any(axis=1) & (dots.sum(axis=1) <= 1)
+    return values.sum(axis=1), valid
+
+
+def parse_field_chars(mat: np.ndarray, fields: np.ndarray, field: int) -> np.ndarray:
+    """
+    フィールド先頭文字一括取得
+
+    Args:
+        mat: 文字コード行列
+        fields: 文字ごとのフィールド番号
+        field: 対象フィールド番号
+
+    Returns:
+        np.ndarray: 先頭の文字コード（空フィールドは0）
+    """
+    mask = (fields == field) & (mat != COMMA) & (mat != 0)
+    first = mat[np.arange(len(mat)), np.argmax(mask, axis=1)]
+    return np.where(mask.any(axis=1), first, 0)
+
+
+def to_degrees(value: np.ndarray) -> np.ndarray:
+    """
+    度分（dddmm.mmmm）→ 度
+
+    Args:
+        value: 度分の数値
+
+    Returns:
+        np.ndarray: 度
+    """
+    degrees = np.floor(value / 100)
+    return degrees + (value - degrees * 100) / 60
+
+
+def parse_gnrmc_batch(sentences: Sequence[str]) -> Coordinates:
+    """
+    GNRMC一括パース
+
+    全文を文字コード行列にして、カンマの累積数でフィールドを割り当て、
+    緯度（ddmm.mmmm）・N/S・経度（dddmm.mmmm）・E/Wを配列演算で変換する
+
+    Args:
+        sentences: GNRMC文字列のリスト
+
+    Returns:
+        tuple: (緯度, 経度, 有効フラグ) 無効な要素の緯度・経度はNaN
+    """
+    mat = to_matrix(sentences)
+    commas = mat == COMMA
+    fields = np.cumsum(commas, axis=1)
+
+    lat, lat_ok = parse_field_numbers(mat, fields, LAT_FIELD)
+    lon, lon_ok = parse_field_numbers(mat, fields, LON_FIELD)
+    lat_dir = parse_field_chars(mat, fields, LAT_DIR_FIELD)
+    lon_dir = parse_field_chars(mat, fields, LON_DIR_FIELD)
+
+    valid = (
+        (commas.sum(axis=1) + 1 >= GNRMC_MIN_FIELDS)
+        & lat_ok
+        & lon_ok
+        & (lat_dir != 0)
+        & (lon_dir != 0)
+    )
+    lat = np.where(lat_dir == ord("S"), -1, 1) * to_degrees(lat)
+    lon = np.where(lon_dir == ord("W"), -1, 1) * to_degrees(lon)
+    return np.where(valid, lat, np.nan), np.where(valid, lon, np.nan), valid
+
+
+def decode_base64_batch(encoded: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    位置情報ペイロード（base64）一括デコード
+
+    Args:
+        encoded: base64文字列のリスト（16バイト = 24文字）
+
+    Returns:
+        tuple: ((件数, 16) のuint8行列, 有効フラグ)
+    """
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    mat = to_matrix(encoded)
+    if mat.shape[1] < COORDINATES_BASE64_SIZE:
+        mat = np.pad(mat, ((0, 0), (0, COORDINATES_BASE64_SIZE - mat.shape[1])))
+    mat = mat[:, :COORDINATES_BASE64_SIZE]
+
+    # 末尾2文字はパディング "=="
+    sextets = BASE64_TABLE[mat[:, :22]]
+    valid = (
+        (lengths == COORDINATES_BASE64_SIZE)
+        & (sextets != 255).all(axis=1)
+        & (mat[:, 22:] == ord("=")).all(axis=1)
+    )
+
+    # 4文字（6bit x 4）→ 3バイト
+    groups = np.pad(sextets, ((0, 0), (0, 2))).astype(np.uint32).reshape(-1, 6, 4)
+    bits = (
+        groups[..., 0] << 18
+        | groups[..., 1] << 12
+        | groups[..., 2] << 6
+        | groups[..., 3]
+    )
+    raw = np.stack([bits >> 16, bits >> 8, bits], axis=-1).astype(np.uint8)
+    return np.ascontiguousarray(
+        raw.reshape(len(encoded), -1)[:, :COORDINATES_SIZE]
+    ), valid
+
+
+def parse_binary_batch(payloads: Sequence[bytes]) -> Coordinates:
+    """
+    位置情報ペイロード（バイナリ）一括パース
+
+    Args:
+        payloads: ペイロードのリスト（緯度・経度 float64 ビッグエンディアン）
+
+    Returns:
+        tuple: (緯度, 経度, 有効フラグ) 無効な要素の緯度・経度はNaN
+    """
+    lengths = np.fromiter(map(len, payloads), dtype=np.int64, count=len(payloads))
+    valid = lengths == COORDINATES_SIZE
+    values = np.full((len(payloads), 2), np.nan)
+    if valid.any():
+        buffer = b"".join(p for p, ok in zip(payloads, valid) if ok)
+        values[valid] = np.frombuffer(buffer, dtype=">f8").reshape(-1, 2)
+    return values[:, 0], values[:, 1], valid
+
+
+def parse_data_points(data_points: List[dict]) -> Coordinates:
+    """
+    データポイント一括パース
+
+    iSCPv1（["data"]["s"] GNRMC）とiSCPv2（["data"]["d"] base64）をそれぞれまとめて変換する
+
+    Args:
+        data_points: データポイント（JSONLines 1行分）のリスト
+
+    Returns:
+        tuple: (緯度, 経度, 有効フラグ) 位置情報でない要素は無効
+    """
+    n = len(data_points)
+    lat = np.full(n, np.nan)
+    lon = np.full(n, np.nan)
+    valid = np.zeros(n, dtype=bool)
+
+    data = [dp.get("data") or {} for dp in data_points]
+    v1 = np.array([i for i, d in enumerate(data) if "s" in d], dtype=np.int64)
+    v2 = np.array(
+        [i for i, d in enumerate(data) if "s" not in d and "d" in d], dtype=np.int64
+    )
+
+    if len(v1):
+        lat[v1], lon[v1], valid[v1] = parse_gnrmc_batch([data[i]["s"] for i in v1])
+
+    if len(v2):
+        raw, ok = decode_base64_batch([data[i]["d"] for i in v2])
+        values = raw.view(">f8").reshape(-1, 2)
+        lat[v2] = np.where(ok, values[:, 0], np.nan)
+        lon[v2] = np.where(ok, values[:, 1], np.nan)
+        valid[v2] = ok
+
+    return lat, lon, valid
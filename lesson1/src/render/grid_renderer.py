@@ -0,0 +1,254 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import folium
+import numpy as np
+from folium.plugins import HeatMap
+from folium.raster_layers import ImageOverlay
+from numpy.typing import ArrayLike
+
+EARTH_RADIUS = 6371  # 地球の半径（km）
+TILE_SIZE = 256  # Webメルカトルのタイル画素数
+MAX_LATITUDE = 85.05112878  # Webメルカトルの緯度範囲
+
+
+@dataclass(slots=True)
+class GridBins:
+    """
+    集計済みグリッド
+
+    Attributes:
+        ix (np.ndarray): ビンの列番号（Webメルカトル座標 / セル画素数）
+        iy (np.ndarray): ビンの行番号
+        lat (np.ndarray): ビン内の平均緯度
+        lon (np.ndarray): ビン内の平均経度
+        count (np.ndarray): ビン内の点数
+        distance (np.ndarray): 原点からの距離（km）
+    """
+
+    ix: np.ndarray
+    iy: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    count: np.ndarray
+    distance: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+
+def haversine(
+    lat: np.ndarray, lon: np.ndarray, origin: Tuple[float, float]
+) -> np.ndarray:
+    """
+    原点からの距離（配列一括）
+
+    Args:
+        lat: 緯度の配列
+        lon: 経度の配列
+        origin: (緯度, 経度) 原点
+
+    Returns:
+        np.ndarray: 距離（km）
+    """
+    lat1, lon1 = np.radians(origin[0]), np.radians(origin[1])
+    lat2, lon2 = np.radians(lat), np.radians(lon)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return EARTH_RADIUS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def to_pixels(lat: np.ndarray, lon: np.ndarray, zoom: int) -> Tuple[np.ndarray, ...]:
+    """
+    緯度経度 → Webメルカトル画素座標
+
+    Args:
+        lat: 緯度の配列
+        lon: 経度の配列
+        zoom: ズームレベル
+
+    Returns:
+        tuple: (x, y) 画素座標（左上原点）
+    """
+    scale = TILE_SIZE * 2**zoom
+    sin_lat = np.sin(np.radians(np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE)))
+    x = (lon + 180) / 360 * scale
+    y = (0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * np.pi)) * scale
+    return x, y
+
+
+def to_latlon(x: np.ndarray, y: np.ndarray, zoom: int) -> Tuple[np.ndarray, ...]:
+    """
+    Webメルカトル画素座標 → 緯度経度
+
+    Args:
+        x: 画素座標xの配列
+        y: 画素座標yの配列
+        zoom: ズームレベル
+
+    Returns:
+        tuple: (緯度, 経度)
+    """
+    scale = TILE_SIZE * 2**zoom
+    lon = x / scale * 360 - 180
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y / scale))))
+    return lat, lon
+
+
+class GridRenderer:
+    """
+    グリッド集計描画
+
+    位置情報をWebメルカトルのグリッド（zoom レベルの cell 画素四方）に集計し、
+    ビンごとに1要素だけ描画する。地図の生成・表示時間は元の点数によらずビン数で決まる。
+    - heatmap: ビン中心に原点からの距離を重みとしたヒートマップレイヤー
+    - raster: ビンを画素とした画像（PNG）を地図に重ねる
+    集計・距離計算・色付けはすべてNumPyの配列演算で行う。
+
+    Attributes:
+        origin (Tuple[float, float]): 距離の原点（緯度, 経度）
+        cmap (Callable): カラーマップ（0〜1 → RGBA）
+        norm (Callable): 距離（km）→ 0〜1 の正規化
+        zoom (int): 集計するズームレベル
+        cell (int): セルの画素数
+        max_size (int): 画像の最大画素数（超える場合はズームレベルを下げる）
+        max_bins (int): ヒートマップの最大ビン数（超える場合はズームレベルを下げる）
+    """
+
+    def __init__(
+        self,
+        origin: Tuple[float, float],
+        cmap: Callable,
+        norm: Callable,
+        zoom: int = 12,
+        cell: int = 4,
+        max_size: int = 2048,
+        max_bins: int = 20000,
+    ) -> None:
+        self.origin = origin
+        self.cmap = cmap
+        self.norm = norm
+        self.zoom = zoom
+        self.cell = cell
+        self.max_size = max_size
+        self.max_bins = max_bins
+
+    def bin(self, coordinates: ArrayLike, zoom: Optional[int] = None) -> GridBins:
+        """
+        グリッド集計
+
+        Args:
+            coordinates: 位置情報（緯度・経度）の配列またはリスト
+            zoom: 集計するズームレベル（省略時は self.zoom）
+
+        Returns:
+            GridBins: 集計結果
+        """
+        zoom = self.zoom if zoom is None else zoom
+        coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        coords = coords[np.isfinite(coords).all(axis=1)]
+        lat, lon = coords[:, 0], coords[:, 1]
+
+        x, y = to_pixels(lat, lon, zoom)
+        # 列・行番号を1つの整数キーにまとめて一意化（zoom 23 まで 32bit に収まる）
+        keys = (x // self.cell).astype(np.int64) << 32 | (y // self.cell).astype(
+            np.int64
+        )
+        keys, inverse, count = np.unique(keys, return_inverse=True, return_counts=True)
+        mean_lat = np.bincount(inverse, weights=lat, minlength=len(keys)) / count
+        mean_lon = np.bincount(inverse, weights=lon, minlength=len(keys)) / count
+
+        return GridBins(
+            ix=keys >> 32,
+            iy=keys & 0xFFFFFFFF,
+            lat=mean_lat,
+            lon=mean_lon,
+            count=count,
+            distance=haversine(mean_lat, mean_lon, self.origin),
+        )
+
+    def add_heatmap(self, m: folium.Map, coordinates: ArrayLike) -> int:
+        """
+        ヒートマップレイヤー追加
+
+        ビン数が max_bins を超える場合はズームレベルを下げて集計し直す。
+
+        Args:
+            m: 地図
+            coordinates: 位置情報（緯度・経度）
+
+        Returns:
+            int: ビン数
+        """
+        zoom = self.zoom
+        bins = self.bin(coordinates, zoom)
+        while len(bins) > self.max_bins and zoom > 0:
+            zoom -= 1
+            bins = self.bin(coordinates, zoom)
+
+        weights = np.clip(self.norm(bins.distance), 0, 1)
+        data = np.stack([bins.lat, bins.lon, np.maximum(weights, 0.01)], axis=1)
+        gradient = {
+            round(float(stop), 2): self._to_hex(self.cmap(stop))
+            for stop in np.linspace(0, 1, 6)
+        }
+        HeatMap(data.tolist(), radius=8, blur=6, gradient=gradient).add_to(m)
+        return len(bins)
+
+    def add_raster(self, m: folium.Map, coordinates: ArrayLike) -> int:
+        """
+        画像レイヤー追加
+
+        ビンを画素として原点からの距離で色付けした画像を重ねる。
+        画像が max_size を超える場合はズームレベルを下げて集計し直す。
+
+        Args:
+            m: 地図
+            coordinates: 位置情報（緯度・経度）
+
+        Returns:
+            int: ビン数
+        """
+        zoom = self.zoom
+        while True:
+            bins = self.bin(coordinates, zoom)
+            if not len(bins):
+                return 0
+            width = int(bins.ix.max() - bins.ix.min()) + 1
+            height = int(bins.iy.max() - bins.iy.min()) + 1
+            if max(width, height) <= self.max_size or zoom == 0:
+                break
+            zoom -= 1
+
+        image = np.zeros((height, width, 4), dtype=np.float64)
+        rgba = np.asarray(self.cmap(self.norm(bins.distance)), dtype=np.float64)
+        image[bins.iy - bins.iy.min(), bins.ix - bins.ix.min()] = rgba
+
+        # 画像の四隅（Webメルカトル座標のまま重ねるため mercator_project は不要）
+        x0, y0 = bins.ix.min() * self.cell, bins.iy.min() * self.cell
+        x1, y1 = x0 + width * self.cell, y0 + height * self.cell
+        north, west = to_latlon(np.float64(x0), np.float64(y0), zoom)
+        south, east = to_latlon(np.float64(x1), np.float64(y1), zoom)
+        ImageOverlay(
+            image,
+            bounds=[[float(south), float(west)], [float(north), float(east)]],
+            opacity=0.8,
+        ).add_to(m)
+        return len(bins)
+
+    @staticmethod
+    def _to_hex(color: tuple) -> str:
+        """
+        RGBA → カラーコード
+
+        Args:
+            color: RGBA（0〜1）
+
+        Returns:
+            str: #rrggbb
+        """
+        return "#{:02x}{:02x}{:02x}".format(
+            int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
+        )
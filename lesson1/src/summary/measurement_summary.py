@@ -0,0 +1,179 @@
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+EARTH_RADIUS = 6371  # 地球の半径（km）
+STORE_VERSION = 1
+
+
+@dataclass(slots=True)
+class MeasurementSummary:
+    """
+    計測サマリー
+
+    Attributes:
+        meas_uuid (str): 計測UUID
+        edge_uuid (str): エッジUUID
+        resolution (str): 位置情報の取得方法（取得方法が変わった場合は再計算）
+        points (int): 位置情報数
+        bbox (Optional[List[float]]): [最小緯度, 最小経度, 最大緯度, 最大経度]
+        path_length (float): 走行距離（km）
+        first_fix (Optional[List[float]]): 最初の位置情報（緯度, 経度）
+        last_fix (Optional[List[float]]): 最後の位置情報（緯度, 経度）
+    """
+
+    meas_uuid: str
+    edge_uuid: str
+    resolution: str
+    points: int = 0
+    bbox: Optional[List[float]] = None
+    path_length: float = 0.0
+    first_fix: Optional[List[float]] = None
+    last_fix: Optional[List[float]] = None
+
+
+def path_length(lat: np.ndarray, lon: np.ndarray) -> float:
+    """
+    経路長（隣接点間の距離の合計）
+
+    Args:
+        lat: 緯度の配列
+        lon: 経度の配列
+
+    Returns:
+        float: 経路長（km）
+    """
+    if len(lat) < 2:
+        return 0.0
+    lat, lon = np.radians(lat), np.radians(lon)
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    )
+    return float(np.sum(EARTH_RADIUS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))))
+
+
+def summarize(
+    meas_uuid: str, edge_uuid: str, resolution: str, coordinates: list
+) -> MeasurementSummary:
+    """
+    計測サマリー計算
+
+    Args:
+        meas_uuid: 計測UUID
+        edge_uuid: エッジUUID
+        resolution: 位置情報の取得方法
+        coordinates: 位置情報（緯度・経度）のリスト（時刻順）
+
+    Returns:
+        MeasurementSummary: 計測サマリー
+    """
+    summary = MeasurementSummary(meas_uuid, edge_uuid, resolution)
+    if not coordinates:
+        return summary
+
+    coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    lat, lon = coords[:, 0], coords[:, 1]
+    summary.points = len(coords)
+    summary.bbox = [
+        float(lat.min()),
+        float(lon.min()),
+        float(lat.max()),
+        float(lon.max()),
+    ]
+    summary.path_length = path_length(lat, lon)
+    summary.first_fix = coords[0].tolist()
+    summary.last_fix = coords[-1].tolist()
+    return summary
+
+
+class SummaryStore:
+    """
+    計測サマリー保存先
+
+    完了した計測のサマリーをJSONファイルに保存し、次回以降は再計算せずに使う
+    - 計測中の計測は保存しない（完了後に改めて計算する）
+    - 取得方法（resolution）が異なるサマリーは使わない
+
+    Attributes:
+        path (Path): 保存先ファイルパス
+        summaries (Dict[str, MeasurementSummary]): 計測UUIDごとのサマリー
+        _dirty (bool): 未保存の変更あり
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.summaries: Dict[str, MeasurementSummary] = {}
+        self._dirty = False
+
+    def load(self) -> "SummaryStore":
+        """
+        読み込み
+
+        Returns:
+            SummaryStore: 自身
+        """
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STORE_VERSION:
+                self.summaries = {
+                    s["meas_uuid"]: MeasurementSummary(**s)
+                    for s in data["measurements"]
+                }
+            else:
+                logging.warning(f"Ignored summary store version: {data.get('version')}")
+        logging.info(f"Loaded measurement summaries: {len(self.summaries)}")
+        return self
+
+    def get(self, meas_uuid: str, resolution: str) -> Optional[MeasurementSummary]:
+        """
+        サマリー取得
+
+        Args:
+            meas_uuid: 計測UUID
+            resolution: 位置情報の取得方法
+
+        Returns:
+            Optional[MeasurementSummary]: サマリー（未計算、取得方法が異なる場合はNone）
+        """
+        summary = self.summaries.get(meas_uuid)
+        if summary is None or summary.resolution != resolution:
+            return None
+        return summary
+
+    def put(self, summary: MeasurementSummary) -> None:
+        """
+        サマリー登録
+
+        Args:
+            summary: 完了した計測のサマリー
+        """
+        self.summaries[summary.meas_uuid] = summary
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        保存
+
+        一時ファイルに書き出してから置き換える（書き込み途中の中断対策）
+        """
+        if not self._dirty:
+            return
+        data = {
+            "version": STORE_VERSION,
+            "measurements": [asdict(s) for s in self.summaries.values()],
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        logging.info(f"Saved measurement summaries: {self.path}")
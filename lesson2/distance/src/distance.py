@@ -4,13 +4,11 @@ import sys
 import traceback
 
 from calculator.distance_calculator import DistanceCalculator
+from client.client_factory import ClientFactory
 from reader.measurement_reader import MeasurementReader
 from service.distance_service import DistanceService
 from writer.measurement_writer import MeasurementWriter
 
-from intdash import ApiClient
-from intdash.configuration import Configuration
-
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -23,23 +21,6 @@ FETCH_SIZE = 100
 ORIGIN = (35.628222, 139.738694)  # 品川駅
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
 def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> None:
     """
     メイン
@@ -53,11 +34,11 @@ def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> Non
     logging.info(f"Processing project_uuid: {project_uuid}, meas_uuid: {meas_uuid}")
 
     try:
-        client = get_client(api_url, api_token)
+        factory = ClientFactory(api_url, api_token)
         service = DistanceService(
-            MeasurementReader(client, project_uuid, meas_uuid),
+            MeasurementReader(factory, project_uuid, meas_uuid),
             DistanceCalculator(ORIGIN),
-            MeasurementWriter(client, project_uuid),
+            MeasurementWriter(factory, project_uuid),
             FETCH_SIZE,
         )
         service.process()
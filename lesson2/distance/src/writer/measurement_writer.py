@@ -4,6 +4,8 @@ import struct
 import uuid
 from typing import Optional
 
+from client.client_factory import ClientFactory
+
 from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataChunk,
     StoreDataChunks,
@@ -11,10 +13,11 @@ from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataPoint,
     StoreDataPointGroup,
 )
-from intdash import ApiClient
-from intdash.api import (
-    measurement_service_measurement_sequences_api,
-    measurement_service_measurements_api,
+from intdash.api.measurement_service_measurement_sequences_api import (
+    MeasurementServiceMeasurementSequencesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.create_measurement_chunks_result import CreateMeasurementChunksResult
 from intdash.model.meas_create import MeasCreate
@@ -31,14 +34,14 @@ class MeasurementWriter:
     計測作成
 
     Attributes:
-        client (ApiClient): APIクライアント
+        factory (ClientFactory): APIクライアント生成
         project_uuid (str): プロジェクトのUUID
         measurement (Measurement): 新規計測
         sequence_number (int): シーケンス番号
     """
 
-    def __init__(self, client: ApiClient, project_uuid: str) -> None:
-        self.client = client
+    def __init__(self, factory: ClientFactory, project_uuid: str) -> None:
+        self.factory = factory
         self.project_uuid = project_uuid
         self.measurement = None
         self.sequence_number = 1
@@ -58,9 +61,7 @@ class MeasurementWriter:
         meas_dict["protected"] = False
         meas_create = MeasCreate(**meas_dict)
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         measurement = api.create_project_measurement(
             self.project_uuid, meas_create=meas_create
         )
@@ -90,9 +91,7 @@ class MeasurementWriter:
             final_sequence_number=count,
         )
 
-        api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementSequencesApi)
         sequence = api.replace_project_measurement_sequence(
             project_uuid=self.project_uuid,
             measurement_uuid=self.measurement.uuid,
@@ -149,9 +148,7 @@ class MeasurementWriter:
             logging.warning("No chunks available to send.")
             return CreateMeasurementChunksResult()
 
-        api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementSequencesApi)
         results = api.create_project_measurement_sequence_chunks(
             project_uuid=self.project_uuid,
             body=io.BytesIO(chunk.SerializeToString()),
@@ -166,9 +163,7 @@ class MeasurementWriter:
         if not self.measurement:
             raise
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         api.complete_project_measurement(
             project_uuid=self.project_uuid, measurement_uuid=self.measurement.uuid
         )
@@ -0,0 +1,148 @@
+import argparse
+import base64
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from decoder.measurement_decoder import decode_entry, orjson
+
+from intdash.model.measurement_base_time_type import MeasurementBaseTimeType
+
+# ログ設定
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+
+def legacy_decoder(dct: dict) -> dict:
+    """
+    従来の計測デコーダー（比較用）
+
+    object_hook としてすべてのJSONオブジェクト・文字列値に変換を試みる
+
+    Args:
+        dct: デコード対象のJSONオブジェクト
+
+    Returns:
+        dict: 変換されたJSONオブジェクト
+    """
+    for key, value in dct.items():
+        if isinstance(value, str):
+            try:
+                if key == "basetime_type":
+                    dct[key] = MeasurementBaseTimeType(value)
+                elif value.endswith("Z"):
+                    dt = datetime.fromisoformat(value[:-1])
+                    dt = dt.replace(tzinfo=timezone.utc)
+                    dct[key] = dt
+                elif "." in value:
+                    dt = datetime.fromisoformat(value)
+                    dct[key] = dt
+
+                if "." in value and isinstance(dct[key], datetime):
+                    nano_part = value.split(".")[1][:9]
+                    microseconds = int(nano_part[:6])
+                    dt = dct[key].replace(microsecond=microseconds)
+                    dct[key] = dt
+
+            except ValueError:
+                pass
+    return dct
+
+
+def make_lines(datapoints: int, payload_size: int) -> List[bytes]:
+    """
+    JSON Lines生成
+
+    Args:
+        datapoints: データポイント数
+        payload_size: ペイロードサイズ（バイト）
+
+    Returns:
+        List[bytes]: JSON Lines（計測・基準時刻・データポイント）
+    """
+    measurement = {
+        "uuid": "00000000-0000-0000-0000-000000000000",
+        "name": "bench",
+        "basetime": "2024-01-01T00:00:00.123456789Z",
+        "basetime_type": "edge_rtc",
+        "created_at": "2024-01-01T00:00:00.123456789Z",
+        "updated_at": "2024-01-01T00:00:00.123456789Z",
+        "markers": [],
+    }
+    basetime = {
+        "type": "edge_rtc",
+        "basetime": "2024-01-01T00:00:00.123456789Z",
+        "created_at": "2024-01-01T00:00:00.123456789Z",
+    }
+    payload = base64.b64encode(bytes(payload_size)).decode("utf-8")
+
+    lines = [
+        json.dumps({"measurement": measurement}).encode("utf-8"),
+        json.dumps({"basetime": basetime}).encode("utf-8"),
+    ]
+    for i in range(datapoints):
+        datapoint = {
+            "time": i * 10_000_000,
+            "data_type": "float",
+            "data_name": "v1/1/sensor.value",
+            "data": {"d": payload},
+        }
+        lines.append(json.dumps({"datapoint": datapoint}).encode("utf-8"))
+    return lines
+
+
+def measure(name: str, decode: Callable[[bytes], dict], lines: List[bytes]) -> float:
+    """
+    デコード時間計測
+
+    Args:
+        name: 計測名
+        decode: 1行デコード関数
+        lines: JSON Lines
+
+    Returns:
+        float: 経過時間（秒）
+    """
+    start = time.perf_counter()
+    for line in lines:
+        decode(line)
+    elapsed = time.perf_counter() - start
+    logging.info(f"{name}: {elapsed:.3f}s ({len(lines) / elapsed:,.0f} lines/s)")
+    return elapsed
+
+
+def main(datapoints: int, payload_size: int) -> None:
+    """
+    メイン処理
+
+    Args:
+        datapoints: データポイント数
+        payload_size: ペイロードサイズ（バイト）
+    """
+    lines = make_lines(datapoints, payload_size)
+    logging.info(
+        f"Lines: {len(lines)} payload_size: {payload_size} orjson: {orjson is not None}"
+    )
+
+    legacy = measure(
+        "legacy object_hook",
+        lambda line: json.loads(line, object_hook=legacy_decoder),
+        lines,
+    )
+    current = measure("decode_entry", decode_entry, lines)
+    logging.info(f"Speedup: {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark measurement decoder")
+    parser.add_argument("--datapoints", default=200_000, type=int)
+    parser.add_argument("--payload_size", default=16, type=int)
+    args = parser.parse_args()
+
+    main(args.datapoints, args.payload_size)
@@ -0,0 +1,66 @@
+"""
+バイナリ計測ファイル形式定義
+
+ファイル構成:
+    ヘッダー（非圧縮）
+        MAGIC (4byte) | VERSION (uint16) | COMPRESSION (uint8)
+    本体（COMPRESSIONに従い圧縮）
+        レコード（TYPE (uint8) | LENGTH (uint32) | BODY）の繰り返し
+        - RECORD_META: 計測・基準時刻・トレーラー（JSON 1行分）
+        - RECORD_BLOCK: データIDごとの列指向ブロック
+        - RECORD_END: 終端
+
+列指向ブロック構成:
+    len(data_type) (uint16) | len(data_name) (uint16) | data_type | data_name
+    件数 n (uint32)
+    時刻 (int64 x n) 先頭は絶対時刻（ナノ秒）、以降は直前との差分
+    ペイロード長 (uint32 x n)
+    ペイロード（連結）
+
+数値はすべてリトルエンディアン
+"""
+
+import struct
+
+try:
+    import zstandard
+except ImportError:  # 任意依存
+    zstandard = None
+
+MAGIC = b"IDMB"
+VERSION = 1
+FILE_SUFFIX = ".idmb"
+
+# ヘッダー
+HEADER = struct.Struct("<4sHB")
+
+# 圧縮方式
+COMPRESSION_NONE = 0
+COMPRESSION_GZIP = 1
+COMPRESSION_ZSTD = 2
+COMPRESSIONS = {
+    "none": COMPRESSION_NONE,
+    "gzip": COMPRESSION_GZIP,
+    "zstd": COMPRESSION_ZSTD,
+}
+
+# レコード
+RECORD_HEADER = struct.Struct("<BI")
+RECORD_META = 1
+RECORD_BLOCK = 2
+RECORD_END = 3
+
+# 列指向ブロック
+BLOCK_ID_HEADER = struct.Struct("<HH")
+BLOCK_COUNT = struct.Struct("<I")
+
+
+def require_zstandard() -> None:
+    """
+    zstandard利用可否確認
+
+    Raises:
+        RuntimeError: zstandard未インストール時
+    """
+    if zstandard is None:
+        raise RuntimeError("zstd compression requires 'pip install zstandard'")
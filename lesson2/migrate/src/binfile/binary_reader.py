@@ -0,0 +1,178 @@
+import gzip
+import json
+import struct
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Generator, Optional
+
+from binfile.binary_format import (
+    BLOCK_COUNT,
+    BLOCK_ID_HEADER,
+    COMPRESSION_GZIP,
+    COMPRESSION_NONE,
+    COMPRESSION_ZSTD,
+    HEADER,
+    MAGIC,
+    RECORD_BLOCK,
+    RECORD_END,
+    RECORD_HEADER,
+    RECORD_META,
+    VERSION,
+    require_zstandard,
+    zstandard,
+)
+
+
+class BinaryReader:
+    """
+    バイナリ計測ファイル読み込み
+
+    JSON Lines形式の読み込みと同じ形のエントリを逐次返す
+    - {"measurement": <計測>}
+    - {"basetime": <基準時刻>}
+    - {"datapoint": {"time", "data_type", "data_name", "payload"}}
+      payloadはデコード済みのbytes
+
+    Attributes:
+        path (Path): 入力ファイルパス
+        object_hook (Optional[Callable]): メタレコード用JSONデコードフック
+    """
+
+    @staticmethod
+    def is_binary(path: Path) -> bool:
+        """
+        バイナリ計測ファイル判定
+
+        Args:
+            path (Path): ファイルパス
+
+        Returns:
+            bool: 先頭がMAGICならTrue
+        """
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def __init__(
+        self,
+        path: Path,
+        object_hook: Optional[Callable[[dict], Any]] = None,
+    ) -> None:
+        self.path = path
+        self.object_hook = object_hook
+
+    def read(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        エントリ読み込み
+
+        Yields:
+            dict: エントリ
+
+        Raises:
+            ValueError: 形式・バージョン不正、または途中で途切れたファイル
+        """
+        with open(self.path, "rb") as f:
+            magic, version, compression = HEADER.unpack(
+                BinaryReader._read_exact(f, HEADER.size)
+            )
+            if magic != MAGIC:
+                raise ValueError(f"Not a binary measurement file: {self.path}")
+            if version > VERSION:
+                raise ValueError(f"Unsupported format version: {version}")
+
+            stream = self._open_stream(f, compression)
+            while True:
+                header = stream.read(RECORD_HEADER.size)
+                if not header:
+                    raise ValueError("Unexpected end of file (missing end record)")
+                record_type, length = RECORD_HEADER.unpack(
+                    header
+                    + BinaryReader._read_exact(stream, RECORD_HEADER.size - len(header))
+                )
+                body = BinaryReader._read_exact(stream, length)
+
+                if record_type == RECORD_END:
+                    break
+                elif record_type == RECORD_META:
+                    yield json.loads(body.decode("utf-8"), object_hook=self.object_hook)
+                elif record_type == RECORD_BLOCK:
+                    yield from BinaryReader._parse_block(body)
+
+    def _open_stream(self, f: BinaryIO, compression: int) -> BinaryIO:
+        """
+        本体ストリームオープン
+
+        Args:
+            f (BinaryIO): ヘッダー読み込み済みファイル
+            compression (int): 圧縮方式
+
+        Returns:
+            BinaryIO: 本体ストリーム
+        """
+        if compression == COMPRESSION_NONE:
+            return f
+        if compression == COMPRESSION_GZIP:
+            return gzip.GzipFile(fileobj=f, mode="rb")
+        if compression == COMPRESSION_ZSTD:
+            require_zstandard()
+            return zstandard.ZstdDecompressor().stream_reader(f)
+        raise ValueError(f"Unknown compression: {compression}")
+
+    @staticmethod
+    def _parse_block(body: bytes) -> Generator[Dict[str, Any], None, None]:
+        """
+        列指向ブロック展開
+
+        Args:
+            body (bytes): ブロック本体
+
+        Yields:
+            dict: {"datapoint": ...}
+        """
+        mv = memoryview(body)
+        type_len, name_len = BLOCK_ID_HEADER.unpack_from(mv, 0)
+        offset = BLOCK_ID_HEADER.size
+        data_type = bytes(mv[offset : offset + type_len]).decode("utf-8")
+        offset += type_len
+        data_name = bytes(mv[offset : offset + name_len]).decode("utf-8")
+        offset += name_len
+
+        (n,) = BLOCK_COUNT.unpack_from(mv, offset)
+        offset += BLOCK_COUNT.size
+        times = accumulate(struct.unpack_from(f"<{n}q", mv, offset))
+        offset += 8 * n
+        lengths = struct.unpack_from(f"<{n}I", mv, offset)
+        offset += 4 * n
+
+        for time, length in zip(times, lengths):
+            yield {
+                "datapoint": {
+                    "time": time,
+                    "data_type": data_type,
+                    "data_name": data_name,
+                    "payload": bytes(mv[offset : offset + length]),
+                }
+            }
+            offset += length
+
+    @staticmethod
+    def _read_exact(stream: BinaryIO, size: int) -> bytes:
+        """
+        指定バイト数読み込み
+
+        Args:
+            stream (BinaryIO): 入力ストリーム
+            size (int): バイト数
+
+        Returns:
+            bytes: 読み込んだバイト列
+
+        Raises:
+            ValueError: 途中で途切れた場合
+        """
+        data = stream.read(size)
+        while len(data) < size:
+            more = stream.read(size - len(data))
+            if not more:
+                raise ValueError("Unexpected end of file")
+            data += more
+        return data
@@ -0,0 +1,181 @@
+import gzip
+import json
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Type
+
+from binfile.binary_format import (
+    BLOCK_COUNT,
+    BLOCK_ID_HEADER,
+    COMPRESSION_GZIP,
+    COMPRESSION_ZSTD,
+    COMPRESSIONS,
+    HEADER,
+    MAGIC,
+    RECORD_BLOCK,
+    RECORD_END,
+    RECORD_HEADER,
+    RECORD_META,
+    VERSION,
+    require_zstandard,
+    zstandard,
+)
+
+
+class BinaryWriter:
+    """
+    バイナリ計測ファイル出力
+
+    データポイントをデータIDごとにバッファし、block_size件ごとに列指向ブロックとして書き出す
+
+    Attributes:
+        path (Path): 出力先パス
+        compression (int): 圧縮方式
+        block_size (int): ブロックあたりの最大データポイント数
+        json_encoder (Optional[Type[json.JSONEncoder]]): メタレコード用JSONエンコーダー
+        count (int): 書き出したデータポイント数
+        _file (Optional[BinaryIO]): ファイルハンドル
+        _stream (Optional[BinaryIO]): 本体出力ストリーム（圧縮時は圧縮ストリーム）
+        _blocks (dict): データIDごとの未出力データポイント
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: str = "none",
+        block_size: int = 4096,
+        json_encoder: Optional[Type[json.JSONEncoder]] = None,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.path = path
+        self.compression = COMPRESSIONS[compression]
+        self.block_size = block_size
+        self.json_encoder = json_encoder
+        self.count = 0
+        self._file: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._blocks: Dict[Tuple[str, str], Tuple[List[int], List[bytes]]] = {}
+
+    def open(self) -> None:
+        """
+        オープン
+
+        ヘッダーを書き出し、圧縮方式に応じた本体ストリームを開く
+        """
+        if self.compression == COMPRESSION_ZSTD:
+            require_zstandard()
+
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.compression))
+
+        if self.compression == COMPRESSION_GZIP:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb", compresslevel=6)
+        elif self.compression == COMPRESSION_ZSTD:
+            self._stream = zstandard.ZstdCompressor().stream_writer(
+                self._file, closefd=False
+            )
+        else:
+            self._stream = self._file
+
+    def close(self) -> None:
+        """
+        クローズ
+
+        未出力ブロックと終端レコードを書き出して閉じる
+        """
+        if self._file is None:
+            return
+        try:
+            for data_id in list(self._blocks):
+                self._flush_block(data_id)
+            self._write_record(RECORD_END, b"")
+            if self._stream is not self._file:
+                self._stream.close()
+        finally:
+            self._file.close()
+            self._file = None
+            self._stream = None
+
+    def write_meta(self, entry: Dict[str, Any]) -> None:
+        """
+        メタレコード書き出し
+
+        Args:
+            entry (dict): {"measurement": ...} または {"basetime": ...}
+        """
+        body = json.dumps(entry, cls=self.json_encoder, ensure_ascii=False)
+        self._write_record(RECORD_META, body.encode("utf-8"))
+
+    def write_datapoint(
+        self, time: int, data_type: str, data_name: str, payload: bytes
+    ) -> None:
+        """
+        データポイント書き出し
+
+        Args:
+            time (int): 絶対時刻（ナノ秒精度POSIX）
+            data_type (str): データ型名
+            data_name (str): データ名
+            payload (bytes): ペイロード
+        """
+        data_id = (data_type, data_name)
+        block = self._blocks.get(data_id)
+        if block is None:
+            block = ([], [])
+            self._blocks[data_id] = block
+        block[0].append(time)
+        block[1].append(payload)
+        self.count += 1
+
+        if len(block[0]) >= self.block_size:
+            self._flush_block(data_id)
+
+    def _flush_block(self, data_id: Tuple[str, str]) -> None:
+        """
+        列指向ブロック書き出し
+
+        Args:
+            data_id (tuple): (データ型名, データ名)
+        """
+        times, payloads = self._blocks.pop(data_id)
+        if not times:
+            return
+
+        n = len(times)
+        deltas = [times[0]] + [times[i] - times[i - 1] for i in range(1, n)]
+        data_type = data_id[0].encode("utf-8")
+        data_name = data_id[1].encode("utf-8")
+
+        body = b"".join(
+            [
+                BLOCK_ID_HEADER.pack(len(data_type), len(data_name)),
+                data_type,
+                data_name,
+                BLOCK_COUNT.pack(n),
+                struct.pack(f"<{n}q", *deltas),
+                struct.pack(f"<{n}I", *map(len, payloads)),
+                *payloads,
+            ]
+        )
+        self._write_record(RECORD_BLOCK, body)
+
+    def _write_record(self, record_type: int, body: bytes) -> None:
+        """
+        レコード書き出し
+
+        Args:
+            record_type (int): レコード種別
+            body (bytes): レコード本体
+        """
+        if self._stream is None:
+            raise RuntimeError("Writer is not opened.")
+        self._stream.write(RECORD_HEADER.pack(record_type, len(body)))
+        self._stream.write(body)
+
+    def __enter__(self) -> "BinaryWriter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
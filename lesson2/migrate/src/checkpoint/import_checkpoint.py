@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(slots=True)
+class CheckpointState:
+    """
+    チェックポイント内容
+
+    Attributes:
+        src_file (str): 計測ファイルパス
+        measurement_uuid (str): 作成済み計測UUID
+        sequence_uuid (str): シーケンスUUID
+        basetime (str): 計測の基準時刻（ISO 8601）
+        last_sequence (int): 受理済みの連続した最終シーケンス番号
+        offset (Optional[int]): last_sequence までのデータポイントを読み終えたファイル位置
+            （JSON Linesのみ。バイナリ形式はNone）
+        datapoints (int): 受理済みデータポイント数
+        completed (bool): 計測完了済み
+    """
+
+    src_file: str
+    measurement_uuid: str
+    sequence_uuid: str
+    basetime: str
+    last_sequence: int = 0
+    offset: Optional[int] = None
+    datapoints: int = 0
+    completed: bool = False
+
+
+class ImportCheckpoint:
+    """
+    インポートチェックポイント
+
+    並列送信されたバッチの受理を追跡し、先頭から連続して受理されたところまでを
+    ファイルに記録する。再開時はこの位置から送信を続ける。
+
+    Attributes:
+        path (Path): チェックポイントファイルパス
+        state (Optional[CheckpointState]): チェックポイント内容
+        _pending (dict): 先頭シーケンス番号ごとの（末尾シーケンス番号, ファイル位置, 件数）
+        _acked (set): 受理済み・未反映のバッチ先頭シーケンス番号
+        _lock (threading.Lock): 送信スレッドとの排他
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.state: Optional[CheckpointState] = None
+        self._pending: Dict[int, Tuple[int, Optional[int], int]] = {}
+        self._acked: set = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """
+        読み込み
+
+        Returns:
+            bool: チェックポイントが存在すればTrue
+        """
+        if not self.path.exists():
+            return False
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.state = CheckpointState(**json.load(f))
+        return True
+
+    def start(
+        self,
+        src_file: str,
+        measurement_uuid: str,
+        sequence_uuid: str,
+        basetime: datetime,
+    ) -> None:
+        """
+        記録開始
+
+        Args:
+            src_file (str): 計測ファイルパス
+            measurement_uuid (str): 作成済み計測UUID
+            sequence_uuid (str): シーケンスUUID
+            basetime (datetime): 計測の基準時刻
+        """
+        self.state = CheckpointState(
+            src_file=src_file,
+            measurement_uuid=measurement_uuid,
+            sequence_uuid=sequence_uuid,
+            basetime=basetime.isoformat(),
+        )
+        self._save()
+
+    @property
+    def basetime(self) -> datetime:
+        """
+        計測の基準時刻
+
+        Returns:
+            datetime: 基準時刻
+        """
+        if self.state is None:
+            raise RuntimeError("Checkpoint is not started.")
+        return datetime.fromisoformat(self.state.basetime)
+
+    def register(
+        self, first_sequence: int, last_sequence: int, offset: Optional[int]
+    ) -> None:
+        """
+        送信バッチ登録
+
+        Args:
+            first_sequence (int): 先頭シーケンス番号
+            last_sequence (int): 末尾シーケンス番号
+            offset (Optional[int]): バッチ末尾まで読み終えたファイル位置
+        """
+        with self._lock:
+            self._pending[first_sequence] = (
+                last_sequence,
+                offset,
+                last_sequence - first_sequence + 1,
+            )
+
+    def ack(self, first_sequence: int) -> None:
+        """
+        バッチ受理
+
+        先頭から連続して受理されたバッチまで記録を進めて保存する
+
+        Args:
+            first_sequence (int): 受理されたバッチの先頭シーケンス番号
+        """
+        with self._lock:
+            if self.state is None:
+                return
+            self._acked.add(first_sequence)
+            advanced = False
+            while self.state.last_sequence + 1 in self._acked:
+                head = self.state.last_sequence + 1
+                self._acked.remove(head)
+                last_sequence, offset, count = self._pending.pop(head)
+                self.state.last_sequence = last_sequence
+                self.state.offset = offset
+                self.state.datapoints += count
+                advanced = True
+            if advanced:
+                self._save()
+
+    def complete(self) -> None:
+        """
+        計測完了記録
+        """
+        with self._lock:
+            if self.state is None:
+                return
+            self.state.completed = True
+            self._save()
+
+    def _save(self) -> None:
+        """
+        保存
+
+        一時ファイルに書き出してから置き換える（書き込み途中の中断対策）
+        """
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self.state), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        logging.debug(f"Saved checkpoint: {self.state}")
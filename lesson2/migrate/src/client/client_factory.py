@@ -0,0 +1,141 @@
+import socket
+import threading
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from intdash import ApiClient, Configuration
+
+T = TypeVar("T")
+
+# 再試行するステータスコード（レート制限・ゲートウェイエラー）
+RETRY_STATUSES = (429, 502, 503, 504)
+# 再試行するメソッド（冪等なもののみ。POSTは二重登録になり得るため除外）
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+KEEPALIVE_IDLE = 30  # キープアライブ開始までの無通信時間（秒）
+KEEPALIVE_INTERVAL = 10  # キープアライブの送信間隔（秒）
+
+
+def keepalive_socket_options() -> list:
+    """
+    キープアライブ有効化ソケットオプション
+
+    urllib3の既定（TCP_NODELAY）にSO_KEEPALIVEを追加する
+    アイドル時間・送信間隔はOSが対応している場合のみ指定する
+
+    Returns:
+        list: ソケットオプション
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL))
+    return options
+
+
+class ClientFactory:
+    """
+    APIクライアント生成
+
+    接続プールを共有するAPIクライアントと、APIサービスオブジェクトを1つずつ生成して使い回す
+    - 接続プールサイズ（既定の4では並列リクエストが接続待ちになる）
+    - キープアライブ（接続の再利用中に切断されないようにする）
+    - 再試行（冪等なメソッドのみ、指数バックオフ・Retry-Afterヘッダーに従う）
+    生成はロックで保護するため、複数スレッドから同時に呼び出せる
+
+    Attributes:
+        api_url (str): APIのURL
+        api_token (str): APIトークン
+        pool_maxsize (int): 接続プールサイズ
+        retries (int): 最大再試行回数
+        backoff_factor (float): 再試行間隔の係数（秒）
+        keepalive (bool): キープアライブ有効化
+        _client (Optional[ApiClient]): APIクライアント
+        _apis (Dict[type, Any]): APIサービスオブジェクト
+        _lock (threading.Lock): 生成の排他制御
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_token: str,
+        pool_maxsize: int = 4,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        keepalive: bool = True,
+    ) -> None:
+        self.api_url = api_url
+        self.api_token = api_token
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.keepalive = keepalive
+        self._client: Optional[ApiClient] = None
+        self._apis: Dict[type, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_configuration(self) -> Configuration:
+        """
+        REST API設定
+
+        Returns:
+            Configuration: REST API設定
+        """
+        configuration = Configuration(
+            host=f"{self.api_url}/api", api_key={"IntdashToken": self.api_token}
+        )
+        configuration.connection_pool_maxsize = self.pool_maxsize
+        configuration.retries = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        if self.keepalive:
+            configuration.socket_options = keepalive_socket_options()
+        return configuration
+
+    @property
+    def client(self) -> ApiClient:
+        """
+        APIクライアント
+
+        Returns:
+            ApiClient: APIクライアント（初回呼び出し時に生成）
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = ApiClient(self.get_configuration())
+            return self._client
+
+    def api(self, api_class: Type[T]) -> T:
+        """
+        APIサービスオブジェクト取得
+
+        Args:
+            api_class: APIクラス（例: MeasurementServiceMeasurementsApi）
+
+        Returns:
+            APIサービスオブジェクト（APIクラスごとに1つ）
+        """
+        client = self.client
+        with self._lock:
+            api = self._apis.get(api_class)
+            if api is None:
+                api = api_class(client)
+                self._apis[api_class] = api
+            return api
+
+    def close(self) -> None:
+        """
+        APIクライアント終了
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = None
+            self._apis.clear()
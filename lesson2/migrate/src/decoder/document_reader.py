@@ -0,0 +1,197 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Generator, Optional, TextIO
+
+from decoder.measurement_decoder import decode_object
+
+# 逐次読み込みの対象とする配列キー
+STREAM_KEY = "datapoints"
+
+# 1回の読み込みサイズ（文字数）
+READ_SIZE = 1024 * 1024
+
+WHITESPACE = " \t\r\n"
+
+
+class DocumentReader:
+    """
+    単一JSONドキュメント形式の計測ファイル逐次読み込み
+
+    meas_export.py が出力する以下の形式のファイルを、全体を読み込まずに処理する
+        {
+          "measurement": <計測オブジェクト>,
+          "basetimes": [<基準時刻>, <基準時刻>, ..],
+          "datapoints": [<データポイント>, <データポイント>, ..]
+        }
+    - read_header() で datapoints より前の項目（計測・基準時刻）を読み込む
+    - datapoints() でデータポイントを1件ずつ返す
+    メモリ使用量はデータポイント数によらず、読み込みバッファと1件分の値に収まる。
+
+    Attributes:
+        path (Path): 計測ファイルパス
+        read_size (int): 1回の読み込みサイズ（文字数）
+        _file (Optional[TextIO]): 計測ファイル
+        _buf (str): 読み込みバッファ
+        _pos (int): バッファ内の解析位置
+        _eof (bool): ファイル末尾まで読み込み済み
+        _decoder (json.JSONDecoder): 値デコーダー
+    """
+
+    def __init__(self, path: Path, read_size: int = READ_SIZE) -> None:
+        self.path = path
+        self.read_size = read_size
+        self._file: Optional[TextIO] = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def __enter__(self) -> "DocumentReader":
+        self._file = open(self.path, "r", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read_header(self) -> Dict[str, Any]:
+        """
+        ヘッダー読み込み
+
+        datapoints 配列の開始位置まで読み進め、それより前の項目を返す。
+        measurement, basetimes は decode_object で日時等を変換する。
+
+        Returns:
+            dict: datapoints 以外の項目
+
+        Raises:
+            ValueError: JSON不正、または datapoints が見つからない場合
+        """
+        header: Dict[str, Any] = {}
+        self._expect("{")
+        while True:
+            if self._peek() == "}":
+                raise ValueError(f'"{STREAM_KEY}" not found in {self.path}')
+
+            key = self._decode_value()
+            self._expect(":")
+            if key == STREAM_KEY:
+                self._expect("[")
+                return header
+
+            header[key] = decode_object(self._decode_value())
+            if self._peek() == ",":
+                self._pos += 1
+
+    def datapoints(self) -> Generator[dict, None, None]:
+        """
+        データポイント読み込み
+
+        read_header() の後に呼び出す。datapoints 以降の項目は読み飛ばす。
+
+        Yields:
+            dict: データポイント
+
+        Raises:
+            ValueError: JSON不正
+        """
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode_value()
+            c = self._peek()
+            if c not in ",]":
+                raise ValueError(f"Expected ',' or ']' at {self._location()}")
+            self._pos += 1
+            if c == "]":
+                return
+
+    def _fill(self) -> bool:
+        """
+        バッファ補充
+
+        解析済みの部分を捨て、未解析部分の後ろに読み足す
+
+        Returns:
+            bool: 読み足せた場合True
+        """
+        if self._eof:
+            return False
+        if self._file is None:
+            raise RuntimeError("DocumentReader is not opened.")
+
+        # 1つの値がバッファより大きい場合は読み込みサイズを倍にする
+        size = max(self.read_size, len(self._buf) - self._pos)
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """
+        空白を読み飛ばして次の文字を取得
+
+        Returns:
+            str: 次の文字
+
+        Raises:
+            ValueError: ファイル末尾に達した場合
+        """
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError(f"Unexpected end of file: {self.path}")
+
+    def _expect(self, char: str) -> None:
+        """
+        区切り文字読み込み
+
+        Args:
+            char (str): 期待する文字
+
+        Raises:
+            ValueError: 異なる文字だった場合
+        """
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at {self._location()}")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """
+        値読み込み
+
+        値がバッファ末尾で途切れている場合は読み足してやり直す
+
+        Returns:
+            Any: デコードした値
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # 末尾で終わる数値などは続きがある可能性がある
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _location(self) -> str:
+        """
+        エラー表示用の位置
+
+        Returns:
+            str: 位置の前後の文字列
+        """
+        return repr(self._buf[self._pos : self._pos + 32])
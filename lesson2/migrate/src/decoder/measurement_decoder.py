@@ -0,0 +1,98 @@
+import json
+from datetime import datetime
+from typing import Any, Union
+
+from intdash.model.measurement_base_time_type import MeasurementBaseTimeType
+
+try:
+    import orjson
+except ImportError:  # 任意依存
+    orjson = None
+
+
+def loads(line: Union[bytes, str]) -> Any:
+    """
+    JSONデコード
+
+    orjsonがインストールされていれば使用する
+
+    Args:
+        line (bytes | str): JSON文字列
+
+    Returns:
+        Any: デコード結果
+
+    Raises:
+        json.JSONDecodeError: JSON不正（orjson.JSONDecodeErrorもサブクラス）
+    """
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def is_datetime_key(key: str) -> bool:
+    """
+    日時項目判定
+
+    計測・基準時刻・マーカーの日時項目は basetime と *_at のみ
+
+    Args:
+        key (str): 項目名
+
+    Returns:
+        bool: 日時項目ならTrue
+    """
+    return key == "basetime" or key.endswith("_at")
+
+
+def decode_object(obj: Any) -> Any:
+    """
+    計測・基準時刻デコード
+
+    既知の項目のみ変換する（ネストしたマーカー等も対象）
+    - basetime_type: MeasurementBaseTimeType に変換
+    - basetime, *_at: datetimeに変換（ナノ秒はマイクロ秒に切り捨て、Zはタイムゾーン UTC）
+
+    Args:
+        obj (Any): json.loads済みのオブジェクト
+
+    Returns:
+        Any: 変換後オブジェクト
+    """
+    if isinstance(obj, list):
+        return [decode_object(v) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+
+    for key, value in obj.items():
+        if isinstance(value, (dict, list)):
+            obj[key] = decode_object(value)
+        elif not isinstance(value, str):
+            continue
+        elif key == "basetime_type":
+            obj[key] = MeasurementBaseTimeType(value)
+        elif is_datetime_key(key):
+            try:
+                obj[key] = datetime.fromisoformat(value)
+            except ValueError:
+                pass
+    return obj
+
+
+def decode_entry(line: Union[bytes, str]) -> dict:
+    """
+    JSON Lines 1行デコード
+
+    データポイントは変換せずそのまま返す（高速パス）。
+    計測・基準時刻のみ decode_object で変換する。
+
+    Args:
+        line (bytes | str): JSON Lines 1行
+
+    Returns:
+        dict: {"measurement": ...} / {"basetime": ...} / {"datapoint": ...}
+    """
+    entry = loads(line)
+    if "datapoint" in entry:
+        return entry
+    return decode_object(entry)
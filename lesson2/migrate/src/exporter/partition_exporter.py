@@ -0,0 +1,237 @@
+import base64
+import json
+import logging
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from integrity.datapoint_digest import DatapointDigest
+
+# データポイント取得関数（start, end）→ データポイント
+Fetcher = Callable[[Optional[str], Optional[str]], Iterable[dict]]
+
+
+@dataclass(slots=True)
+class Partition:
+    """
+    時間パーティション
+
+    Attributes:
+        index (int): パーティション番号
+        start (Optional[str]): 開始時刻（RFC3339、先頭パーティションはNone）
+        end (Optional[str]): 終了時刻（RFC3339、末尾パーティションはNone）
+        path (str): パートファイルパス
+        count (int): データポイント数
+        attempts (int): 取得試行回数
+    """
+
+    index: int
+    start: Optional[str]
+    end: Optional[str]
+    path: str
+    count: int = 0
+    attempts: int = 0
+
+
+class PartitionExporter:
+    """
+    時間パーティション並列エクスポート
+
+    計測を時間で分割し、パーティションごとのデータポイントを並列に取得してパートファイルに書き出す
+    - 先頭・末尾のパーティションは開始・終了を指定せず、計測範囲外のデータポイントも取りこぼさない
+    - 失敗したパーティションはパートファイルを書き直して再取得
+    - 全パーティション完了後、順番に結合する（またはマニフェストを出力する）
+    - パーティションごとのダイジェストを合算し、トレーラーとして出力する
+
+    Attributes:
+        fetch (Fetcher): データポイント取得関数
+        json_encoder (Optional[Type[json.JSONEncoder]]): JSONエンコーダー
+        max_workers (int): 並列取得数
+        max_retries (int): パーティションごとの最大再取得回数
+        retry_interval (float): 初回再取得間隔（秒）
+        digest (DatapointDigest): 全パーティションのダイジェスト（export() 後に確定）
+        _digests (Dict[int, DatapointDigest]): パーティションごとのダイジェスト
+    """
+
+    @staticmethod
+    def split(basetime: datetime, duration: timedelta, partitions: int) -> List[tuple]:
+        """
+        時間分割
+
+        Args:
+            basetime (datetime): 計測の基準時刻
+            duration (timedelta): 計測の長さ
+            partitions (int): 分割数
+
+        Returns:
+            list: (開始時刻, 終了時刻) のリスト
+        """
+        if partitions <= 1 or duration <= timedelta(0):
+            return [(None, None)]
+
+        step = duration / partitions
+        bounds = [(basetime + step * i).isoformat() for i in range(1, partitions)]
+        starts: List[Optional[str]] = [None, *bounds]
+        ends: List[Optional[str]] = [*bounds, None]
+        return list(zip(starts, ends))
+
+    def __init__(
+        self,
+        fetch: Fetcher,
+        json_encoder: Optional[Type[json.JSONEncoder]] = None,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_interval: float = 1.0,
+    ) -> None:
+        self.fetch = fetch
+        self.json_encoder = json_encoder
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.digest = DatapointDigest()
+        self._digests: Dict[int, DatapointDigest] = {}
+
+    def export(self, ranges: List[tuple], part_prefix: str) -> List[Partition]:
+        """
+        並列エクスポート
+
+        Args:
+            ranges (list): (開始時刻, 終了時刻) のリスト
+            part_prefix (str): パートファイルパスの接頭辞
+
+        Returns:
+            List[Partition]: パーティション（時刻順）
+
+        Raises:
+            Exception: 再取得上限を超えて失敗したパーティションがある場合
+        """
+        partitions = [
+            Partition(i, start, end, f"{part_prefix}.part{i:04d}.jsonl")
+            for i, (start, end) in enumerate(ranges)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="PartitionExporter"
+        ) as executor:
+            # 結果取得で例外を伝播
+            list(executor.map(self._export_partition, partitions))
+
+        for p in partitions:
+            self.digest.merge(self._digests.pop(p.index))
+        total = sum(p.count for p in partitions)
+        logging.info(f"Download datapoints: {total} partitions: {len(partitions)}")
+        return partitions
+
+    def concatenate(
+        self, header_path: str, partitions: List[Partition], dst_path: str
+    ) -> None:
+        """
+        パートファイル結合
+
+        ヘッダー（計測・基準時刻）の後ろにパートファイルを時刻順に連結し、
+        末尾にトレーラーを書き出してパートファイルを削除する
+
+        Args:
+            header_path (str): ヘッダーファイルパス
+            partitions (List[Partition]): パーティション
+            dst_path (str): 出力ファイルパス
+        """
+        with open(dst_path, "wb") as dst:
+            for path in [header_path, *(p.path for p in partitions)]:
+                with open(path, "rb") as src:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            dst.write(self._trailer_line())
+
+        for path in [header_path, *(p.path for p in partitions)]:
+            Path(path).unlink()
+
+    def write_manifest(
+        self, header_path: str, partitions: List[Partition], manifest_path: str
+    ) -> None:
+        """
+        マニフェスト出力
+
+        結合順にファイルを並べたマニフェストを出力する
+
+        Args:
+            header_path (str): ヘッダーファイルパス
+            partitions (List[Partition]): パーティション
+            manifest_path (str): マニフェストファイルパス
+        """
+        manifest = {
+            "header": header_path,
+            "partitions": [asdict(p) for p in partitions],
+            "count": sum(p.count for p in partitions),
+            "trailer": self.digest.to_dict(),
+        }
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    def _export_partition(self, partition: Partition) -> Partition:
+        """
+        パーティションエクスポート（ワーカースレッド）
+
+        Args:
+            partition (Partition): パーティション
+
+        Returns:
+            Partition: 件数・試行回数を更新したパーティション
+        """
+        while True:
+            partition.attempts += 1
+            try:
+                partition.count = self._write_part(partition)
+                logging.info(
+                    f"Saved partition: {partition.index} start: {partition.start} end: {partition.end} count: {partition.count}"
+                )
+                return partition
+            except Exception as e:
+                if partition.attempts > self.max_retries:
+                    logging.error(f"Gave up partition: {partition.index} error: {e}")
+                    raise
+                wait = self.retry_interval * 2 ** (partition.attempts - 1)
+                logging.warning(
+                    f"Retry partition: {partition.index} after {wait:.1f}s error: {e}"
+                )
+                time.sleep(wait)
+
+    def _write_part(self, partition: Partition) -> int:
+        """
+        パートファイル書き出し
+
+        Args:
+            partition (Partition): パーティション
+
+        Returns:
+            int: データポイント数
+        """
+        count = 0
+        digest = DatapointDigest()
+        with open(partition.path, "w", encoding="utf-8") as f:
+            for dp in self.fetch(partition.start, partition.end):
+                json.dump(
+                    {"datapoint": dp}, f, cls=self.json_encoder, ensure_ascii=False
+                )
+                f.write("\n")
+                digest.add(
+                    dp["time"],
+                    dp["data_type"],
+                    dp["data_name"],
+                    base64.b64decode(dp["data"]["d"]),
+                )
+                count += 1
+        self._digests[partition.index] = digest
+        return count
+
+    def _trailer_line(self) -> bytes:
+        """
+        トレーラー行
+
+        Returns:
+            bytes: {"trailer": <ダイジェスト>} のJSON Lines 1行
+        """
+        trailer: Dict[str, Any] = {"trailer": self.digest.to_dict()}
+        return (json.dumps(trailer, ensure_ascii=False) + "\n").encode("utf-8")
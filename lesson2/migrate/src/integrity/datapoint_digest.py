@@ -0,0 +1,153 @@
+import hashlib
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# ダイジェストのアルゴリズム名（トレーラーに記録）
+ALGORITHM = "blake2b-128-sum"
+
+DIGEST_SIZE = 16
+DIGEST_MASK = (1 << (DIGEST_SIZE * 8)) - 1
+
+TIME = struct.Struct("<q")
+
+
+@dataclass(slots=True)
+class DataIDDigest:
+    """
+    データIDごとの集計
+
+    Attributes:
+        count (int): データポイント数
+        digest (int): データポイントハッシュの総和（mod 2^128）
+    """
+
+    count: int = 0
+    digest: int = 0
+
+
+class DatapointDigest:
+    """
+    データポイントダイジェスト
+
+    データポイントごとに BLAKE2b（128bit）で (データID, 時刻, ペイロード) をハッシュし、
+    データIDごとに件数とハッシュの総和を集計する。
+    - 総和のため並び順に依存しない（JSON Lines・バイナリ形式・時間パーティションで同じ値）
+    - パーティションごとの集計は merge() で合算できる
+    - add() が返すハッシュは重複データポイントの判定に使える
+
+    Attributes:
+        data_ids (Dict[Tuple[str, str], DataIDDigest]): データIDごとの集計
+        _prefixes (dict): データIDごとのハッシュ初期状態（データIDを入力済み）
+    """
+
+    def __init__(self) -> None:
+        self.data_ids: Dict[Tuple[str, str], DataIDDigest] = {}
+        self._prefixes: Dict[Tuple[str, str], Any] = {}
+
+    @property
+    def count(self) -> int:
+        """
+        データポイント数
+
+        Returns:
+            int: 全データIDのデータポイント数
+        """
+        return sum(d.count for d in self.data_ids.values())
+
+    def add(self, time: int, data_type: str, data_name: str, payload: bytes) -> bytes:
+        """
+        データポイント追加
+
+        Args:
+            time (int): 時刻（ナノ秒）
+            data_type (str): データ型
+            data_name (str): データ名
+            payload (bytes): ペイロード（デコード済み）
+
+        Returns:
+            bytes: データポイントのハッシュ
+        """
+        data_id = (data_type, data_name)
+        prefix = self._prefixes.get(data_id)
+        if prefix is None:
+            prefix = hashlib.blake2b(
+                f"{data_type}\0{data_name}\0".encode("utf-8"), digest_size=DIGEST_SIZE
+            )
+            self._prefixes[data_id] = prefix
+            self.data_ids[data_id] = DataIDDigest()
+
+        h = prefix.copy()
+        h.update(TIME.pack(time))
+        h.update(payload)
+        point = h.digest()
+
+        summary = self.data_ids[data_id]
+        summary.count += 1
+        summary.digest = (
+            summary.digest + int.from_bytes(point, "little")
+        ) & DIGEST_MASK
+        return point
+
+    def merge(self, other: "DatapointDigest") -> None:
+        """
+        集計合算
+
+        Args:
+            other (DatapointDigest): 合算する集計
+        """
+        for data_id, src in other.data_ids.items():
+            dst = self.data_ids.setdefault(data_id, DataIDDigest())
+            dst.count += src.count
+            dst.digest = (dst.digest + src.digest) & DIGEST_MASK
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        トレーラー出力
+
+        Returns:
+            dict: トレーラー内容
+        """
+        return {
+            "algorithm": ALGORITHM,
+            "count": self.count,
+            "data_ids": [
+                {
+                    "data_type": data_type,
+                    "data_name": data_name,
+                    "count": d.count,
+                    "digest": f"{d.digest:032x}",
+                }
+                for (data_type, data_name), d in sorted(self.data_ids.items())
+            ],
+        }
+
+    def verify(self, trailer: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        トレーラー照合
+
+        Args:
+            trailer (Optional[dict]): エクスポート時のトレーラー
+
+        Returns:
+            List[str]: 不一致内容（一致した場合は空）
+        """
+        if trailer is None:
+            return ["trailer not found"]
+        if trailer.get("algorithm") != ALGORITHM:
+            return [f"unsupported algorithm: {trailer.get('algorithm')}"]
+
+        errors = []
+        expected = {
+            (d["data_type"], d["data_name"]): d for d in trailer.get("data_ids", [])
+        }
+        for data_id in sorted(set(expected) | set(self.data_ids)):
+            exp = expected.get(data_id)
+            act = self.data_ids.get(data_id, DataIDDigest())
+            if exp is None:
+                errors.append(f"{data_id}: unexpected data ID count {act.count}")
+            elif exp["count"] != act.count:
+                errors.append(f"{data_id}: count {act.count} != {exp['count']}")
+            elif int(exp["digest"], 16) != act.digest:
+                errors.append(f"{data_id}: digest mismatch")
+        return errors
@@ -1,18 +1,24 @@
 import argparse
 import json
 import logging
+import os
 import sys
 import traceback
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, Generator, Iterable, Optional
 
-import psutil
+from client.client_factory import ClientFactory
+from sampler.resource_sampler import ResourceSampler
 
-from intdash import ApiClient, Configuration
-from intdash.api import (
-    measurement_service_data_points_api,
-    measurement_service_measurement_base_times_api,
-    measurement_service_measurements_api,
+from intdash.api.measurement_service_data_points_api import (
+    MeasurementServiceDataPointsApi,
+)
+from intdash.api.measurement_service_measurement_base_times_api import (
+    MeasurementServiceMeasurementBaseTimesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.measurement import Measurement
 
@@ -24,6 +30,7 @@ logging.basicConfig(
 )
 
 DATA_PATH = "."
+INDENT = 2
 
 
 class MeasurementEncoder(json.JSONEncoder):
@@ -57,48 +64,21 @@ class MeasurementEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def log_memory_usage() -> None:
-    """
-    メモリ使用量出力
-    """
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    logging.info(f"Memory Usage: {mem_info.rss / 1024 / 1024:.2f} MB")
-
-
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
 def get_measurement(
-    client: ApiClient, project_uuid: str, meas_uuid: str
+    factory: ClientFactory, project_uuid: str, meas_uuid: str
 ) -> Measurement:
     """
     計測取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
 
     Returns:
         Measurement: 計測オブジェクト
     """
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     measurement = api.get_project_measurement(
         project_uuid=project_uuid, measurement_uuid=meas_uuid
     )
@@ -106,21 +86,19 @@ def get_measurement(
     return measurement
 
 
-def get_basetimes(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
+def get_basetimes(factory: ClientFactory, project_uuid: str, meas_uuid: str) -> list:
     """
     計測基準時刻リスト取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
 
     Returns:
         list: 計測基準時刻リスト
     """
-    api = measurement_service_measurement_base_times_api.MeasurementServiceMeasurementBaseTimesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementBaseTimesApi)
     basetimes = api.list_project_measurement_base_times(
         project_uuid=project_uuid, measurement_uuid=meas_uuid
     )
@@ -129,71 +107,112 @@ def get_basetimes(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
     return basetimes["items"]
 
 
-def get_datapoints(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
+def get_datapoints(
+    factory: ClientFactory, project_uuid: str, meas_uuid: str
+) -> Generator[dict, None, None]:
     """
     計測データポイント取得
 
+    レスポンスを1行ずつ読み込み、データポイントを逐次返す
+
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
 
-    Returns:
-        list: データポイントのリスト
+    Yields:
+        dict: データポイント
     """
-    api = measurement_service_data_points_api.MeasurementServiceDataPointsApi(client)
+    api = factory.api(MeasurementServiceDataPointsApi)
     stream = api.list_project_data_points(
         project_uuid=project_uuid, name=meas_uuid, time_format="ns"
     )
 
-    data_points = []
     while True:
         line = stream.readline()
         if not line:
             break
 
-        dp = json.loads(line.decode())
-        data_points.append(dp)
-        log_memory_usage()
+        yield json.loads(line.decode())
 
-    count = len(data_points)
-    logging.info(f"Download datapoints: {count}")
-    return data_points
+
+def dump_value(value: Any, depth: int) -> str:
+    """
+    JSON値エンコード
+
+    json.dump(indent=2) で depth 階層目に出力される場合と同じ字下げでエンコードする
+
+    Args:
+        value: JSON値
+        depth: 階層（トップレベルのオブジェクト直下が1）
+
+    Returns:
+        str: エンコード結果
+    """
+    text = json.dumps(value, cls=MeasurementEncoder, ensure_ascii=False, indent=INDENT)
+    return text.replace("\n", "\n" + " " * (INDENT * depth))
 
 
 def save(
     measurement: Measurement,
     basetimes: list,
-    datapoints: list,
+    datapoints: Iterable[dict],
     file_path: str,
-) -> None:
+) -> int:
     """
     データファイル保存
 
+    データポイントを受け取りながら配列要素として逐次書き出す。
+    出力はjson.dump(indent=2)で一括保存した場合と同じ形式になる。
+    書き込み途中で失敗した場合に不完全なファイルが残らないよう、
+    一時ファイルに書き出してから置き換える。
+
     Args:
         measurement: 計測オブジェクト
         basetimes: 計測基準時刻リスト
         datapoints: データポイント
         file_path: ファイルパス
-    """
-    dst_data = {
-        "measurement": measurement.to_dict(),
-        "basetimes": basetimes,
-        "datapoints": datapoints,
-    }
 
-    log_memory_usage()
+    Returns:
+        int: データポイント数
+    """
+    indent1 = " " * INDENT
+    indent2 = " " * (INDENT * 2)
+    count = 0
+
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f'{indent1}"measurement": {dump_value(measurement.to_dict(), 1)},\n')
+        f.write(f'{indent1}"basetimes": {dump_value(basetimes, 1)},\n')
+        f.write(f'{indent1}"datapoints": [')
+        for dp in datapoints:
+            f.write("," if count else "")
+            f.write(f"\n{indent2}{dump_value(dp, 2)}")
+            count += 1
+        f.write(f"\n{indent1}]" if count else "]")
+        f.write("\n}")
+    os.replace(tmp_path, file_path)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(dst_data, f, cls=MeasurementEncoder, ensure_ascii=False, indent=2)
+    logging.info(f"Download datapoints: {count}")
+    return count
 
 
-def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> None:
+def main(
+    api_url: str,
+    api_token: str,
+    project_uuid: str,
+    meas_uuid: str,
+    sample_interval: float = 1.0,
+    resource_log: Optional[Path] = None,
+) -> None:
     """
     メイン
     - 計測データ取得
       - 計測、基準時刻、データポイントを取得
     - 計測ファイル保存
+      - データポイントはメモリに溜めず、取得しながらファイルに書き出す
+      - リソース使用量は一定間隔でバックグラウンド計測し、終了時にサマリー出力
       - 以下の形式でJSONファイルを保存する
         {
           "measurement": <計測オブジェクト>,
@@ -206,15 +225,19 @@ def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> Non
         api_token: 認証用のAPIトークン
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
+        sample_interval: リソース計測間隔（秒）
+        resource_log: リソース計測値の出力先（.csv / .json）
     """
     logging.info(f"Processing project_uuid: {project_uuid}, meas_uuid: {meas_uuid}")
 
+    sampler = ResourceSampler(sample_interval, dump_path=resource_log)
+    sampler.start()
     try:
         # 計測データ取得
-        client = get_client(api_url, api_token)
-        measurement = get_measurement(client, project_uuid, meas_uuid)
-        basetimes = get_basetimes(client, project_uuid, meas_uuid)
-        datapoints = get_datapoints(client, project_uuid, meas_uuid)
+        factory = ClientFactory(api_url, api_token)
+        measurement = get_measurement(factory, project_uuid, meas_uuid)
+        basetimes = get_basetimes(factory, project_uuid, meas_uuid)
+        datapoints = get_datapoints(factory, project_uuid, meas_uuid)
 
         # 計測ファイル保存
         dst_file = f"{DATA_PATH}/measurement_{meas_uuid}.json"
@@ -224,6 +247,8 @@ def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> Non
     except Exception as e:
         logging.error(f"Error: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        sampler.stop()
 
 
 if __name__ == "__main__":
@@ -238,6 +263,25 @@ if __name__ == "__main__":
         help="Project UUID (default: 00000000-0000-0000-0000-000000000000)",
     )
     parser.add_argument("--meas_uuid", required=True, help="Measurement UUID")
+    parser.add_argument(
+        "--sample_interval",
+        type=float,
+        default=1.0,
+        help="Resource sampling interval in seconds (default: 1.0)",
+    )
+    parser.add_argument(
+        "--resource_log",
+        type=Path,
+        default=None,
+        help="Output path of resource samples (.csv or .json)",
+    )
 
     args = parser.parse_args()
-    main(args.api_url, args.api_token, args.project_uuid, args.meas_uuid)
+    main(
+        args.api_url,
+        args.api_token,
+        args.project_uuid,
+        args.meas_uuid,
+        args.sample_interval,
+        args.resource_log,
+    )
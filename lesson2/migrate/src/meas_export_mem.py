@@ -1,18 +1,28 @@
 import argparse
+import base64
 import json
 import logging
 import sys
 import traceback
-from datetime import datetime
-from typing import Any, Generator
-
-import psutil
-
-from intdash import ApiClient, Configuration
-from intdash.api import (
-    measurement_service_data_points_api,
-    measurement_service_measurement_base_times_api,
-    measurement_service_measurements_api,
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Generator, Optional
+
+from binfile.binary_format import FILE_SUFFIX
+from binfile.binary_writer import BinaryWriter
+from client.client_factory import ClientFactory
+from exporter.partition_exporter import PartitionExporter
+from integrity.datapoint_digest import DatapointDigest
+from sampler.resource_sampler import ResourceSampler
+
+from intdash.api.measurement_service_data_points_api import (
+    MeasurementServiceDataPointsApi,
+)
+from intdash.api.measurement_service_measurement_base_times_api import (
+    MeasurementServiceMeasurementBaseTimesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.measurement import Measurement
 
@@ -57,48 +67,21 @@ class MeasurementEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def log_memory_usage() -> None:
-    """
-    メモリ使用量出力
-    """
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    logging.info(f"Memory Usage: {mem_info.rss / 1024 / 1024:.2f} MB")
-
-
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
 def get_measurement(
-    client: ApiClient, project_uuid: str, meas_uuid: str
+    factory: ClientFactory, project_uuid: str, meas_uuid: str
 ) -> Measurement:
     """
     計測取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
 
     Returns:
         Measurement: 計測オブジェクト
     """
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     measurement = api.get_project_measurement(
         project_uuid=project_uuid, measurement_uuid=meas_uuid
     )
@@ -106,21 +89,19 @@ def get_measurement(
     return measurement
 
 
-def get_basetimes(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
+def get_basetimes(factory: ClientFactory, project_uuid: str, meas_uuid: str) -> list:
     """
     計測基準時刻リスト取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
 
     Returns:
         list: 計測基準時刻リスト
     """
-    api = measurement_service_measurement_base_times_api.MeasurementServiceMeasurementBaseTimesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementBaseTimesApi)
     basetimes = api.list_project_measurement_base_times(
         project_uuid=project_uuid, measurement_uuid=meas_uuid
     )
@@ -130,30 +111,38 @@ def get_basetimes(client: ApiClient, project_uuid: str, meas_uuid: str) -> list:
 
 
 def get_datapoints(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     meas_uuid: str,
     chunk_size: int = 262144,  # 256KB
+    start: Optional[str] = None,
+    end: Optional[str] = None,
 ) -> Generator[dict, None, None]:
     """
     計測データポイント取得
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
         chunk_size (int): データチャンクサイズ
+        start (Optional[str]): 開始時刻（RFC3339形式）
+        end (Optional[str]): 終了時刻（RFC3339形式）
 
     Yields:
         dict: データポイント
     """
-    api = measurement_service_data_points_api.MeasurementServiceDataPointsApi(client)
+    api = factory.api(MeasurementServiceDataPointsApi)
     params = {
         "project_uuid": project_uuid,
         "name": meas_uuid,
         "time_format": "ns",
         "_preload_content": False,
     }
+    if start:
+        params["start"] = start
+    if end:
+        params["end"] = end
     stream = api.list_project_data_points(**params)
     if stream is None:
         raise Exception("Error: stream is None")
@@ -182,16 +171,21 @@ def save(
     basetimes: list,
     datapoints: Generator[dict, None, None],
     file_path: str,
+    trailer: bool = True,
 ) -> None:
     """
     データファイル保存
 
+    末尾にデータIDごとの件数・ダイジェストをトレーラーとして書き出す
+
     Args:
         measurement: 計測オブジェクト
         basetimes: 計測基準時刻リスト
         datapoints: データポイント（ジェネレータ）
         file_path: ファイルパス
+        trailer: トレーラーを書き出す
     """
+    digest = DatapointDigest()
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(
             {"measurement": measurement}, f, cls=MeasurementEncoder, ensure_ascii=False
@@ -205,15 +199,130 @@ def save(
         for dp in datapoints:
             json.dump({"datapoint": dp}, f, cls=MeasurementEncoder, ensure_ascii=False)
             f.write("\n")
-            log_memory_usage()
+            digest.add(
+                dp["time"],
+                dp["data_type"],
+                dp["data_name"],
+                base64.b64decode(dp["data"]["d"]),
+            )
+
+        if trailer:
+            json.dump({"trailer": digest.to_dict()}, f, ensure_ascii=False)
+            f.write("\n")
 
 
-def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> None:
+def save_binary(
+    measurement: Measurement,
+    basetimes: list,
+    datapoints: Generator[dict, None, None],
+    file_path: str,
+    compression: str = "none",
+) -> None:
+    """
+    バイナリデータファイル保存
+
+    計測・基準時刻はJSONのメタレコード、データポイントはデータIDごとの列指向ブロック
+    （時刻は差分、ペイロードはbase64デコード済みの生バイト列）で保存。
+    末尾にデータIDごとの件数・ダイジェストをトレーラーのメタレコードとして書き出す
+
+    Args:
+        measurement: 計測オブジェクト
+        basetimes: 計測基準時刻リスト
+        datapoints: データポイント（ジェネレータ）
+        file_path: ファイルパス
+        compression: 圧縮方式（none/gzip/zstd）
+    """
+    with BinaryWriter(
+        Path(file_path), compression, json_encoder=MeasurementEncoder
+    ) as writer:
+        writer.write_meta({"measurement": measurement})
+
+        for bt in basetimes:
+            writer.write_meta({"basetime": bt})
+
+        digest = DatapointDigest()
+        for dp in datapoints:
+            payload = base64.b64decode(dp["data"]["d"])
+            writer.write_datapoint(
+                dp["time"], dp["data_type"], dp["data_name"], payload
+            )
+            digest.add(dp["time"], dp["data_type"], dp["data_name"], payload)
+
+        writer.write_meta({"trailer": digest.to_dict()})
+
+
+def export_partitions(
+    factory: ClientFactory,
+    project_uuid: str,
+    measurement: Measurement,
+    basetimes: list,
+    partitions: int,
+    max_workers: int,
+    max_retries: int,
+    manifest: bool,
+) -> None:
+    """
+    時間パーティション並列エクスポート
+
+    Args:
+        factory: APIクライアント生成
+        project_uuid: プロジェクトUUID
+        measurement: 計測オブジェクト
+        basetimes: 計測基準時刻リスト
+        partitions: 時間パーティション数
+        max_workers: パーティション並列取得数
+        max_retries: パーティション最大再取得回数
+        manifest: パートファイルを結合せずマニフェストを出力
+    """
+    prefix = f"{DATA_PATH}/measurement_{measurement.uuid}"
+    header_file = f"{prefix}.header.jsonl"
+    save(measurement, basetimes, iter(()), header_file, trailer=False)
+
+    exporter = PartitionExporter(
+        lambda start, end: get_datapoints(
+            factory, project_uuid, measurement.uuid, start=start, end=end
+        ),
+        MeasurementEncoder,
+        max_workers,
+        max_retries,
+    )
+    ranges = PartitionExporter.split(
+        measurement.basetime,
+        timedelta(milliseconds=measurement.get("duration") or 0),
+        partitions,
+    )
+    parts = exporter.export(ranges, prefix)
+
+    if manifest:
+        manifest_file = f"{prefix}.manifest.json"
+        exporter.write_manifest(header_file, parts, manifest_file)
+        logging.info(f"Saved: {manifest_file}")
+    else:
+        dst_file = f"{prefix}.jsonl"
+        exporter.concatenate(header_file, parts, dst_file)
+        logging.info(f"Saved: {dst_file}")
+
+
+def main(
+    api_url: str,
+    api_token: str,
+    project_uuid: str,
+    meas_uuid: str,
+    output_format: str = "jsonl",
+    compression: str = "none",
+    partitions: int = 1,
+    max_workers: int = 4,
+    max_retries: int = 3,
+    manifest: bool = False,
+    sample_interval: float = 1.0,
+    resource_log: Optional[Path] = None,
+) -> None:
     """
     メイン（随時取得版）
     - 計測データ取得
       - 計測、基準時刻、データポイントを取得
     - 計測ファイル保存
+      - リソース使用量は一定間隔でバックグラウンド計測し、終了時にサマリー出力
       - 以下の形式でJSON Linesファイルを保存する
         {"measurement": <計測オブジェクト>}
         {"basetime": <基準時刻>}
@@ -222,30 +331,67 @@ def main(api_url: str, api_token: str, project_uuid: str, meas_uuid: str) -> Non
         {"datapoint": <データポイント>}
         {"datapoint": <データポイント>}
         ...
+        {"trailer": <データIDごとの件数・ダイジェスト>}
+      - output_format が bin の場合はバイナリ形式（binfile.binary_format 参照）で保存する
+    - 時間パーティション並列取得（partitions > 1、JSON Linesのみ）
+      - 計測の長さを partitions 個に分割し、max_workers 並列でパートファイルに取得
+      - 失敗したパーティションは max_retries 回まで再取得
+      - 全パーティション取得後に時刻順に結合（manifest 指定時はマニフェストを出力）
 
     Args:
         api_url: intdash APIのURL
         api_token: 認証用のAPIトークン
         project_uuid: プロジェクトUUID
         meas_uuid: 計測UUID
+        output_format: 出力形式（jsonl/bin）
+        compression: バイナリ形式の圧縮方式（none/gzip/zstd）
+        partitions: 時間パーティション数
+        max_workers: パーティション並列取得数
+        max_retries: パーティション最大再取得回数
+        manifest: パートファイルを結合せずマニフェストを出力
+        sample_interval: リソース計測間隔（秒）
+        resource_log: リソース計測値の出力先（.csv / .json）
     """
     logging.info(f"Processing project_uuid: {project_uuid}, meas_uuid: {meas_uuid}")
 
+    sampler = ResourceSampler(sample_interval, dump_path=resource_log)
+    sampler.start()
     try:
         # 計測データ取得
-        client = get_client(api_url, api_token)
-        measurement = get_measurement(client, project_uuid, meas_uuid)
-        basetimes = get_basetimes(client, project_uuid, meas_uuid)
-        datapoints = get_datapoints(client, project_uuid, meas_uuid)
+        factory = ClientFactory(api_url, api_token, max_workers)
+        measurement = get_measurement(factory, project_uuid, meas_uuid)
+        basetimes = get_basetimes(factory, project_uuid, meas_uuid)
+
+        # 時間パーティション並列取得
+        if partitions > 1:
+            export_partitions(
+                factory,
+                project_uuid,
+                measurement,
+                basetimes,
+                partitions,
+                max_workers,
+                max_retries,
+                manifest,
+            )
+            return
+
+        datapoints = get_datapoints(factory, project_uuid, meas_uuid)
 
         # 計測ファイル保存
-        dst_file = f"{DATA_PATH}/measurement_{meas_uuid}.jsonl"
-        save(measurement, basetimes, datapoints, dst_file)
+        if output_format == "bin":
+            dst_file = f"{DATA_PATH}/measurement_{meas_uuid}{FILE_SUFFIX}"
+            save_binary(measurement, basetimes, datapoints, dst_file, compression)
+        else:
+            dst_file = f"{DATA_PATH}/measurement_{meas_uuid}.jsonl"
+            save(measurement, basetimes, datapoints, dst_file)
         logging.info(f"Saved: {dst_file}")
 
     except Exception as e:
         logging.error(f"Error: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        sampler.stop()
 
 
 if __name__ == "__main__":
@@ -260,6 +406,68 @@ if __name__ == "__main__":
         help="Project UUID (default: 00000000-0000-0000-0000-000000000000)",
     )
     parser.add_argument("--meas_uuid", required=True, help="Measurement UUID")
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "bin"],
+        default="jsonl",
+        help="Output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["none", "gzip", "zstd"],
+        default="none",
+        help="Compression of bin format (default: none)",
+    )
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=1,
+        help="Number of time partitions downloaded concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=4,
+        help="Number of concurrent partition downloads (default: 4)",
+    )
+    parser.add_argument(
+        "--max_retries",
+        type=int,
+        default=3,
+        help="Max retries of a failed partition (default: 3)",
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help="Write a manifest of part files instead of concatenating them",
+    )
+    parser.add_argument(
+        "--sample_interval",
+        type=float,
+        default=1.0,
+        help="Resource sampling interval in seconds (default: 1.0)",
+    )
+    parser.add_argument(
+        "--resource_log",
+        type=Path,
+        default=None,
+        help="Output path of resource samples (.csv or .json)",
+    )
 
     args = parser.parse_args()
-    main(args.api_url, args.api_token, args.project_uuid, args.meas_uuid)
+    if args.partitions > 1 and args.format != "jsonl":
+        parser.error("--partitions is only supported with --format jsonl.")
+    main(
+        args.api_url,
+        args.api_token,
+        args.project_uuid,
+        args.meas_uuid,
+        args.format,
+        args.compression,
+        args.partitions,
+        args.max_workers,
+        args.max_retries,
+        args.manifest,
+        args.sample_interval,
+        args.resource_log,
+    )
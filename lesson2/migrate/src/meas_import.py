@@ -1,15 +1,17 @@
 import argparse
 import base64
 import io
-import json
 import logging
 import sys
 import traceback
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
 
-import psutil
+from client.client_factory import ClientFactory
+from decoder.document_reader import DocumentReader
+from sampler.resource_sampler import ResourceSampler
 
 from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataChunk,
@@ -18,19 +20,23 @@ from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataPoint,
     StoreDataPointGroup,
 )
-from intdash import ApiClient, Configuration
-from intdash.api import (
-    measurement_service_measurement_base_times_api,
-    measurement_service_measurement_markers_api,
-    measurement_service_measurement_sequences_api,
-    measurement_service_measurements_api,
+from intdash.api.measurement_service_measurement_base_times_api import (
+    MeasurementServiceMeasurementBaseTimesApi,
+)
+from intdash.api.measurement_service_measurement_markers_api import (
+    MeasurementServiceMeasurementMarkersApi,
+)
+from intdash.api.measurement_service_measurement_sequences_api import (
+    MeasurementServiceMeasurementSequencesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.create_meas_base_time import CreateMeasBaseTime
 from intdash.model.meas_base_time_name import MeasBaseTimeName
 from intdash.model.meas_base_time_priority import MeasBaseTimePriority
 from intdash.model.meas_create import MeasCreate
 from intdash.model.measurement import Measurement
-from intdash.model.measurement_base_time_type import MeasurementBaseTimeType
 from intdash.model.measurement_marker_detail_point import MeasurementMarkerDetailPoint
 from intdash.model.measurement_marker_detail_range import MeasurementMarkerDetailRange
 from intdash.model.measurement_marker_post_request import MeasurementMarkerPostRequest
@@ -46,85 +52,18 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)],
 )
 
-
-def measurement_decoder(dct: dict) -> dict:
-    """
-    計測デコーダー
-
-    JSONオブジェクトをデコードする際に、特定のキーに対応する値を適切に変換する
-    - basetime_typeの場合、対応するオブジェクトに変換
-    - 日付文字列の場合、datetimeオブジェクトに変換
-    - ナノ秒の情報を含む場合、適切にmicrosecondに変換
-
-    Args:
-        dct: デコード対象のJSONオブジェクト
-
-    Returns:
-        dict: 変換されたJSONオブジェクト
-    """
-    for key, value in dct.items():
-        if isinstance(value, str):
-            try:
-                # basetime_typeの場合
-                if key == "basetime_type":
-                    dct[key] = MeasurementBaseTimeType(value)
-
-                # datetimeの場合
-                elif value.endswith("Z"):
-                    dt = datetime.fromisoformat(value[:-1])
-                    dt = dt.replace(tzinfo=timezone.utc)
-                    dct[key] = dt
-                elif "." in value:
-                    dt = datetime.fromisoformat(value)
-                    dct[key] = dt
-
-                # ナノ秒の処理（.XXXXXXX000 の形式）
-                if "." in value and isinstance(dct[key], datetime):
-                    nano_part = value.split(".")[1][:9]
-                    microseconds = int(nano_part[:6])
-                    dt = dct[key].replace(microsecond=microseconds)
-                    dct[key] = dt
-
-            except ValueError:
-                pass
-    return dct
-
-
-def log_memory_usage() -> None:
-    """
-    メモリ使用量出力
-    """
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    logging.info(f"Memory Usage: {mem_info.rss / 1024 / 1024:.2f} MB")
-
-
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
+# 定数定義
+CHUNK_SIZE = 1000
 
 
 def create_measurement(
-    client: ApiClient, project_uuid: str, edge_uuid: str, meas_src: dict
+    factory: ClientFactory, project_uuid: str, edge_uuid: str, meas_src: dict
 ) -> Measurement:
     """
     計測作成
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         edge_uuid: エッジUUID
         meas_src: 計測情報
@@ -135,7 +74,7 @@ def create_measurement(
     meas_dist = meas_src.copy()
     meas_dist["edge_uuid"] = edge_uuid
     meas_create = MeasCreate(**meas_dist)
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     measurement = api.create_project_measurement(project_uuid, meas_create=meas_create)
     logging.info(
         f"Created measurement: {measurement.uuid} edge_uuid {measurement.edge_uuid}"
@@ -144,7 +83,7 @@ def create_measurement(
 
 
 def create_basetimes(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     base_times_src: list,
@@ -155,14 +94,12 @@ def create_basetimes(
     計測作成で作成した基準時刻を削除し、改めて基準時刻を作成
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
         base_times_src: 基準時刻の詳細情報のリスト
     """
-    api = measurement_service_measurement_base_times_api.MeasurementServiceMeasurementBaseTimesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementBaseTimesApi)
 
     current_basetimes = api.list_project_measurement_base_times(
         project_uuid=project_uuid,
@@ -190,7 +127,7 @@ def create_basetimes(
 
 
 def create_markers(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     markers_src: list,
@@ -203,14 +140,12 @@ def create_markers(
     - range: start_elapsed_time, end_elapsed_time
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         measurement_uuid: 計測UUID
         markers_src: マーカーリスト
     """
-    api = measurement_service_measurement_markers_api.MeasurementServiceMeasurementMarkersApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementMarkersApi)
 
     for mk_src in markers_src:
         mk_copy = mk_src.copy()
@@ -234,7 +169,7 @@ def create_markers(
 
 
 def replace_measurement_sequence(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     sequence_uuid: Optional[str],
@@ -244,7 +179,7 @@ def replace_measurement_sequence(
     シーケンス作成・置き換え
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
         sequence_uuid: シーケンスUUID
@@ -258,9 +193,7 @@ def replace_measurement_sequence(
         final_sequence_number=measurement_src["sequences"]["received_data_points"],
     )
 
-    api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementSequencesApi)
     sequence = api.replace_project_measurement_sequence(
         project_uuid=project_uuid,
         measurement_uuid=measurement_uuid,
@@ -272,28 +205,54 @@ def replace_measurement_sequence(
 
 
 def send_chunks(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     basetime: datetime,
     sequence_uuid: str,
-    datapoints: list,
-) -> None:
+    datapoints: Iterable[dict],
+) -> int:
     """
     チャンク送信
 
+    データポイントを CHUNK_SIZE 件ずつチャンクに変換して送信する。
+    シーケンス番号はバッチをまたいで 1 から連番で採番する。
+
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
         basetime: 計測の基準時刻
         sequence_uuid: シーケンスのUUID
-        datapoints: データポイントのリスト
+        datapoints: データポイント（逐次読み込み可）
+
+    Returns:
+        int: 送信したデータポイント数
     """
-    chunks = []
-    sequence_number = 1
+    api = factory.api(MeasurementServiceMeasurementSequencesApi)
     basetime_ns = int(basetime.timestamp() * 1_000_000) * 1_000
-    for i, dp in enumerate(datapoints):
+    sequence_number = 1
+    chunks = []
+
+    def flush() -> None:
+        results = api.create_project_measurement_sequence_chunks(
+            project_uuid=project_uuid,
+            body=io.BytesIO(
+                StoreDataChunks(
+                    meas_uuid=measurement_uuid,
+                    sequence_uuid=sequence_uuid,
+                    chunks=chunks,
+                ).SerializeToString()
+            ),
+            _content_type="application/vnd.iscp.v2.protobuf",
+        )
+        for result in results.items:
+            logging.info(
+                f"Sent sequence chunk: sequence number {result.sequence_number}, result: {result.result}"
+            )
+        chunks.clear()
+
+    for dp in datapoints:
         point_time = dp["time"]
         elapsed_time = point_time - basetime_ns
         payload = base64.b64decode(dp["data"]["d"])
@@ -310,54 +269,47 @@ def send_chunks(
 
         chunks.append(store_data_chunk)
         sequence_number += 1
+        if len(chunks) >= CHUNK_SIZE:
+            flush()
 
-        log_memory_usage()
-
-    chunk = StoreDataChunks(
-        meas_uuid=measurement_uuid, sequence_uuid=sequence_uuid, chunks=chunks
-    )
-    if not chunk.chunks:
+    if chunks:
+        flush()
+    elif sequence_number == 1:
         logging.info("No chunks available to send.")
-        return
-
-    api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-        client
-    )
 
-    results = api.create_project_measurement_sequence_chunks(
-        project_uuid=project_uuid,
-        body=io.BytesIO(chunk.SerializeToString()),
-        _content_type="application/vnd.iscp.v2.protobuf",
-    )
-    for result in results.items:
-        logging.info(
-            f"Sent sequence chunk: sequence number {result.sequence_number}, result: {result.result}"
-        )
+    return sequence_number - 1
 
 
 def complete_measurement(
-    client: ApiClient, project_uuid: str, measurement_uuid: str
+    factory: ClientFactory, project_uuid: str, measurement_uuid: str
 ) -> None:
     """
     計測完了
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
     """
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     api.complete_project_measurement(
         project_uuid=project_uuid, measurement_uuid=measurement_uuid
     )
 
 
 def main(
-    api_url: str, api_token: str, project_uuid: str, edge_uuid: str, src_file: str
+    api_url: str,
+    api_token: str,
+    project_uuid: str,
+    edge_uuid: str,
+    src_file: str,
+    sample_interval: float = 1.0,
+    resource_log: Optional[Path] = None,
 ) -> None:
     """
     メイン
     - 計測ファイル読込
+      - 計測・基準時刻を先に読み込み、データポイントはチャンク送信しながら逐次読み込む
     - 計測データ作成
       - APIクライアント作成
       - 計測作成
@@ -366,6 +318,7 @@ def main(
       - シーケンス作成
       - チャンク送信
       - 計測完了
+    - リソース使用量は一定間隔でバックグラウンド計測し、終了時にサマリー出力
 
     Args:
         api_url: intdash APIのURL
@@ -373,6 +326,8 @@ def main(
         project_uuid: プロジェクトUUID
         edge_uuid: エッジUUID
         src_file: 計測ファイルパス
+        sample_interval: リソース計測間隔（秒）
+        resource_log: リソース計測値の出力先（.csv / .json）
     """
     logging.info(
         f"Processing project_uuid: {project_uuid}, edge_uuid: {edge_uuid}, src_file: {
@@ -380,38 +335,44 @@ def main(
         }"
     )
 
+    sampler = ResourceSampler(sample_interval, dump_path=resource_log)
+    sampler.start()
     try:
-        # 計測ファイル読込
-        with open(src_file, "r", encoding="utf-8") as json_file:
-            data = json.load(json_file, object_hook=measurement_decoder)
-
-        # 計測データ作成
-        client = get_client(api_url, api_token)
-        measurement = create_measurement(
-            client, project_uuid, edge_uuid, data["measurement"]
-        )
-        create_basetimes(client, project_uuid, measurement.uuid, data["basetimes"])
-        create_markers(
-            client, project_uuid, measurement.uuid, data["measurement"]["markers"]
-        )
-        sequence = replace_measurement_sequence(
-            client, project_uuid, measurement.uuid, None, data["measurement"]
-        )
-        send_chunks(
-            client,
-            project_uuid,
-            measurement.uuid,
-            data["measurement"]["basetime"],
-            sequence.uuid,
-            data["datapoints"],
-        )
-        complete_measurement(client, project_uuid, measurement.uuid)
+        with DocumentReader(Path(src_file)) as reader:
+            # 計測ファイル読込（計測・基準時刻のみ。データポイントは送信しながら読み込む）
+            data = reader.read_header()
+
+            # 計測データ作成
+            factory = ClientFactory(api_url, api_token)
+            measurement = create_measurement(
+                factory, project_uuid, edge_uuid, data["measurement"]
+            )
+            create_basetimes(factory, project_uuid, measurement.uuid, data["basetimes"])
+            create_markers(
+                factory, project_uuid, measurement.uuid, data["measurement"]["markers"]
+            )
+            sequence = replace_measurement_sequence(
+                factory, project_uuid, measurement.uuid, None, data["measurement"]
+            )
+            count = send_chunks(
+                factory,
+                project_uuid,
+                measurement.uuid,
+                data["measurement"]["basetime"],
+                sequence.uuid,
+                reader.datapoints(),
+            )
+        complete_measurement(factory, project_uuid, measurement.uuid)
+
+        logging.info(f"Sent datapoints: {count}")
 
         logging.info(f"Created measurement: {measurement.uuid}")
 
     except Exception as e:
         logging.error(f"Error: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        sampler.stop()
 
 
 if __name__ == "__main__":
@@ -429,6 +390,18 @@ if __name__ == "__main__":
     parser.add_argument(
         "--src_file", required=True, help="Path to the Measurement JSON file"
     )
+    parser.add_argument(
+        "--sample_interval",
+        type=float,
+        default=1.0,
+        help="Resource sampling interval in seconds (default: 1.0)",
+    )
+    parser.add_argument(
+        "--resource_log",
+        type=Path,
+        default=None,
+        help="Output path of resource samples (.csv or .json)",
+    )
 
     args = parser.parse_args()
     main(
@@ -437,4 +410,6 @@ if __name__ == "__main__":
         args.project_uuid,
         args.edge_uuid,
         args.src_file,
+        args.sample_interval,
+        args.resource_log,
     )
@@ -1,15 +1,20 @@
 import argparse
 import base64
-import io
-import json
 import logging
 import sys
 import traceback
 import uuid
-from datetime import datetime, timezone
-from typing import Generator, Optional
-
-import psutil
+from datetime import datetime
+from pathlib import Path
+from typing import Generator, Optional, Tuple
+
+from binfile.binary_reader import BinaryReader
+from checkpoint.import_checkpoint import ImportCheckpoint
+from client.client_factory import ClientFactory
+from decoder.measurement_decoder import decode_entry, decode_object
+from integrity.datapoint_digest import DatapointDigest
+from sampler.resource_sampler import ResourceSampler
+from uploader.chunk_uploader import ChunkUploader
 
 from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataChunk,
@@ -18,19 +23,23 @@ from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataPoint,
     StoreDataPointGroup,
 )
-from intdash import ApiClient, Configuration
-from intdash.api import (
-    measurement_service_measurement_base_times_api,
-    measurement_service_measurement_markers_api,
-    measurement_service_measurement_sequences_api,
-    measurement_service_measurements_api,
+from intdash.api.measurement_service_measurement_base_times_api import (
+    MeasurementServiceMeasurementBaseTimesApi,
+)
+from intdash.api.measurement_service_measurement_markers_api import (
+    MeasurementServiceMeasurementMarkersApi,
+)
+from intdash.api.measurement_service_measurement_sequences_api import (
+    MeasurementServiceMeasurementSequencesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.create_meas_base_time import CreateMeasBaseTime
 from intdash.model.meas_base_time_name import MeasBaseTimeName
 from intdash.model.meas_base_time_priority import MeasBaseTimePriority
 from intdash.model.meas_create import MeasCreate
 from intdash.model.measurement import Measurement
-from intdash.model.measurement_base_time_type import MeasurementBaseTimeType
 from intdash.model.measurement_marker_detail_point import MeasurementMarkerDetailPoint
 from intdash.model.measurement_marker_detail_range import MeasurementMarkerDetailRange
 from intdash.model.measurement_marker_post_request import MeasurementMarkerPostRequest
@@ -50,99 +59,78 @@ logging.basicConfig(
 CHUNK_SIZE = 1000
 
 
-def measurement_decoder(dct: dict) -> dict:
+def load(
+    file_path: str, offset: int = 0
+) -> Generator[Tuple[Optional[int], dict], None, None]:
     """
-    計測デコーダー
+    JSON Lines/バイナリファイル読み込み
 
-    JSONオブジェクトをデコードする際に、特定のキーに対応する値を適切に変換する
-    - basetime_typeの場合、対応するオブジェクトに変換
-    - 日付文字列の場合、datetimeオブジェクトに変換
-    - ナノ秒の情報を含む場合、適切にmicrosecondに変換
+    先頭がバイナリ形式のMAGICならBinaryReaderで読み込む
 
     Args:
-        dct: デコード対象のJSONオブジェクト
+        file_path (str): JSON Lines/バイナリファイルパス
+        offset (int): 読み込み開始位置（JSON Linesのみ。再開用）
 
-    Returns:
-        dict: 変換されたJSONオブジェクト
+    Yields:
+        tuple:
+            エントリを読み終えたファイル位置（バイナリ形式はNone）
+            エントリ
     """
-    for key, value in dct.items():
-        if isinstance(value, str):
-            try:
-                # basetime_typeの場合
-                if key == "basetime_type":
-                    dct[key] = MeasurementBaseTimeType(value)
-
-                # datetimeの場合
-                elif value.endswith("Z"):
-                    dt = datetime.fromisoformat(value[:-1])
-                    dt = dt.replace(tzinfo=timezone.utc)
-                    dct[key] = dt
-                elif "." in value:
-                    dt = datetime.fromisoformat(value)
-                    dct[key] = dt
-
-                # ナノ秒の処理（.XXXXXXX000 の形式）
-                if "." in value and isinstance(dct[key], datetime):
-                    nano_part = value.split(".")[1][:9]
-                    microseconds = int(nano_part[:6])
-                    dt = dct[key].replace(microsecond=microseconds)
-                    dct[key] = dt
-
-            except ValueError:
-                pass
-    return dct
-
-
-def log_memory_usage() -> None:
-    """
-    メモリ使用量出力
-    """
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    logging.info(f"Memory Usage: {mem_info.rss / 1024 / 1024:.2f} MB")
-
-
-def load(file_path: str) -> Generator[dict, None, None]:
-    """
-    JSON Linesファイル読み込み
-
-    Args:
-        file_path (str): JSON Linesファイルパス
-    """
-    with open(file_path, "r", encoding="utf-8") as f:
+    if BinaryReader.is_binary(Path(file_path)):
+        for entry in BinaryReader(Path(file_path)).read():
+            if "datapoint" not in entry:
+                entry = decode_object(entry)
+            yield None, entry
+        return
+
+    with open(file_path, "rb") as f:
+        f.seek(offset)
         for line in f:
+            offset += len(line)
             try:
-                yield json.loads(line, object_hook=measurement_decoder)
-            except json.JSONDecodeError as e:
+                yield offset, decode_entry(line)
+            except ValueError as e:
                 logging.warning(f"JSON decode error: {e}")
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
+def has_trailer(file_path: str) -> bool:
     """
-    REST API設定
+    トレーラー有無判定
+
+    JSON Linesは末尾の行がトレーラーか確認する。
+    バイナリ形式はエクスポート時に必ずトレーラーを書き出すためTrueとする。
 
     Args:
-        api_url: APIのURL
-        api_token: APIトークン
+        file_path (str): JSON Lines/バイナリファイルパス
 
     Returns:
-        ApiClient: APIクライアント
+        bool: トレーラーがある場合True
     """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
+    if BinaryReader.is_binary(Path(file_path)):
+        return True
+
+    with open(file_path, "rb") as f:
+        size = f.seek(0, 2)
+        position = size
+        tail = b""
+        while position > 0:
+            position = max(0, position - 4096)
+            f.seek(position)
+            tail = f.read(size - position).rstrip()
+            if b"\n" in tail or position == 0:
+                break
+    line = tail.rsplit(b"\n", 1)[-1]
+    return line.startswith(b'{"trailer"')
 
 
 def create_measurement(
-    client: ApiClient, project_uuid: str, edge_uuid: str, meas_src: dict
+    factory: ClientFactory, project_uuid: str, edge_uuid: str, meas_src: dict
 ) -> Measurement:
     """
     計測作成
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         edge_uuid: エッジUUID
         meas_src: 計測情報
@@ -153,7 +141,7 @@ def create_measurement(
     meas_dist = meas_src.copy()
     meas_dist["edge_uuid"] = edge_uuid
     meas_create = MeasCreate(**meas_dist)
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     measurement = api.create_project_measurement(project_uuid, meas_create=meas_create)
     logging.info(
         f"Created measurement: {measurement.uuid} edge_uuid {measurement.edge_uuid}"
@@ -162,7 +150,7 @@ def create_measurement(
 
 
 def clear_basetimes(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
 ) -> None:
@@ -172,13 +160,11 @@ def clear_basetimes(
     計測作成で作成した基準時刻を削除
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
     """
-    api = measurement_service_measurement_base_times_api.MeasurementServiceMeasurementBaseTimesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementBaseTimesApi)
 
     current_basetimes = api.list_project_measurement_base_times(
         project_uuid=project_uuid,
@@ -194,7 +180,7 @@ def clear_basetimes(
 
 
 def create_basetime(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     basetime: dict,
@@ -203,14 +189,12 @@ def create_basetime(
     基準時刻作成
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
         basetime: 基準時刻
     """
-    api = measurement_service_measurement_base_times_api.MeasurementServiceMeasurementBaseTimesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementBaseTimesApi)
     bt_copy = basetime.copy()
     bt_copy["priority"] = MeasBaseTimePriority(basetime["priority"])
     bt_copy["name"] = MeasBaseTimeName(basetime["name"])
@@ -224,7 +208,7 @@ def create_basetime(
 
 
 def create_markers(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     markers_src: list,
@@ -237,14 +221,12 @@ def create_markers(
     - range: start_elapsed_time, end_elapsed_time
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトUUID
         measurement_uuid: 計測UUID
         markers_src: マーカーリスト
     """
-    api = measurement_service_measurement_markers_api.MeasurementServiceMeasurementMarkersApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementMarkersApi)
 
     for mk_src in markers_src:
         mk_copy = mk_src.copy()
@@ -268,33 +250,31 @@ def create_markers(
 
 
 def replace_measurement_sequence(
-    client: ApiClient,
+    factory: ClientFactory,
     project_uuid: str,
     measurement_uuid: str,
     sequence_uuid: Optional[str],
-    measurement_src: dict,
+    data_points: int,
 ) -> MeasurementSequenceGroup:
     """
     シーケンス作成・置き換え
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
         sequence_uuid: シーケンスUUID
-        measurement_src: 計測情報
+        data_points: 送信したデータポイント数（最終シーケンス番号）
 
     Returns:
         MeasurementSequenceGroup: 作成または更新された計測シーケンス
     """
     sequence_group = MeasurementSequenceGroupReplace(
-        expected_data_points=measurement_src["sequences"]["expected_data_points"],
-        final_sequence_number=measurement_src["sequences"]["received_data_points"],
+        expected_data_points=data_points,
+        final_sequence_number=data_points,
     )
 
-    api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-        client
-    )
+    api = factory.api(MeasurementServiceMeasurementSequencesApi)
     sequence = api.replace_project_measurement_sequence(
         project_uuid=project_uuid,
         measurement_uuid=measurement_uuid,
@@ -305,24 +285,19 @@ def replace_measurement_sequence(
     return sequence
 
 
-def send_chunks(
-    client: ApiClient,
-    project_uuid: str,
+def build_chunks(
     measurement_uuid: str,
     basetime: datetime,
     sequence_uuid: str,
     datapoints: list,
     sequence_start: int,
-) -> int:
+) -> StoreDataChunks:
     """
-    データポイントをチャンクで分割送信
-    - CHUNK_SIZE 単位で分割して送信
+    データポイントをチャンクに変換
     - StoreDataPoint, StoreDataPointGroup, StoreDataChunk を順次生成
-    - Protobuf形式で送信
+    - シーケンス番号は sequence_start から採番
 
     Args:
-        client (ApiClient): APIクライアント
-        project_uuid (str): プロジェクトのUUID
         measurement_uuid (str): 計測UUID
         basetime (datetime): 計測の基準時刻
         sequence_uuid (str): シーケンスのUUID
@@ -330,18 +305,17 @@ def send_chunks(
         sequence_start (int): シーケンス番号初期値
 
     Returns:
-        int: 次回のーケンス番号初期値
+        StoreDataChunks: 送信用チャンク
     """
-    api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-        client
-    )
-
     basetime_ns = int(basetime.timestamp() * 1_000_000) * 1_000
     chunks = []
 
     for i, dp in enumerate(datapoints):
         elapsed_time = dp["time"] - basetime_ns
-        payload = base64.b64decode(dp["data"]["d"])
+        if "payload" in dp:
+            payload = dp["payload"]  # デコード済み
+        else:
+            payload = base64.b64decode(dp["data"]["d"])
         store_data_point = StoreDataPoint(elapsed_time=elapsed_time, payload=payload)
         store_data_point_group = StoreDataPointGroup(
             data_id=StoreDataID(type=dp["data_type"], name=dp["data_name"]),
@@ -353,40 +327,25 @@ def send_chunks(
         )
         chunks.append(store_data_chunk)
 
-    chunk = StoreDataChunks(
+    return StoreDataChunks(
         meas_uuid=measurement_uuid,
         sequence_uuid=sequence_uuid,
         chunks=chunks,
     )
-    if not chunk.chunks:
-        logging.info("No chunks available to send.")
-        return sequence_start
-
-    results = api.create_project_measurement_sequence_chunks(
-        project_uuid=project_uuid,
-        body=io.BytesIO(chunk.SerializeToString()),
-        _content_type="application/vnd.iscp.v2.protobuf",
-    )
-    for result in results.items:
-        logging.info(
-            f"Sent sequence chunk: sequence number {result.sequence_number}, result: {result.result}"
-        )
-
-    return sequence_start + len(datapoints)
 
 
 def complete_measurement(
-    client: ApiClient, project_uuid: str, measurement_uuid: str
+    factory: ClientFactory, project_uuid: str, measurement_uuid: str
 ) -> None:
     """
     計測完了
 
     Args:
-        client: APIクライアント
+        factory: APIクライアント生成
         project_uuid: プロジェクトのUUID
         measurement_uuid: 計測UUID
     """
-    api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(client)
+    api = factory.api(MeasurementServiceMeasurementsApi)
     api.complete_project_measurement(
         project_uuid=project_uuid,
         measurement_uuid=measurement_uuid,
@@ -394,7 +353,18 @@ def complete_measurement(
 
 
 def main(
-    api_url: str, api_token: str, project_uuid: str, edge_uuid: str, src_file: str
+    api_url: str,
+    api_token: str,
+    project_uuid: str,
+    edge_uuid: str,
+    src_file: str,
+    max_workers: int = 4,
+    max_retries: int = 3,
+    checkpoint_file: Optional[Path] = None,
+    resume: bool = False,
+    dedup: bool = False,
+    sample_interval: float = 1.0,
+    resource_log: Optional[Path] = None,
 ) -> None:
     """
     メイン（随時み出し版）
@@ -404,9 +374,19 @@ def main(
       - 計測作成
       - 基準時刻作成
       - マーカー作成
-      - シーケンス作成
       - チャンク送信
-      - 計測完了
+        - CHUNK_SIZE 単位のバッチを max_workers 並列で送信
+        - 再送要求・通信エラーのシーケンス番号は max_retries 回まで再送
+        - 先頭から連続して受理されたバッチまでをチェックポイントに記録
+      - 全バッチの受理確認後、送信数でシーケンスを置き換え、トレーラーと照合してから計測完了
+    - 検証
+      - トレーラーがある場合、読み込みながらデータIDごとの件数・ダイジェストを集計して照合
+      - 不一致の場合は計測を完了せずエラー
+      - dedup 指定時は同じダイジェストのデータポイントを送信しない
+    - 再開（resume）
+      - チェックポイントの計測・シーケンスに、続きのシーケンス番号から送信
+      - JSON Linesは記録位置までシーク、バイナリ形式は受理済み件数を読み飛ばす
+    - リソース使用量は一定間隔でバックグラウンド計測し、終了時にサマリー出力
 
     Args:
         api_url: intdash APIのURL
@@ -414,76 +394,189 @@ def main(
         project_uuid: プロジェクトUUID
         edge_uuid: エッジUUID
         src_file: 計測ファイルパス
+        max_workers: チャンク並列送信数
+        max_retries: チャンク最大再送回数
+        checkpoint_file: チェックポイントファイルパス（未指定時は <src_file>.checkpoint.json）
+        resume: チェックポイントから再開
+        dedup: 重複データポイントを送信しない
+        sample_interval: リソース計測間隔（秒）
+        resource_log: リソース計測値の出力先（.csv / .json）
     """
     logging.info(
         f"Processing project_uuid: {project_uuid}, edge_uuid: {edge_uuid}, src_file: {src_file}"
     )
 
+    checkpoint = ImportCheckpoint(
+        checkpoint_file or Path(f"{src_file}.checkpoint.json")
+    )
+    sampler = ResourceSampler(sample_interval, dump_path=resource_log)
+    sampler.start()
+    uploader: Optional[ChunkUploader] = None
     try:
         # APIクライアント生成
-        client = get_client(api_url, api_token)
+        factory = ClientFactory(api_url, api_token, max_workers)
+        uploader = ChunkUploader(
+            factory,
+            project_uuid,
+            max_workers,
+            max_retries,
+            on_acked=lambda result: checkpoint.ack(result.first_sequence),
+        )
 
-        measurement_src = {}
-        buffer = []
+        measurement_uuid = None
+        basetime = None
+        buffer: list = []
+        sampler.add_gauge("buffer", buffer.__len__)
+        sampler.add_gauge("in_flight", lambda: uploader.in_flight)
 
         sequence_uuid = str(uuid.uuid4())
         sequence_number = 1
+        start_offset = 0
+        skip = 0
+
+        # 検証用
+        digest = DatapointDigest()
+        trailer = None
+        seen: set = set()
+        duplicates = 0
+
+        # チェックポイントから再開
+        if resume and checkpoint.load() and checkpoint.state:
+            if checkpoint.state.completed:
+                logging.info(
+                    f"Already completed measurement: {checkpoint.state.measurement_uuid}"
+                )
+                return
+            measurement_uuid = checkpoint.state.measurement_uuid
+            sequence_uuid = checkpoint.state.sequence_uuid
+            basetime = checkpoint.basetime
+            sequence_number = checkpoint.state.last_sequence + 1
+            if checkpoint.state.offset is not None:
+                start_offset = checkpoint.state.offset
+            else:
+                skip = checkpoint.state.datapoints
+            logging.info(
+                f"Resumed measurement: {measurement_uuid} from sequence number {sequence_number}"
+            )
+            if start_offset:
+                logging.warning(
+                    "Verification and dedup cover only datapoints after the checkpoint."
+                )
+
+        # トレーラーがなく重複除外もしない場合はダイジェストを計算しない
+        verify = not start_offset and has_trailer(src_file)
 
-        for entry in load(src_file):
+        offset: Optional[int] = start_offset
+        for offset, entry in load(src_file, start_offset):
             if "measurement" in entry:
+                if measurement_uuid:
+                    continue
                 measurement_src = entry["measurement"]
                 markers = measurement_src.get("markers", [])
                 measurement = create_measurement(
-                    client, project_uuid, edge_uuid, measurement_src
+                    factory, project_uuid, edge_uuid, measurement_src
                 )
-                create_markers(client, project_uuid, measurement.uuid, markers)
-                replace_measurement_sequence(
-                    client,
-                    project_uuid,
-                    measurement.uuid,
-                    sequence_uuid,
-                    measurement_src,
-                )
-                clear_basetimes(client, project_uuid, measurement.uuid)
+                measurement_uuid = measurement.uuid
+                basetime = measurement_src["basetime"]
+                create_markers(factory, project_uuid, measurement_uuid, markers)
+                clear_basetimes(factory, project_uuid, measurement_uuid)
             elif "basetime" in entry:
+                if checkpoint.state:
+                    continue
                 create_basetime(
-                    client, project_uuid, measurement.uuid, entry["basetime"]
+                    factory, project_uuid, measurement_uuid, entry["basetime"]
                 )
+            elif "trailer" in entry:
+                trailer = entry["trailer"]
             elif "datapoint" in entry:
-                if not measurement_src:
+                if not measurement_uuid or not basetime:
                     raise ValueError("Measurement must be defined before datapoints")
-                buffer.append(entry["datapoint"])
+                dp = entry["datapoint"]
+                if verify or dedup:
+                    if "payload" not in dp:
+                        dp["payload"] = base64.b64decode(dp["data"]["d"])
+                    point = digest.add(
+                        dp["time"], dp["data_type"], dp["data_name"], dp["payload"]
+                    )
+                    if dedup:
+                        if point in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(point)
+                if skip:
+                    skip -= 1
+                    continue
+                if not checkpoint.state:
+                    checkpoint.start(
+                        src_file, measurement_uuid, sequence_uuid, basetime
+                    )
+                buffer.append(dp)
                 if len(buffer) >= CHUNK_SIZE:
-                    sequence_number = send_chunks(
-                        client,
-                        project_uuid,
-                        measurement.uuid,
-                        measurement_src["basetime"],
-                        sequence_uuid,
-                        buffer,
-                        sequence_number,
+                    checkpoint.register(
+                        sequence_number, sequence_number + len(buffer) - 1, offset
                     )
+                    uploader.submit(
+                        build_chunks(
+                            measurement_uuid,
+                            basetime,
+                            sequence_uuid,
+                            buffer,
+                            sequence_number,
+                        )
+                    )
+                    sequence_number += len(buffer)
                     buffer.clear()
-                    log_memory_usage()
 
         if buffer:
-            send_chunks(
-                client,
-                project_uuid,
-                measurement.uuid,
-                measurement_src["basetime"],
-                sequence_uuid,
-                buffer,
-                sequence_number,
+            checkpoint.register(
+                sequence_number, sequence_number + len(buffer) - 1, offset
+            )
+            uploader.submit(
+                build_chunks(
+                    measurement_uuid,
+                    basetime,
+                    sequence_uuid,
+                    buffer,
+                    sequence_number,
+                )
             )
+            sequence_number += len(buffer)
+            buffer.clear()
+
+        # 全バッチ受理待ち
+        results = uploader.wait()
+        logging.info(
+            f"Sent sequence chunks: batches {len(results)}, chunks {sum(r.acked for r in results)}"
+        )
+
+        # シーケンス置き換え（重複除外後の実際の送信数）
+        replace_measurement_sequence(
+            factory, project_uuid, measurement_uuid, sequence_uuid, sequence_number - 1
+        )
+
+        # トレーラー照合
+        if duplicates:
+            logging.info(f"Skipped duplicate datapoints: {duplicates}")
+        if trailer is None:
+            logging.info("No trailer found. Skipped verification.")
+        elif verify:
+            errors = digest.verify(trailer)
+            if errors:
+                raise ValueError("Verification failed: " + "; ".join(errors))
+            logging.info(f"Verified datapoints: {digest.count}")
 
         # 計測完了
-        complete_measurement(client, project_uuid, measurement.uuid)
-        logging.info(f"Created measurement: {measurement.uuid}")
+        complete_measurement(factory, project_uuid, measurement_uuid)
+        checkpoint.complete()
+        logging.info(f"Created measurement: {measurement_uuid}")
 
     except Exception as e:
         logging.error(f"Error: {str(e)}")
         logging.error(traceback.format_exc())
+    finally:
+        if uploader:
+            uploader.close()
+        sampler.stop()
 
 
 if __name__ == "__main__":
@@ -499,7 +592,49 @@ if __name__ == "__main__":
     )
     parser.add_argument("--edge_uuid", required=True, help="Edge UUID")
     parser.add_argument(
-        "--src_file", required=True, help="Path to the Measurement JSON Lines file"
+        "--src_file",
+        required=True,
+        help="Path to the Measurement JSON Lines or bin file",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=4,
+        help="Number of concurrent chunk uploads (default: 4)",
+    )
+    parser.add_argument(
+        "--max_retries",
+        type=int,
+        default=3,
+        help="Max retries of failed sequence chunks (default: 3)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Checkpoint file path (default: <src_file>.checkpoint.json)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the checkpoint instead of creating a new measurement",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Skip datapoints with the same data ID, time and payload",
+    )
+    parser.add_argument(
+        "--sample_interval",
+        type=float,
+        default=1.0,
+        help="Resource sampling interval in seconds (default: 1.0)",
+    )
+    parser.add_argument(
+        "--resource_log",
+        type=Path,
+        default=None,
+        help="Output path of resource samples (.csv or .json)",
     )
 
     args = parser.parse_args()
@@ -509,4 +644,11 @@ if __name__ == "__main__":
         args.project_uuid,
         args.edge_uuid,
         args.src_file,
+        args.max_workers,
+        args.max_retries,
+        args.checkpoint,
+        args.resume,
+        args.dedup,
+        args.sample_interval,
+        args.resource_log,
     )
@@ -0,0 +1,213 @@
+import csv
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+import psutil
+
+
+@dataclass(slots=True)
+class ResourceSample:
+    """
+    リソース計測値
+
+    Attributes:
+        time (float): 計測時刻（UNIX時刻・秒）
+        rss_mb (float): 常駐メモリ使用量（MB）
+        cpu_percent (float): CPU使用率（%）
+        gauges (dict): ゲージ名ごとの値（キュー長など）
+    """
+
+    time: float
+    rss_mb: float
+    cpu_percent: float
+    gauges: Dict[str, int] = field(default_factory=dict)
+
+
+class ResourceSampler:
+    """
+    リソースサンプラー
+
+    バックグラウンドスレッドで一定間隔ごとにメモリ・CPU・キュー長を計測し、
+    リングバッファに保持する。処理ループ内でデータポイントごとに計測しないための仕組み。
+
+    Attributes:
+        interval (float): 計測間隔（秒）
+        samples (Deque[ResourceSample]): 計測値リングバッファ
+        dump_path (Optional[Path]): 終了時の出力先（.csv / .json）
+        _gauges (dict): ゲージ名と値取得関数
+        _process (psutil.Process): 自プロセス
+        _stop_event (threading.Event): 停止イベント
+        _thread (Optional[threading.Thread]): 計測スレッド
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        maxlen: int = 3600,
+        dump_path: Optional[Path] = None,
+    ) -> None:
+        self.interval = interval
+        self.samples: Deque[ResourceSample] = deque(maxlen=maxlen)
+        self.dump_path = dump_path
+        self._gauges: Dict[str, Callable[[], int]] = {}
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_gauge(self, name: str, getter: Callable[[], int]) -> None:
+        """
+        ゲージ登録
+
+        Args:
+            name (str): ゲージ名
+            getter (Callable[[], int]): 値取得関数（例: queue.qsize）
+        """
+        self._gauges[name] = getter
+
+    def start(self) -> None:
+        """
+        計測開始
+        """
+        if self._thread is not None:
+            return
+        self._process.cpu_percent(interval=None)  # 初回は0.0が返るため空読み
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ResourceSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        計測停止
+
+        - 計測スレッド停止
+        - 最終計測
+        - サマリー出力
+        - 出力先指定時はファイル出力
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        self.sample()
+        self.log_summary()
+        if self.dump_path:
+            self.dump(self.dump_path)
+
+    def sample(self) -> ResourceSample:
+        """
+        計測
+
+        Returns:
+            ResourceSample: 計測値
+        """
+        gauges = {}
+        for name, getter in self._gauges.items():
+            try:
+                gauges[name] = int(getter())
+            except Exception:
+                gauges[name] = -1
+
+        sample = ResourceSample(
+            time=time.time(),
+            rss_mb=self._process.memory_info().rss / 1024 / 1024,
+            cpu_percent=self._process.cpu_percent(interval=None),
+            gauges=gauges,
+        )
+        self.samples.append(sample)
+        return sample
+
+    def summary(self) -> Dict[str, float]:
+        """
+        サマリー
+
+        Returns:
+            dict: 計測数、メモリ・CPUの最大/平均、ゲージの最大
+        """
+        samples: List[ResourceSample] = list(self.samples)
+        if not samples:
+            return {"samples": 0}
+
+        result: Dict[str, float] = {
+            "samples": len(samples),
+            "rss_mb_max": max(s.rss_mb for s in samples),
+            "rss_mb_avg": sum(s.rss_mb for s in samples) / len(samples),
+            "cpu_percent_max": max(s.cpu_percent for s in samples),
+            "cpu_percent_avg": sum(s.cpu_percent for s in samples) / len(samples),
+        }
+        for name in self._gauges:
+            result[f"{name}_max"] = max(s.gauges.get(name, 0) for s in samples)
+        return result
+
+    def log_summary(self) -> None:
+        """
+        サマリー出力
+        """
+        summary = self.summary()
+        logging.info(
+            "Resource summary: "
+            + " ".join(
+                f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}"
+                for key, value in summary.items()
+            )
+        )
+
+    def dump(self, path: Path) -> None:
+        """
+        ファイル出力
+
+        拡張子が .json の場合はJSON、それ以外はCSVで出力
+
+        Args:
+            path (Path): 出力先パス
+        """
+        samples = list(self.samples)
+        if path.suffix == ".json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "summary": self.summary(),
+                        "samples": [asdict(s) for s in samples],
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+        else:
+            names = list(self._gauges)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["time", "rss_mb", "cpu_percent", *names])
+                for s in samples:
+                    writer.writerow(
+                        [
+                            f"{s.time:.3f}",
+                            f"{s.rss_mb:.2f}",
+                            f"{s.cpu_percent:.1f}",
+                            *[s.gauges.get(name, "") for name in names],
+                        ]
+                    )
+        logging.info(f"Resource samples saved: {path}")
+
+    def _run(self) -> None:
+        """
+        計測ループ
+        """
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "ResourceSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
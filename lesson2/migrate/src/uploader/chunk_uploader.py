@@ -0,0 +1,223 @@
+import io
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from client.client_factory import ClientFactory
+
+from gen.intdash.v1.protocol_pb2 import StoreDataChunks  # type: ignore
+from intdash.api.measurement_service_measurement_sequences_api import (
+    MeasurementServiceMeasurementSequencesApi,
+)
+from intdash.model.create_measurement_chunks_result import CreateMeasurementChunksResult
+
+# 再送要求を示すチャンク送信結果
+RESULT_RESEND = "resend"
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """
+    バッチ送信結果
+
+    Attributes:
+        first_sequence (int): 先頭シーケンス番号
+        last_sequence (int): 末尾シーケンス番号
+        attempts (int): 送信試行回数
+        acked (int): 受理されたチャンク数
+        error (Optional[str]): 失敗時のエラー内容
+    """
+
+    first_sequence: int
+    last_sequence: int
+    attempts: int = 0
+    acked: int = 0
+    error: Optional[str] = None
+
+
+class ChunkUploader:
+    """
+    チャンク並列送信
+
+    シーケンス番号採番済みのチャンクバッチをスレッドプールで並列送信する
+    - 同時送信数（max_workers）の2倍を超えるバッチは submit() で待機（メモリ上限）
+    - 再送要求・通信エラーのシーケンス番号のみ、間隔を倍にしながら再送
+    - wait() で全バッチの受理を確認
+    - on_acked 指定時は、バッチ受理ごとに送信スレッドから呼び出す
+
+    Attributes:
+        factory (ClientFactory): APIクライアント生成（接続プールを共有）
+        project_uuid (str): プロジェクトUUID
+        max_retries (int): 最大再送回数
+        retry_interval (float): 初回再送間隔（秒）
+        on_acked (Optional[Callable[[BatchResult], None]]): バッチ受理時の通知先
+        results (List[BatchResult]): 完了したバッチ送信結果
+        _executor (ThreadPoolExecutor): 送信スレッドプール
+        _slots (threading.BoundedSemaphore): 未完了バッチ数の上限
+        _futures (List[Future]): 未回収のバッチ送信
+    """
+
+    def __init__(
+        self,
+        factory: ClientFactory,
+        project_uuid: str,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_interval: float = 1.0,
+        on_acked: Optional[Callable[[BatchResult], None]] = None,
+    ) -> None:
+        self.factory = factory
+        self.project_uuid = project_uuid
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.on_acked = on_acked
+        self.results: List[BatchResult] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ChunkUploader"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers * 2)
+        self._futures: List[Future[BatchResult]] = []
+
+    @property
+    def in_flight(self) -> int:
+        """
+        未完了バッチ数
+
+        Returns:
+            int: 送信中・送信待ちのバッチ数
+        """
+        return sum(1 for f in self._futures if not f.done())
+
+    def submit(self, chunks: StoreDataChunks) -> None:
+        """
+        バッチ送信登録
+
+        未完了バッチが上限に達している場合は空きが出るまで待機する
+
+        Args:
+            chunks (StoreDataChunks): シーケンス番号採番済みのチャンク
+        """
+        if not chunks.chunks:
+            logging.info("No chunks available to send.")
+            return
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._send, chunks)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def wait(self) -> List[BatchResult]:
+        """
+        全バッチ完了待ち
+
+        Returns:
+            List[BatchResult]: バッチ送信結果
+
+        Raises:
+            RuntimeError: 再送上限を超えて受理されなかったバッチがある場合
+        """
+        futures, self._futures = self._futures, []
+        for future in futures:
+            self.results.append(future.result())
+
+        failed = [r for r in self.results if r.error]
+        if failed:
+            raise RuntimeError(
+                f"Failed to send {len(failed)} batches: "
+                + ", ".join(
+                    f"{r.first_sequence}-{r.last_sequence} ({r.error})" for r in failed
+                )
+            )
+        return self.results
+
+    def close(self) -> None:
+        """
+        終了
+        """
+        self._executor.shutdown(wait=True)
+
+    def _send(self, chunks: StoreDataChunks) -> BatchResult:
+        """
+        バッチ送信（ワーカースレッド）
+
+        Args:
+            chunks (StoreDataChunks): チャンク
+
+        Returns:
+            BatchResult: バッチ送信結果
+        """
+        api = self.factory.api(MeasurementServiceMeasurementSequencesApi)
+        pending = list(chunks.chunks)
+        result = BatchResult(
+            first_sequence=pending[0].sequence_number,
+            last_sequence=pending[-1].sequence_number,
+        )
+
+        while pending:
+            result.attempts += 1
+            body = StoreDataChunks(
+                meas_uuid=chunks.meas_uuid,
+                sequence_uuid=chunks.sequence_uuid,
+                chunks=pending,
+            )
+            try:
+                response = self._post(api, body)
+                resend = {
+                    item.sequence_number
+                    for item in response.items
+                    if item.result == RESULT_RESEND
+                }
+                result.acked += len(pending) - len(resend)
+                pending = [c for c in pending if c.sequence_number in resend]
+                result.error = f"resend requested: {len(resend)}" if resend else None
+            except Exception as e:
+                result.error = str(e)
+
+            if not pending:
+                break
+            if result.attempts > self.max_retries:
+                logging.error(
+                    f"Gave up sequence chunks: {result.first_sequence}-{result.last_sequence} error: {result.error}"
+                )
+                return result
+
+            wait = self.retry_interval * 2 ** (result.attempts - 1)
+            logging.warning(
+                f"Retry sequence chunks: {len(pending)} in {result.first_sequence}-{result.last_sequence} after {wait:.1f}s error: {result.error}"
+            )
+            time.sleep(wait)
+
+        logging.info(
+            f"Sent sequence chunks: {result.first_sequence}-{result.last_sequence} attempts: {result.attempts}"
+        )
+        if self.on_acked:
+            self.on_acked(result)
+        return result
+
+    def _post(
+        self,
+        api: MeasurementServiceMeasurementSequencesApi,
+        chunks: StoreDataChunks,
+    ) -> CreateMeasurementChunksResult:
+        """
+        チャンク送信API呼び出し
+
+        Args:
+            api: 計測シーケンスAPI
+            chunks (StoreDataChunks): チャンク
+
+        Returns:
+            CreateMeasurementChunksResult: チャンク送信結果
+        """
+        return api.create_project_measurement_sequence_chunks(
+            project_uuid=self.project_uuid,
+            body=io.BytesIO(chunks.SerializeToString()),
+            _content_type="application/vnd.iscp.v2.protobuf",
+        )
@@ -0,0 +1,295 @@
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hook.hook.hook_manager import HookManager
+
+from intdash.api_client import ApiClient
+
+# 差分比較しない項目（シークレットはサーバーから取得できない）
+IGNORED_FIELDS = ("project_uuid", "secret")
+
+
+@dataclass(slots=True)
+class HookChange:
+    """
+    Webhook変更内容
+
+    Attributes:
+        action (str): 操作（create/update/delete/test）
+        project_uuid (str): プロジェクトUUID
+        url (str): 送信先URL
+        hook_uuid (Optional[str]): Webhook UUID（作成時はNone）
+        body (Optional[Dict[str, Any]]): 登録内容（作成・更新時）
+        diff (Optional[List[str]]): 変更項目（更新時）
+    """
+
+    action: str
+    project_uuid: str
+    url: str
+    hook_uuid: Optional[str] = None
+    body: Optional[Dict[str, Any]] = None
+    diff: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class HookResult:
+    """
+    Webhook変更結果
+
+    Attributes:
+        change (HookChange): 変更内容
+        response (Any): APIレスポンス
+        error (Optional[Exception]): 失敗時の例外
+    """
+
+    change: HookChange
+    response: Any = None
+    error: Optional[Exception] = None
+
+
+def load_definitions(
+    store: Any, default_project_uuid: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Webhook定義読み込み
+
+    {"hooks": [...]} またはWebhook設定のリスト
+    project_uuid がない定義は default_project_uuid を使う
+
+    Args:
+        store: 設定ファイル内容
+        default_project_uuid: 既定のプロジェクトUUID
+
+    Returns:
+        list: Webhook定義（project_uuid・url必須）のリスト
+
+    Raises:
+        ValueError: project_uuid・url がない、または同じ定義が重複している場合
+    """
+    hooks = store.get("hooks", []) if isinstance(store, dict) else store
+    definitions = []
+    keys = set()
+    for i, hook in enumerate(hooks):
+        definition = {"project_uuid": default_project_uuid, **hook}
+        if not definition.get("project_uuid") or not definition.get("url"):
+            raise ValueError(f"hooks[{i}]: project_uuid and url are required")
+        key = (definition["project_uuid"], definition["url"])
+        if key in keys:
+            raise ValueError(f"hooks[{i}]: duplicated definition {key}")
+        keys.add(key)
+        definitions.append(definition)
+    return definitions
+
+
+class BulkHookManager:
+    """
+    Webhook一括管理
+
+    複数プロジェクトのWebhook定義（プロジェクトUUID・URLで識別）をサーバーと比較し、
+    差分のみ max_workers 並列で反映する
+    - 一覧は全プロジェクトの1ページ目を並列に取得し、総件数から残りのページを並列に取得
+      （総件数が返らない場合は件数が per_page 未満になるまで順に取得）
+    - 更新はシークレット以外の項目が異なる場合のみ
+
+    Attributes:
+        client (ApiClient): APIクライアント
+        max_workers (int): 同時リクエスト数
+        per_page (int): ページ中カウント
+        managers (Dict[str, HookManager]): プロジェクトごとのWebhook管理
+    """
+
+    def __init__(
+        self, client: ApiClient, max_workers: int = 8, per_page: int = 100
+    ) -> None:
+        self.client = client
+        self.max_workers = max_workers
+        self.per_page = per_page
+        self.managers: Dict[str, HookManager] = {}
+
+    def manager(self, project_uuid: str) -> HookManager:
+        """
+        プロジェクトのWebhook管理取得
+
+        Args:
+            project_uuid (str): プロジェクトUUID
+
+        Returns:
+            HookManager: Webhook管理
+        """
+        if project_uuid not in self.managers:
+            self.managers[project_uuid] = HookManager(self.client, project_uuid)
+        return self.managers[project_uuid]
+
+    def fetch(self, project_uuids: List[str]) -> Dict[str, list]:
+        """
+        全ページ一覧
+
+        Args:
+            project_uuids (List[str]): プロジェクトUUIDリスト
+
+        Returns:
+            dict: プロジェクトUUIDごとのWebhook設定リスト
+        """
+        project_uuids = list(dict.fromkeys(project_uuids))
+        managers = [self.manager(p) for p in project_uuids]
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="HookList"
+        ) as executor:
+            firsts = list(
+                executor.map(lambda m: m.list_page(1, self.per_page), managers)
+            )
+
+            hooks: Dict[str, list] = {}
+            rest: List[Tuple[str, int]] = []
+            for project_uuid, (items, total_count) in zip(project_uuids, firsts):
+                hooks[project_uuid] = list(items)
+                if total_count is not None:
+                    pages = math.ceil(total_count / self.per_page)
+                    rest.extend((project_uuid, page) for page in range(2, pages + 1))
+                elif len(items) == self.per_page:
+                    hooks[project_uuid].extend(self._fetch_sequential(project_uuid))
+
+            pages_items = executor.map(
+                lambda r: self.manager(r[0]).list_page(r[1], self.per_page)[0], rest
+            )
+            for (project_uuid, _), items in zip(rest, pages_items):
+                hooks[project_uuid].extend(items)
+        return hooks
+
+    def _fetch_sequential(self, project_uuid: str) -> list:
+        """
+        2ページ目以降を順に取得（総件数が返らない場合）
+
+        Args:
+            project_uuid (str): プロジェクトUUID
+
+        Returns:
+            list: Webhook設定リスト
+        """
+        hooks: list = []
+        page = 2
+        while True:
+            items, _ = self.manager(project_uuid).list_page(page, self.per_page)
+            hooks.extend(items)
+            if len(items) < self.per_page:
+                return hooks
+            page += 1
+
+    def plan_apply(
+        self, definitions: List[Dict[str, Any]], prune: bool = False
+    ) -> List[HookChange]:
+        """
+        反映内容作成
+
+        Args:
+            definitions (list): Webhook定義
+            prune (bool): 定義にないWebhookを削除（定義に含まれるプロジェクトのみ）
+
+        Returns:
+            List[HookChange]: 変更内容（作成・更新・削除）
+        """
+        servers = self.fetch([d["project_uuid"] for d in definitions])
+        changes = []
+        defined = set()
+        for definition in definitions:
+            project_uuid, url = definition["project_uuid"], definition["url"]
+            defined.add((project_uuid, url))
+            body = {k: v for k, v in definition.items() if k != "project_uuid"}
+            matches = [h for h in servers[project_uuid] if h["url"] == url]
+            if not matches:
+                changes.append(HookChange("create", project_uuid, url, body=body))
+                continue
+
+            for hook in matches:
+                current = hook.to_dict()
+                diff = [
+                    k
+                    for k, v in definition.items()
+                    if k not in IGNORED_FIELDS and current.get(k) != v
+                ]
+                if diff:
+                    changes.append(
+                        HookChange(
+                            "update", project_uuid, url, hook["uuid"], body, diff
+                        )
+                    )
+
+        if prune:
+            for project_uuid, hooks in servers.items():
+                for hook in hooks:
+                    if (project_uuid, hook["url"]) not in defined:
+                        changes.append(
+                            HookChange(
+                                "delete", project_uuid, hook["url"], hook["uuid"]
+                            )
+                        )
+        return changes
+
+    def plan_matched(
+        self, definitions: List[Dict[str, Any]], action: str
+    ) -> List[HookChange]:
+        """
+        定義に一致するWebhookへの操作内容作成
+
+        Args:
+            definitions (list): Webhook定義
+            action (str): 操作（delete/test）
+
+        Returns:
+            List[HookChange]: 変更内容
+        """
+        servers = self.fetch([d["project_uuid"] for d in definitions])
+        return [
+            HookChange(action, d["project_uuid"], d["url"], hook["uuid"])
+            for d in definitions
+            for hook in servers[d["project_uuid"]]
+            if hook["url"] == d["url"]
+        ]
+
+    def execute(
+        self,
+        changes: List[HookChange],
+        resource_type: str = "measurement",
+        action: str = "created",
+    ) -> List[HookResult]:
+        """
+        並列実行
+
+        失敗した変更も他の変更は続行し、結果に例外を記録する
+
+        Args:
+            changes (List[HookChange]): 変更内容
+            resource_type (str): テスト時のリソースタイプ
+            action (str): テスト時のアクション
+
+        Returns:
+            List[HookResult]: 変更ごとの結果（変更内容と同じ順）
+        """
+        handlers: Dict[str, Callable[[HookChange], Any]] = {
+            "create": lambda c: self.manager(c.project_uuid).save(c.body),
+            "update": lambda c: self.manager(c.project_uuid).save(c.body, c.hook_uuid),
+            "delete": lambda c: self.manager(c.project_uuid).delete(c.hook_uuid),
+            "test": lambda c: self.manager(c.project_uuid).test(
+                c.hook_uuid, resource_type, action
+            ),
+        }
+
+        for change in changes:
+            self.manager(change.project_uuid)
+
+        def run(change: HookChange) -> HookResult:
+            try:
+                return HookResult(change, handlers[change.action](change))
+            except Exception as e:
+                logging.error(
+                    f"Failed to {change.action} Hook project_uuid:{change.project_uuid} url:{change.url}: {e}"
+                )
+                return HookResult(change, error=e)
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="HookApply"
+        ) as executor:
+            return list(executor.map(run, changes))
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from intdash.api.webhook_service_project_webhook_api import (
     WebhookServiceProjectWebhookApi,
@@ -37,6 +37,24 @@ class HookManager:
             self.project_uuid, per_page=per_page
         ).items
 
+    def list_page(self, page: int, per_page: int) -> Tuple[list, Optional[int]]:
+        """
+        一覧（1ページ）
+
+        Args:
+            page (int): ページ番号（1始まり）
+            per_page (int): ページ中カウント
+
+        Returns:
+            tuple: (Webhook設定リスト, 総件数) 総件数が返らない場合はNone
+        """
+        response = self.api.list_project_webhooks(
+            self.project_uuid, page=page, per_page=per_page
+        )
+        page_info = response.get("page")
+        total_count = page_info.get("total_count") if page_info else None
+        return response.items, total_count
+
     def get(self, hook_uuid: str) -> HookProject:
         """
         取得
@@ -2,7 +2,14 @@ import argparse
 import json
 import logging
 import sys
+from typing import List
 
+from hook.hook.bulk_hook_manager import (
+    BulkHookManager,
+    HookChange,
+    HookResult,
+    load_definitions,
+)
 from hook.hook.hook_manager import HookManager
 from hook.store.store_encoder import StoreEncoder
 from hook.store.store_manager import StoreKeeper
@@ -22,23 +29,64 @@ logging.basicConfig(
 )
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
+def get_client(api_url: str, api_token: str, pool_maxsize: int = 4) -> ApiClient:
     """
     REST API設定
 
+    一括操作の並列リクエストで共有するため、接続プールサイズを指定する
+
     Args:
         api_url: APIのURL
         api_token: APIトークン
+        pool_maxsize: 接続プールサイズ
     Returns:
         ApiClient: APIクライアント
     """
     configuration = Configuration(
         host=f"{api_url}/api", api_key={"IntdashToken": api_token}
     )
+    configuration.connection_pool_maxsize = pool_maxsize
     client = ApiClient(configuration)
     return client
 
 
+def log_changes(changes: List[HookChange], dry_run: bool = False) -> None:
+    """
+    変更内容出力
+
+    Args:
+        changes: 変更内容
+        dry_run: 反映しない
+    """
+    prefix = "[dry run] " if dry_run else ""
+    for c in changes:
+        diff = f" diff:{','.join(c.diff)}" if c.diff else ""
+        logging.info(
+            f"{prefix}{c.action} project_uuid:{c.project_uuid} url:{c.url} hook_uuid:{c.hook_uuid}{diff}"
+        )
+    logging.info(f"{prefix}Planned changes count: {len(changes)}")
+
+
+def log_results(results: List[HookResult]) -> bool:
+    """
+    結果出力
+
+    Args:
+        results: 変更ごとの結果
+
+    Returns:
+        bool: 全件成功
+    """
+    failures = [r for r in results if r.error]
+    for r in results:
+        if r.change.action == "test" and not r.error:
+            logging.info(
+                f"Tested Hook project_uuid:{r.change.project_uuid} hook_uuid:{r.change.hook_uuid}\n{r.response}"
+            )
+    logging.info(f"Succeeded: {len(results) - len(failures)}, Failed: {len(failures)}")
+    return not failures
+
+
 def main() -> None:
     """
     メイン
@@ -52,6 +100,9 @@ def main() -> None:
             delete: 削除
             test: テスト
                 設定に登録されているurlにHook Requestを送信する
+            apply: 一括反映
+                Webhook定義ファイル（複数プロジェクト）とサーバーの差分のみ並列に反映する
+        delete・test は --src_path 指定時、定義に一致するWebhookに並列に実行する
     """
     # 引数チェック
     parser = argparse.ArgumentParser(description="Webhook configuration CLI tool.")
@@ -62,6 +113,12 @@ def main() -> None:
         default="00000000-0000-0000-0000-000000000000",
         help="Project UUID.",
     )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=8,
+        help="Max concurrent requests for bulk operations.",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -93,13 +150,17 @@ def main() -> None:
     delete_parser = subparsers.add_parser(
         "delete", help="Delete a webhook configuration."
     )
-    delete_parser.add_argument(
-        "--hook_uuid", required=True, help="UUID of the webhook to delete."
+    delete_target = delete_parser.add_mutually_exclusive_group(required=True)
+    delete_target.add_argument("--hook_uuid", help="UUID of the webhook to delete.")
+    delete_target.add_argument(
+        "--src_path", help="JSON file with webhook definitions to delete."
     )
 
     test_parser = subparsers.add_parser("test", help="Test a webhook configuration.")
-    test_parser.add_argument(
-        "--hook_uuid", required=True, help="UUID of the webhook to test."
+    test_target = test_parser.add_mutually_exclusive_group(required=True)
+    test_target.add_argument("--hook_uuid", help="UUID of the webhook to test.")
+    test_target.add_argument(
+        "--src_path", help="JSON file with webhook definitions to test."
     )
     test_parser.add_argument(
         "--resource_type", default="measurement", help="Hooks Request resource type."
@@ -107,14 +168,31 @@ def main() -> None:
     test_parser.add_argument(
         "--action", default="created", help="Hooks Request action."
     )
+
+    apply_parser = subparsers.add_parser(
+        "apply", help="Apply webhook definitions of multiple projects."
+    )
+    apply_parser.add_argument(
+        "--src_path", required=True, help="JSON file with webhook definitions."
+    )
+    apply_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete webhooks not in the definitions (projects in the file only).",
+    )
+    apply_parser.add_argument(
+        "--dry_run", action="store_true", help="Show changes without applying."
+    )
     args = parser.parse_args()
 
     # メソッド実行
-    client = get_client(args.api_url, args.api_token)
+    client = get_client(args.api_url, args.api_token, args.max_workers)
     manager = HookManager(client, args.project_uuid)
+    bulk = BulkHookManager(client, args.max_workers)
     try:
         if args.command == "list":
-            hooks = manager.list(int(args.per_page))
+            bulk.per_page = int(args.per_page)
+            hooks = bulk.fetch([args.project_uuid])[args.project_uuid]
             logging.info(
                 f"Listed Hooks count: {len(hooks)}\n{json.dumps(hooks, indent=JSON_INDENT, cls=StoreEncoder)}"
             )
@@ -132,14 +210,34 @@ def main() -> None:
             hook_res = manager.save(hook_src, args.hook_uuid)
             logging.info(f"Imported Hook\n{hook_res}")
 
-        elif args.command == "delete":
+        elif args.command == "delete" and args.hook_uuid:
             manager.delete(args.hook_uuid)
             logging.info(f"Deleted Hook hook_uuid:{args.hook_uuid}")
 
-        elif args.command == "test":
+        elif args.command == "test" and args.hook_uuid:
             delivery = manager.test(args.hook_uuid, args.resource_type, args.action)
             logging.info(f"Tested Hook\n{delivery}")
 
+        else:
+            definitions = load_definitions(
+                StoreKeeper.read(args.src_path), args.project_uuid
+            )
+            if args.command == "apply":
+                changes = bulk.plan_apply(definitions, args.prune)
+            else:
+                changes = bulk.plan_matched(definitions, args.command)
+            log_changes(changes, getattr(args, "dry_run", False))
+            if getattr(args, "dry_run", False):
+                return
+
+            results = bulk.execute(
+                changes,
+                getattr(args, "resource_type", "measurement"),
+                getattr(args, "action", "created"),
+            )
+            if not log_results(results):
+                sys.exit(1)
+
     except exceptions.ApiValueError as e:
         logging.error(f"API error:{e}")
 
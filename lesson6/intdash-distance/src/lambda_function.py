@@ -1,17 +1,17 @@
+import json
 import logging
 import os
 import sys
+import time
 import traceback
-from typing import Any, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from calculator.distance_calculator import DistanceCalculator
-from notifier.notifier import Notifier
-from reader.measurement_reader import MeasurementReader
-from service.distance_service import DistanceService
-from writer.measurement_writer import MeasurementWriter
-
-from intdash import ApiClient
-from intdash.configuration import Configuration
+if TYPE_CHECKING:
+    from calculator.distance_calculator import DistanceCalculator
+    from client.client_factory import ClientFactory
+    from notifier.async_notifier import AsyncNotifier
 
 # ログ設定
 logger = logging.getLogger()
@@ -23,66 +23,260 @@ logging.basicConfig(
 )
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
+@dataclass(frozen=True)
+class Config:
     """
-    REST API設定
+    環境変数設定
+
+    Attributes:
+        api_url (str): APIのURL
+        api_token (str): APIトークン
+        fetch_size (int): フェッチ件数
+        origin (Tuple[float, float]): 原点の緯度経度
+        slack_url (str): SlackのIncoming Webhook URL
+        max_workers (int): バッチ処理の計測並列数
+        notify_window (float): Slack通知をまとめる時間（秒）
+    """
+
+    api_url: str
+    api_token: str
+    fetch_size: int
+    origin: Tuple[float, float]
+    slack_url: str
+    max_workers: int
+    notify_window: float
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """
+        環境変数読み込み
+
+        Returns:
+            Config: 環境変数設定
+        """
+        return cls(
+            api_url=os.getenv("API_URL", "https://example.intdash.jp"),
+            api_token=os.getenv("API_TOKEN", "<YOUR_API_TOKEN>"),
+            fetch_size=int(os.getenv("FETCH_SIZE", 100)),
+            origin=(
+                float(os.getenv("ORIGIN_LAT", 35.6878973)),
+                float(os.getenv("ORIGIN_LON", 139.7170926)),
+            ),  # 会社
+            slack_url=os.getenv("SLACK_URL", "<YOUR_SLACK_WEBHOOK_URL>"),
+            max_workers=int(os.getenv("MAX_WORKERS", 4)),
+            notify_window=float(os.getenv("NOTIFY_WINDOW", 1.0)),
+        )
+
+
+@dataclass
+class Runtime:
+    """
+    ウォームスタートで使い回すオブジェクト
+
+    Attributes:
+        config (Config): 環境変数設定
+        factory (ClientFactory): APIクライアント生成（接続プールを維持）
+        calculator (DistanceCalculator): 距離算出
+        notifier (AsyncNotifier): Slack通知（HTTPセッションの接続を維持）
+    """
+
+    config: Config
+    factory: "ClientFactory"
+    calculator: "DistanceCalculator"
+    notifier: "AsyncNotifier"
+
+
+_runtime: Optional[Runtime] = None
+
+
+def get_runtime() -> Tuple[Runtime, bool]:
+    """
+    実行環境取得
+
+    初回呼び出し（コールドスタート）時のみ、重いモジュール（intdash SDK・requests）を
+    読み込んで生成し、以降の呼び出し（ウォームスタート）では同じオブジェクトを返す
 
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
     Returns:
-        ApiClient: APIクライアント
+        tuple: (実行環境, コールドスタート)
     """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
+    global _runtime
+    if _runtime is not None:
+        return _runtime, False
+
+    import requests
+    from calculator.distance_calculator import DistanceCalculator
+    from client.client_factory import ClientFactory
+    from notifier.async_notifier import AsyncNotifier
+
+    config = Config.from_env()
+    _runtime = Runtime(
+        config=config,
+        factory=ClientFactory(
+            config.api_url, config.api_token, pool_maxsize=config.max_workers
+        ),
+        calculator=DistanceCalculator(config.origin),
+        notifier=AsyncNotifier(
+            config.api_url,
+            config.slack_url,
+            session=requests.Session(),
+            window=config.notify_window,
+        ),
     )
-    client = ApiClient(configuration)
-    return client
+    return _runtime, True
 
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+def process_measurement(runtime: Runtime, project_uuid: str, meas_uuid: str) -> None:
     """
-    エントリポイント
-
-    環境変数取得
-    イベント情報取得
-    距離算出サービス起動
+    計測1件の距離算出
 
     Args:
-        event (dict): Lambdaイベントオブジェクト
-        context (LambdaContext): Lambdaコンテキストオブジェクト
+        runtime (Runtime): 実行環境
+        project_uuid (str): プロジェクトUUID
+        meas_uuid (str): 計測UUID
     """
-    api_url = os.getenv("API_URL", "https://example.intdash.jp")
-    api_token = os.getenv("API_TOKEN", "<YOUR_API_TOKEN>")
-    fetch_size = int(os.getenv("FETCH_SIZE", 100))
-    origin_lat = float(os.getenv("ORIGIN_LAT", 35.6878973))
-    origin_lon = float(os.getenv("ORIGIN_LON", 139.7170926))
-    origin = (origin_lat, origin_lon)  # 会社
-    slack_url = os.getenv("SLACK_URL", "<YOUR_SLACK_WEBHOOK_URL>")
+    from reader.measurement_reader import MeasurementReader
+    from service.distance_service import DistanceService
+    from writer.measurement_writer import MeasurementWriter
 
+    config = runtime.config
+    logging.info(f"Processing project_uuid: {project_uuid}, meas_uuid: {meas_uuid}")
+    service = DistanceService(
+        MeasurementReader(runtime.factory, project_uuid, meas_uuid),
+        runtime.calculator,
+        MeasurementWriter(runtime.factory, project_uuid),
+        config.fetch_size,
+        runtime.notifier,
+    )
+    service.process()
+
+
+def process_event(runtime: Runtime, event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    単一イベント処理
+
+    Args:
+        runtime (Runtime): 実行環境
+        event (dict): Webhookイベント（project_uuid, measurement_uuid）
+
+    Returns:
+        dict: レスポンス（statusCode, body）
+    """
+    config = runtime.config
     project_uuid = event.get("project_uuid")
     meas_uuid = event.get("measurement_uuid")
 
-    if not api_url or not api_token or not project_uuid or not meas_uuid:
+    if not config.api_url or not config.api_token or not project_uuid or not meas_uuid:
         logging.error("Missing required parameters in the event.")
         return {"statusCode": 400, "body": "Missing required parameters."}
 
-    logging.info(f"Processing project_uuid: {project_uuid}, meas_uuid: {meas_uuid}")
-
     try:
-        client = get_client(api_url, api_token)
-        service = DistanceService(
-            MeasurementReader(client, project_uuid, meas_uuid),
-            DistanceCalculator(origin),
-            MeasurementWriter(client, project_uuid),
-            fetch_size,
-            Notifier(api_url, slack_url, project_uuid),
-        )
-        service.process()
-
+        process_measurement(runtime, project_uuid, meas_uuid)
         return {"statusCode": 200, "body": "Processing completed successfully."}
 
     except Exception as e:
         logging.error(f"Error: {str(e)}")
         logging.error(traceback.format_exc())
         return {"statusCode": 500, "body": "Internal server error."}
+
+
+def process_records(runtime: Runtime, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    バッチイベント処理（SQS）
+
+    レコードの body（Webhookイベント JSON）ごとに計測を max_workers 並列で処理する
+    - 同じ計測のレコードが重複している場合は1回だけ処理し、結果を共有する
+    - 失敗したレコードのみ batchItemFailures で返し、SQSに再送させる（部分バッチ応答）
+
+    Args:
+        runtime (Runtime): 実行環境
+        records (list): SQSレコード（messageId, body）
+
+    Returns:
+        dict: 部分バッチ応答（batchItemFailures）
+    """
+    failures: List[Dict[str, str]] = []
+    futures: Dict[Tuple[str, str], Future] = {}
+    targets: List[Tuple[str, Tuple[str, str]]] = []
+
+    with ThreadPoolExecutor(
+        max_workers=runtime.config.max_workers, thread_name_prefix="Distance"
+    ) as executor:
+        for record in records:
+            message_id = record.get("messageId", "")
+            try:
+                body = json.loads(record.get("body") or "{}")
+            except json.JSONDecodeError:
+                body = {}
+            project_uuid = body.get("project_uuid")
+            meas_uuid = body.get("measurement_uuid")
+            if not project_uuid or not meas_uuid:
+                logging.error(f"Missing required parameters in record: {message_id}")
+                failures.append({"itemIdentifier": message_id})
+                continue
+
+            key = (project_uuid, meas_uuid)
+            if key not in futures:
+                futures[key] = executor.submit(
+                    process_measurement, runtime, project_uuid, meas_uuid
+                )
+            targets.append((message_id, key))
+
+    for message_id, key in targets:
+        error = futures[key].exception()
+        if error:
+            logging.error(
+                f"Error in record {message_id} (meas_uuid: {key[1]}): {error}"
+            )
+            logging.error("".join(traceback.format_exception(error)))
+            failures.append({"itemIdentifier": message_id})
+
+    logging.info(
+        f"Processed records: {len(records)}, measurements: {len(futures)}, failures: {len(failures)}"
+    )
+    return {"batchItemFailures": failures}
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    エントリポイント
+
+    実行環境取得（コールドスタート時のみ環境変数読み込み・APIクライアント生成）
+    - 失敗した場合は 500 を返す（バッチイベントは全レコードを失敗として返す）
+    イベント情報取得
+    - Records あり: SQSのバッチイベント（計測を並列処理し、失敗したレコードを返す）
+    - Records なし: Webhookイベント1件
+    距離算出サービス起動
+
+    Args:
+        event (dict): Lambdaイベントオブジェクト
+        context (LambdaContext): Lambdaコンテキストオブジェクト
+    """
+    started = time.perf_counter()
+    try:
+        runtime, cold = get_runtime()
+    except Exception as e:
+        logging.error(f"Error: {str(e)}")
+        logging.error(traceback.format_exc())
+        if "Records" in event:
+            return {
+                "batchItemFailures": [
+                    {"itemIdentifier": record.get("messageId", "")}
+                    for record in event["Records"]
+                ]
+            }
+        return {"statusCode": 500, "body": "Internal server error."}
+    setup_ms = (time.perf_counter() - started) * 1000
+    start_type = "Cold" if cold else "Warm"
+    logging.info(f"{start_type} start: setup {setup_ms:.1f} ms")
+
+    try:
+        if "Records" in event:
+            return process_records(runtime, event["Records"])
+        return process_event(runtime, event)
+
+    finally:
+        # Slack通知（応答後はスレッドが停止するため、送信完了を待つ）
+        if not runtime.notifier.flush(timeout=runtime.notifier.timeout):
+            logging.warning("Slack notification did not finish before returning.")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logging.info(f"{start_type} invocation: {elapsed_ms:.1f} ms")
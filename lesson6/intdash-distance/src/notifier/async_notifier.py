@@ -0,0 +1,137 @@
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import requests
+
+from notifier.notifier import Notifier
+
+# flush() で送信スレッドの待機を打ち切るための目印
+_FLUSH = object()
+
+
+class AsyncNotifier(Notifier):
+    """
+    Slack通知（非同期・集約）
+
+    notify() は送信キューに積むだけで戻り、送信スレッドがSlackに送信する
+    - 最初の通知から window 秒以内に届いた通知（最大 max_items 件）を1つのメッセージにまとめる
+    - flush() で待機中の通知をすぐに送信し、送信完了まで待つ
+      （Lambdaは応答後にスレッドが停止するため、ハンドラーの終了前に呼ぶ）
+    - 送信失敗はログに出力し、呼び出し元には伝えない
+
+    Attributes:
+        window (float): 通知をまとめる時間（秒）
+        max_items (int): 1メッセージにまとめる最大件数
+        _queue (queue.Queue): 送信キュー
+        _pending (int): 送信未完了の通知数
+        _done (threading.Condition): 送信完了の通知
+        _flushing (threading.Event): flush() 中（待機せずに送信）
+        _thread (Optional[threading.Thread]): 送信スレッド
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        slack_url: str,
+        project_uuid: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10.0,
+        window: float = 1.0,
+        max_items: int = 20,
+    ) -> None:
+        super().__init__(api_url, slack_url, project_uuid, session, timeout)
+        self.window = window
+        self.max_items = max_items
+        self._queue: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._done = threading.Condition()
+        self._flushing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self, meas_uuid: str, project_uuid: Optional[str] = None) -> None:
+        """
+        通知（送信キューに追加）
+
+        Args:
+            meas_uuid (str): 計測UUID
+            project_uuid (Optional[str]): プロジェクトUUID
+        """
+        with self._done:
+            self._pending += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="AsyncNotifier", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((project_uuid or self.project_uuid, meas_uuid))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        送信待ち
+
+        Args:
+            timeout (Optional[float]): 最大待ち時間（秒）
+
+        Returns:
+            bool: True: 全件送信済み, False: タイムアウト
+        """
+        self._flushing.set()
+        self._queue.put(_FLUSH)
+        try:
+            with self._done:
+                return self._done.wait_for(lambda: self._pending == 0, timeout)
+        finally:
+            self._flushing.clear()
+
+    def _collect(
+        self, first: Tuple[Optional[str], str]
+    ) -> List[Tuple[Optional[str], str]]:
+        """
+        通知集約
+
+        Args:
+            first: 最初の通知
+
+        Returns:
+            list: まとめて送信する通知
+        """
+        items = [first]
+        deadline = time.monotonic() + self.window
+        while len(items) < self.max_items:
+            try:
+                if self._flushing.is_set():
+                    item = self._queue.get_nowait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _FLUSH:
+                continue
+            items.append(item)
+        return items
+
+    def _run(self) -> None:
+        """
+        送信スレッド
+        """
+        while True:
+            item = self._queue.get()
+            if item is _FLUSH:
+                continue
+
+            items = self._collect(item)
+            try:
+                self.post(self.build_message(items))
+                logging.info(f"Notified: {len(items)} measurements")
+            except Exception as e:
+                logging.error(f"Failed to notify: {e}")
+            finally:
+                with self._done:
+                    self._pending -= len(items)
+                    self._done.notify_all()
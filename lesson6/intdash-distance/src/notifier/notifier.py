@@ -1,8 +1,12 @@
 import json
 import logging
+from typing import List, Optional, Tuple
 
 import requests
 
+AUTHOR_ICON = "https://slack-imgs.com/?c=1&o1=wi32.he32.si&url=https%3A%2F%2Fintdash-fmm-map.s3.ap-northeast-1.amazonaws.com%2Fasset%2Fvm2m.png"
+FOOTER_ICON = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcTkbv74KdmChO7FenKcskkqIZTIYEMjJSisLjZVk5_O7pe-QKEBb1Kntdx-grb7dvdsNDs&usqp=CAU"
+
 
 class Notifier:
     """
@@ -11,52 +15,114 @@ class Notifier:
     Attributes:
         api_url (str): 接続するAPIのURL
         slack_url (str): 通知するSlackのIncoming Webhook URL
-        project_uuid (str): プロジェクトUUID
+        project_uuid (Optional[str]): プロジェクトUUID（notify() で省略した場合に使う）
+        session (Optional[requests.Session]): HTTPセッション（指定時は接続を使い回す）
+        timeout (float): 送信タイムアウト（秒）
     """
 
-    def __init__(self, api_url: str, slack_url: str, project_uuid: str) -> None:
+    def __init__(
+        self,
+        api_url: str,
+        slack_url: str,
+        project_uuid: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10.0,
+    ) -> None:
         self.api_url = api_url
         self.slack_url = slack_url
         self.project_uuid = project_uuid
+        self.session = session
+        self.timeout = timeout
 
-    def notify(self, meas_uuid: str) -> None:
+    def notify(self, meas_uuid: str, project_uuid: Optional[str] = None) -> None:
         """
         通知
 
         Args:
             meas_uuid (str): 計測UUID
+            project_uuid (Optional[str]): プロジェクトUUID
+        """
+        self.post(self.build_message([(project_uuid or self.project_uuid, meas_uuid)]))
+
+    def build_message(self, items: List[Tuple[Optional[str], str]]) -> dict:
         """
-        message = {
+        メッセージ作成
+
+        1件の場合は計測・プレイバック再生のリンクを個別の項目に、
+        複数件の場合は計測ごとに1項目にまとめる
+
+        Args:
+            items (list): (プロジェクトUUID, 計測UUID) のリスト
+
+        Returns:
+            dict: Slackメッセージ
+        """
+        if len(items) == 1:
+            project_uuid, meas_uuid = items[0]
+            title = "距離を算出しました"
+            fields = [
+                {
+                    "title": "計測",
+                    "value": self._meas_hub_link(project_uuid, meas_uuid),
+                },
+                {
+                    "title": "プレイバック再生",
+                    "value": self._visualizer_link(project_uuid, meas_uuid),
+                },
+            ]
+        else:
+            title = f"距離を算出しました（{len(items)}件）"
+            fields = [
+                {
+                    "title": f"計測 {meas_uuid}",
+                    "value": f"{self._meas_hub_link(project_uuid, meas_uuid)} / {self._visualizer_link(project_uuid, meas_uuid)}",
+                }
+                for project_uuid, meas_uuid in items
+            ]
+
+        return {
             "attachments": [
                 {
                     "color": "#00bfff",
                     "author_name": "Distance Service",
-                    "author_icon": "https://slack-imgs.com/?c=1&o1=wi32.he32.si&url=https%3A%2F%2Fintdash-fmm-map.s3.ap-northeast-1.amazonaws.com%2Fasset%2Fvm2m.png",
-                    "title": "距離を算出しました",
-                    "fields": [
-                        {
-                            "title": "計測",
-                            "value": f"<{self.api_url}/console/measurements/{meas_uuid}/?projectUuid={self.project_uuid}|Meas Hub>",
-                        },
-                        {
-                            "title": "プレイバック再生",
-                            "value": f"<{self.api_url}/vm2m/?projectUuid={self.project_uuid}&screenName=Distance&playMode=storedData&measUuid={meas_uuid}|Data Visualizer>",
-                        },
-                    ],
+                    "author_icon": AUTHOR_ICON,
+                    "title": title,
+                    "fields": fields,
                     "footer": "SDK入門⑥〜最速最高度で計測する日〜",
-                    "footer_icon": "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcTkbv74KdmChO7FenKcskkqIZTIYEMjJSisLjZVk5_O7pe-QKEBb1Kntdx-grb7dvdsNDs&usqp=CAU",
+                    "footer_icon": FOOTER_ICON,
                     "mrkdwn_in": ["text", "fields"],
                 }
             ]
         }
 
-        response = requests.post(
+    def post(self, message: dict) -> None:
+        """
+        送信
+
+        Args:
+            message (dict): Slackメッセージ
+        """
+        post = self.session.post if self.session else requests.post
+        response = post(
             self.slack_url,
             data=json.dumps(message),
             headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
         )
 
         if response.status_code != 200:
             logging.error(
                 f"Failed to notify Code: {response.status_code}, Response: {response.text}"
             )
+
+    def _meas_hub_link(self, project_uuid: Optional[str], meas_uuid: str) -> str:
+        """
+        Meas Hubリンク
+        """
+        return f"<{self.api_url}/console/measurements/{meas_uuid}/?projectUuid={project_uuid}|Meas Hub>"
+
+    def _visualizer_link(self, project_uuid: Optional[str], meas_uuid: str) -> str:
+        """
+        Data Visualizerリンク
+        """
+        return f"<{self.api_url}/vm2m/?projectUuid={project_uuid}&screenName=Distance&playMode=storedData&measUuid={meas_uuid}|Data Visualizer>"
@@ -3,10 +3,13 @@ import json
 import struct
 from datetime import datetime, timezone
 
-from intdash import ApiClient
-from intdash.api import (
-    measurement_service_data_points_api,
-    measurement_service_measurements_api,
+from client.client_factory import ClientFactory
+
+from intdash.api.measurement_service_data_points_api import (
+    MeasurementServiceDataPointsApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.measurement import Measurement
 
@@ -16,14 +19,16 @@ class MeasurementReader:
     計測取得
 
     Attributes:
-        client (ApiClient): APIクライアント
+        factory (ClientFactory): APIクライアント生成
         project_uuid (str): プロジェクトUUID
         meas_uuid (str): 計測UUID
         start (str): 日付時刻文字列
     """
 
-    def __init__(self, client: ApiClient, project_uuid: str, meas_uuid: str) -> None:
-        self.client = client
+    def __init__(
+        self, factory: ClientFactory, project_uuid: str, meas_uuid: str
+    ) -> None:
+        self.factory = factory
         self.project_uuid = project_uuid
         self.meas_uuid = meas_uuid
         self.start = datetime.fromtimestamp(0, tz=timezone.utc).isoformat()
@@ -35,9 +40,7 @@ class MeasurementReader:
         Returns:
             Measurement: 計測オブジェクト
         """
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         measurement = api.get_project_measurement(
             project_uuid=self.project_uuid, measurement_uuid=self.meas_uuid
         )
@@ -57,9 +60,7 @@ class MeasurementReader:
         Returns:
             list: 位置情報(time, lat, lon)のリスト
         """
-        api = measurement_service_data_points_api.MeasurementServiceDataPointsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceDataPointsApi)
         stream = api.list_project_data_points(
             project_uuid=self.project_uuid,
             name=self.meas_uuid,
@@ -99,5 +99,5 @@ class DistanceService:
         logging.info(f"Completed measurement: {measurement_dst.uuid}")
 
         # Slack通知
-        self.notifier.notify(measurement_dst.uuid)
+        self.notifier.notify(measurement_dst.uuid, self.writer.project_uuid)
         logging.info(f"Notified: {measurement_dst.uuid}")
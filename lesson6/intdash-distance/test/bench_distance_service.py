@@ -0,0 +1,141 @@
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+
+from calculator.distance_calculator import DistanceCalculator  # noqa: E402
+from fake_intdash import (  # noqa: E402
+    FakeClientFactory,
+    FakeIntdash,
+    NullNotifier,
+    SyntheticMeasurement,
+)
+from reader.measurement_reader import MeasurementReader  # noqa: E402
+from service.distance_service import DistanceService  # noqa: E402
+from writer.measurement_writer import MeasurementWriter  # noqa: E402
+
+# ログ設定
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+PROJECT_UUID = "00000000-0000-0000-0000-000000000000"
+ORIGIN = (35.6878973, 139.7170926)
+
+
+def percentile(values: list, p: int) -> float:
+    """
+    パーセンタイル
+
+    Args:
+        values (list): 値
+        p (int): パーセント（1〜99）
+
+    Returns:
+        float: パーセンタイル値
+    """
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+def bench(points: int, fetch_size: int, repeat: int, latency: float) -> dict:
+    """
+    距離算出サービス計測
+
+    合成計測を DistanceService.process で repeat 回処理し、
+    処理時間とフェッチ〜チャンク送信1回分（バッチ）の遅延を集計する
+
+    Args:
+        points (int): 合成計測のデータポイント数
+        fetch_size (int): フェッチ件数
+        repeat (int): 繰り返し回数
+        latency (float): スタンドインの呼び出しごとの待機時間（秒）
+
+    Returns:
+        dict: 計測結果
+    """
+    intdash = FakeIntdash(latency)
+    meas_uuid = intdash.add_measurement(SyntheticMeasurement(points))
+    factory = FakeClientFactory(intdash)
+
+    durations = []
+    batches = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        DistanceService(
+            MeasurementReader(factory, PROJECT_UUID, meas_uuid),
+            DistanceCalculator(ORIGIN),
+            MeasurementWriter(factory, PROJECT_UUID),
+            fetch_size,
+            NullNotifier(),
+        ).process()
+        durations.append(time.perf_counter() - started)
+
+    for times in intdash.chunk_times.values():
+        batches.extend(b - a for a, b in zip(times, times[1:]))
+
+    duration = statistics.median(durations)
+    return {
+        "points": points,
+        "seconds": duration,
+        "throughput": points / duration if duration else 0.0,
+        "p50_ms": percentile(batches, 50) * 1000,
+        "p99_ms": percentile(batches, 99) * 1000,
+        "stand_in": intdash.server_time / sum(durations) if durations else 0.0,
+    }
+
+
+def main(points: list, fetch_size: int, repeat: int, latency_ms: float) -> None:
+    """
+    メイン
+
+    Args:
+        points: 合成計測のデータポイント数リスト
+        fetch_size: フェッチ件数
+        repeat: 繰り返し回数
+        latency_ms: スタンドインの呼び出しごとの待機時間（ミリ秒）
+    """
+    print(
+        f"{'points':>10} {'seconds':>9} {'points/s':>11} {'batch p50':>10} {'batch p99':>10} {'stand-in':>9}"
+    )
+    for n in points:
+        r = bench(n, fetch_size, repeat, latency_ms / 1000)
+        print(
+            f"{r['points']:>10} {r['seconds']:>9.3f} {r['throughput']:>11.0f}"
+            f" {r['p50_ms']:>8.2f}ms {r['p99_ms']:>8.2f}ms {r['stand_in']:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark DistanceService against an in-process intdash stand-in"
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+        help="Data points per synthetic measurement (default: 1000 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--fetch_size", type=int, default=100, help="Fetch size (default: 100)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (default: 3)"
+    )
+    parser.add_argument(
+        "--latency_ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency per API call in ms (default: 0)",
+    )
+
+    args = parser.parse_args()
+    main(args.points, args.fetch_size, args.repeat, args.latency_ms)
@@ -3,3 +3,4 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../src"))
+sys.path.append(os.path.dirname(__file__))
@@ -0,0 +1,269 @@
+import base64
+import bisect
+import io
+import json
+import random
+import struct
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from gen.intdash.v1.protocol_pb2 import StoreDataChunks  # type: ignore
+
+EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+DATA_TYPE = "float"
+DATA_NAME = "1/gnss_coordinates"
+
+
+def to_ns(value: str) -> int:
+    """
+    RFC3339 → ナノ秒
+
+    Args:
+        value (str): 日付時刻文字列
+
+    Returns:
+        int: ナノ秒精度POSIX時刻
+    """
+    return (datetime.fromisoformat(value) - EPOCH) // timedelta(microseconds=1) * 1_000
+
+
+class FakeModel(SimpleNamespace):
+    """
+    レスポンスモデル（属性・辞書アクセス、to_dict() に対応）
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class SyntheticMeasurement:
+    """
+    合成計測
+
+    原点付近を移動する位置情報を interval_ns 間隔で生成する
+
+    Attributes:
+        uuid (str): 計測UUID
+        edge_uuid (str): エッジUUID
+        basetime (datetime): 基準時刻
+        times (List[int]): データポイントの絶対時刻（ナノ秒）
+        payloads (List[str]): 位置情報ペイロード（base64、緯度・経度 float64 ビッグエンディアン）
+    """
+
+    def __init__(
+        self,
+        points: int,
+        origin: tuple = (35.6878973, 139.7170926),
+        interval_ns: int = 100_000_000,
+        seed: int = 0,
+    ) -> None:
+        self.uuid = str(uuid.uuid4())
+        self.edge_uuid = str(uuid.uuid4())
+        self.basetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        basetime_ns = to_ns(self.basetime.isoformat())
+
+        rng = random.Random(seed)
+        lat, lon = origin
+        self.times: List[int] = []
+        self.payloads: List[str] = []
+        for i in range(points):
+            lat += rng.uniform(-1e-4, 1e-4)
+            lon += rng.uniform(-1e-4, 1e-4)
+            self.times.append(basetime_ns + i * interval_ns)
+            self.payloads.append(
+                base64.b64encode(struct.pack(">dd", lat, lon)).decode()
+            )
+
+
+class FakeIntdash:
+    """
+    intdash REST API のスタンドイン（プロセス内）
+
+    MeasurementReader / MeasurementWriter が使うAPIサービスオブジェクトのメソッドを実装する
+    - 計測取得・作成・完了・削除
+    - データポイント取得（JSON Lines、start・limit に対応）
+    - シーケンス置き換え・チャンク送信（Protocol Buffersをデコードしてデータポイント数を集計）
+    latency 指定時は各呼び出しで待機し、ネットワーク遅延を模擬する
+
+    Attributes:
+        latency (float): 呼び出しごとの待機時間（秒）
+        measurements (Dict[str, SyntheticMeasurement]): 元計測
+        created (Dict[str, FakeModel]): 作成された計測
+        received (Dict[str, int]): 作成された計測ごとの受信データポイント数
+        chunk_times (Dict[str, List[float]]): 作成された計測ごとのチャンク受信時刻
+        server_time (float): スタンドイン内の処理時間（秒、待機時間を除く）
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.measurements: Dict[str, SyntheticMeasurement] = {}
+        self.created: Dict[str, FakeModel] = {}
+        self.received: Dict[str, int] = {}
+        self.chunk_times: Dict[str, List[float]] = {}
+        self.server_time = 0.0
+        self._lock = threading.Lock()
+
+    def add_measurement(self, measurement: SyntheticMeasurement) -> str:
+        """
+        元計測登録
+
+        Args:
+            measurement (SyntheticMeasurement): 合成計測
+
+        Returns:
+            str: 計測UUID
+        """
+        self.measurements[measurement.uuid] = measurement
+        return measurement.uuid
+
+    def _wait(self) -> float:
+        if self.latency:
+            time.sleep(self.latency)
+        return time.perf_counter()
+
+    def _elapsed(self, started: float) -> None:
+        with self._lock:
+            self.server_time += time.perf_counter() - started
+
+    # MeasurementServiceMeasurementsApi
+    def get_project_measurement(
+        self, project_uuid: str, measurement_uuid: str, **kwargs: Any
+    ) -> FakeModel:
+        self._wait()
+        src = self.measurements[measurement_uuid]
+        return FakeModel(
+            uuid=src.uuid,
+            edge_uuid=src.edge_uuid,
+            name=f"Synthetic {len(src.times)} points",
+            basetime=src.basetime,
+            basetime_type="manual",
+            protected=False,
+        )
+
+    def create_project_measurement(
+        self, project_uuid: str, meas_create: Any, **kwargs: Any
+    ) -> FakeModel:
+        started = self._wait()
+        measurement = FakeModel(
+            uuid=str(uuid.uuid4()),
+            basetime=meas_create["basetime"],
+            ended=False,
+        )
+        with self._lock:
+            self.created[measurement.uuid] = measurement
+            self.received[measurement.uuid] = 0
+            self.chunk_times[measurement.uuid] = [time.perf_counter()]
+        self._elapsed(started)
+        return measurement
+
+    def complete_project_measurement(
+        self, project_uuid: str, measurement_uuid: str, **kwargs: Any
+    ) -> None:
+        self._wait()
+        self.created[measurement_uuid].ended = True
+
+    def delete_project_measurement(
+        self, project_uuid: str, measurement_uuid: str, **kwargs: Any
+    ) -> None:
+        self._wait()
+        with self._lock:
+            del self.created[measurement_uuid]
+
+    # MeasurementServiceDataPointsApi
+    def list_project_data_points(
+        self,
+        project_uuid: str,
+        name: str,
+        start: Optional[str] = None,
+        limit: Optional[int] = None,
+        **kwargs: Any,
+    ) -> io.BytesIO:
+        started = self._wait()
+        src = self.measurements[name]
+        begin = bisect.bisect_left(src.times, to_ns(start)) if start else 0
+        end = len(src.times) if limit is None else min(begin + limit, len(src.times))
+        lines = [
+            json.dumps(
+                {
+                    "time": src.times[i],
+                    "measurement_uuid": src.uuid,
+                    "data_type": DATA_TYPE,
+                    "data_name": DATA_NAME,
+                    "data": {"d": src.payloads[i]},
+                }
+            ).encode()
+            + b"\n"
+            for i in range(begin, end)
+        ]
+        self._elapsed(started)
+        return io.BytesIO(b"".join(lines))
+
+    # MeasurementServiceMeasurementSequencesApi
+    def replace_project_measurement_sequence(
+        self,
+        project_uuid: str,
+        measurement_uuid: str,
+        sequences_uuid: str,
+        **kwargs: Any,
+    ) -> FakeModel:
+        self._wait()
+        return FakeModel(uuid=sequences_uuid)
+
+    def create_project_measurement_sequence_chunks(
+        self, project_uuid: str, body: io.BytesIO, **kwargs: Any
+    ) -> FakeModel:
+        started = self._wait()
+        chunks = StoreDataChunks()
+        chunks.ParseFromString(body.read())
+        count = sum(
+            len(group.data_points)
+            for chunk in chunks.chunks
+            for group in chunk.data_point_groups
+        )
+        with self._lock:
+            self.received[chunks.meas_uuid] += count
+            self.chunk_times[chunks.meas_uuid].append(time.perf_counter())
+        self._elapsed(started)
+        return FakeModel(
+            items=[
+                FakeModel(sequence_number=chunk.sequence_number, result="ok")
+                for chunk in chunks.chunks
+            ]
+        )
+
+
+class FakeClientFactory:
+    """
+    APIクライアント生成のスタンドイン（全APIクラスに FakeIntdash を返す）
+
+    Attributes:
+        intdash (FakeIntdash): intdash REST API のスタンドイン
+    """
+
+    def __init__(self, intdash: FakeIntdash) -> None:
+        self.intdash = intdash
+
+    def api(self, api_class: type) -> FakeIntdash:
+        return self.intdash
+
+
+class NullNotifier:
+    """
+    Slack通知のスタンドイン（通知した計測を記録するだけ）
+
+    Attributes:
+        notified (List[str]): 通知した計測UUID
+    """
+
+    def __init__(self) -> None:
+        self.notified: List[str] = []
+
+    def notify(self, meas_uuid: str, project_uuid: Optional[str] = None) -> None:
+        self.notified.append(meas_uuid)
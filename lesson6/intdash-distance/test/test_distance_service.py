@@ -0,0 +1,48 @@
+from calculator.distance_calculator import DistanceCalculator
+from fake_intdash import (
+    FakeClientFactory,
+    FakeIntdash,
+    NullNotifier,
+    SyntheticMeasurement,
+)
+from reader.measurement_reader import MeasurementReader
+from service.distance_service import DistanceService
+from writer.measurement_writer import MeasurementWriter
+
+PROJECT_UUID = "00000000-0000-0000-0000-000000000000"
+ORIGIN = (35.6878973, 139.7170926)
+
+
+def run(intdash: FakeIntdash, meas_uuid: str, notifier: NullNotifier) -> None:
+    factory = FakeClientFactory(intdash)
+    DistanceService(
+        MeasurementReader(factory, PROJECT_UUID, meas_uuid),
+        DistanceCalculator(ORIGIN),
+        MeasurementWriter(factory, PROJECT_UUID),
+        100,
+        notifier,
+    ).process()
+
+
+def test_process_synthetic_measurement() -> None:
+    intdash = FakeIntdash()
+    meas_uuid = intdash.add_measurement(SyntheticMeasurement(1050))
+    notifier = NullNotifier()
+
+    run(intdash, meas_uuid, notifier)
+
+    (created,) = intdash.created.values()
+    assert created.ended
+    assert intdash.received[created.uuid] == 1050
+    assert notifier.notified == [created.uuid]
+
+
+def test_delete_empty_measurement() -> None:
+    intdash = FakeIntdash()
+    meas_uuid = intdash.add_measurement(SyntheticMeasurement(0))
+    notifier = NullNotifier()
+
+    run(intdash, meas_uuid, notifier)
+
+    assert not intdash.created
+    assert not notifier.notified
@@ -1,5 +1,7 @@
+import json
 import os
 
+import src.lambda_function as lambda_function
 from src.lambda_function import lambda_handler
 
 
@@ -29,3 +31,70 @@ def test_200_processed() -> None:
     except Exception as e:
         print(f"Error during test: {e}")
         raise
+
+
+def test_batch_item_failures() -> None:
+    try:
+        os.environ["API_URL"] = "https://example.intdash.jp"
+        os.environ["API_TOKEN"] = "<YOUR_API_TOKEN>"
+        os.environ["FETCH_SIZE"] = "100"
+        os.environ["ORIGIN_LAT"] = "35.6878973"
+        os.environ["ORIGIN_LON"] = "139.7170926"
+        os.environ["SLACK_URL"] = "<YOUR_SLACK_WEBHOOK_URL>"
+        os.environ["MAX_WORKERS"] = "4"
+
+        body = {
+            "project_uuid": "00000000-0000-0000-0000-000000000000",
+            "measurement_uuid": "1a14f158-2a0c-44c7-ace1-e0d21ecc93e9",
+            "resource_type": "measurement",
+            "action": "completed",
+        }
+        event = {
+            "Records": [
+                {"messageId": "<DUMMY_MESSAGE_ID_1>", "body": json.dumps(body)},
+                {
+                    "messageId": "<DUMMY_MESSAGE_ID_2>",
+                    "body": json.dumps({**body, "measurement_uuid": None}),
+                },
+            ]
+        }
+        context = None
+
+        result = lambda_handler(event, context)
+        assert result["batchItemFailures"] == [
+            {"itemIdentifier": "<DUMMY_MESSAGE_ID_2>"}
+        ]
+    except Exception as e:
+        print(f"Error during test: {e}")
+        raise
+
+
+def test_runtime_error() -> None:
+    try:
+        lambda_function._runtime = None
+        os.environ["FETCH_SIZE"] = "<INVALID_FETCH_SIZE>"
+
+        event = {
+            "project_uuid": "00000000-0000-0000-0000-000000000000",
+            "measurement_uuid": "1a14f158-2a0c-44c7-ace1-e0d21ecc93e9",
+        }
+        result = lambda_handler(event, None)
+        assert result["statusCode"] == 500
+        assert result["body"] == "Internal server error."
+
+        event = {
+            "Records": [
+                {"messageId": "<DUMMY_MESSAGE_ID_1>", "body": json.dumps(event)},
+                {"messageId": "<DUMMY_MESSAGE_ID_2>", "body": json.dumps(event)},
+            ]
+        }
+        result = lambda_handler(event, None)
+        assert result["batchItemFailures"] == [
+            {"itemIdentifier": "<DUMMY_MESSAGE_ID_1>"},
+            {"itemIdentifier": "<DUMMY_MESSAGE_ID_2>"},
+        ]
+    except Exception as e:
+        print(f"Error during test: {e}")
+        raise
+    finally:
+        os.environ["FETCH_SIZE"] = "100"
@@ -44,6 +44,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     - リソースタイプとアクションの判定
         計測完了以外は無視
     - 距離算出Lambdaを非同期起動
+        QUEUE_URL 指定時はSQSキューに送信し、距離算出Lambdaでまとめて処理する
 
     Args:
         event (dict): イベント
@@ -53,7 +54,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         dict: APIレスポンス
     """
     secret_key = os.getenv("SECRET_KEY", "")
-    lambda_client = boto3.client("lambda")
+    queue_url = os.getenv("QUEUE_URL", "")
 
     headers = event.get("headers", {})
     body = event.get("body", "{}")
@@ -81,8 +82,28 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "body": json.dumps({"message": "Resource_type or action ignored"}),
         }
 
+    # 距離算出キューに送信
+    if queue_url:
+        try:
+            response = boto3.client("sqs").send_message(
+                QueueUrl=queue_url, MessageBody=json.dumps(body_dict)
+            )
+            logger.info(f"Distance queue sent successfully: {response}")
+        except Exception as e:
+            logger.error(f"Failed to send Distance queue: {e}")
+            return {
+                "statusCode": 500,
+                "body": json.dumps({"message": "Failed to send Distance queue"}),
+            }
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({"message": "Webhook received and Distance queued"}),
+        }
+
     # 距離算出Lambdaを非同期起動
     try:
+        lambda_client = boto3.client("lambda")
         response = lambda_client.invoke(
             FunctionName="intdash-distance",
             InvocationType="Event",
@@ -3,10 +3,13 @@ import json
 from datetime import datetime
 from typing import Generator, Optional, Tuple
 
-from intdash import ApiClient
-from intdash.api import (
-    measurement_service_data_points_api,
-    measurement_service_measurements_api,
+from client.client_factory import ClientFactory
+
+from intdash.api.measurement_service_data_points_api import (
+    MeasurementServiceDataPointsApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 
 
@@ -15,7 +18,7 @@ class MeasurementReader:
     計測取得
 
     Attributes:
-        client (ApiClient): APIクライアント
+        factory (ClientFactory): APIクライアント生成
         project_uuid (str): プロジェクトUUID
         edge_uuid (str): エッジUUID
         meas_uuid (str): 計測UUID
@@ -26,7 +29,7 @@ class MeasurementReader:
 
     def __init__(
         self,
-        client: ApiClient,
+        factory: ClientFactory,
         project_uuid: str,
         edge_uuid: Optional[str] = None,
         meas_uuid: Optional[str] = None,
@@ -34,7 +37,7 @@ class MeasurementReader:
         end: Optional[str] = None,
         data_id_filter: Optional[list] = None,
     ) -> None:
-        self.client = client
+        self.factory = factory
         self.project_uuid = project_uuid
         self.edge_uuid = edge_uuid
         self.meas_uuid = meas_uuid
@@ -55,9 +58,7 @@ class MeasurementReader:
         if self.start:
             return datetime.fromisoformat(self.start)
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         measurement = api.get_project_measurement(
             project_uuid=self.project_uuid, measurement_uuid=self.meas_uuid
         )
@@ -85,9 +86,7 @@ class MeasurementReader:
                 データ（bytes）
         """
 
-        api = measurement_service_data_points_api.MeasurementServiceDataPointsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceDataPointsApi)
         params: dict[str, object] = {
             "project_uuid": self.project_uuid,
             "name": self.meas_uuid if self.meas_uuid else self.edge_uuid,
@@ -3,16 +3,17 @@ import asyncio
 import logging
 import sys
 import urllib
+from pathlib import Path
+from typing import Optional
 
 import iscp
+from client.client_factory import ClientFactory
 from reader.measurement_reader import MeasurementReader
+from sampler.resource_sampler import ResourceSampler
 from service.replay_service import ReplayService
 from upstreamer.upstreamer import Upstreamer
 from writer.measurement_writer import MeasurementWriter
 
-from intdash import ApiClient
-from intdash.configuration import Configuration
-
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -60,23 +61,6 @@ async def connect(
     return conn
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url: APIのURL
-        api_token: APIトークン
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
 async def main(
     src_api_url: str,
     src_api_token: str,
@@ -91,6 +75,8 @@ async def main(
     dst_project_uuid: str,
     dst_edge_uuid: str,
     speed: float,
+    sample_interval: float = 1.0,
+    resource_log: Optional[Path] = None,
 ) -> None:
     """
     メイン
@@ -109,6 +95,8 @@ async def main(
         dst_project_uuid (str): 新計測データ プロジェクトUUID
         dst_edge_uuid (str): 新計測データ エッジUUID
         speed (float): 再生スピード
+        sample_interval (float): リソース計測間隔（秒）
+        resource_log (Optional[Path]): リソース計測値の出力先（.csv / .json）
     """
     log_args = " ".join([f"{key}: {value}" for key, value in locals().items()])
     logging.info("Processing: " + log_args)
@@ -123,11 +111,11 @@ async def main(
             PING_INTERVAL,
             PING_TIMEOUT,
         )
-        src_client = get_client(src_api_url, src_api_token)
-        dst_client = get_client(dst_api_url, dst_api_token)
+        src_factory = ClientFactory(src_api_url, src_api_token)
+        dst_factory = ClientFactory(dst_api_url, dst_api_token)
         service = ReplayService(
             MeasurementReader(
-                src_client,
+                src_factory,
                 src_project_uuid,
                 src_edge_uuid,
                 src_meas_uuid,
@@ -137,9 +125,10 @@ async def main(
                 if data_id_filter
                 else None,
             ),
-            MeasurementWriter(dst_client, dst_project_uuid, dst_edge_uuid),
+            MeasurementWriter(dst_factory, dst_project_uuid, dst_edge_uuid),
             Upstreamer(conn),
             speed,
+            sampler=ResourceSampler(sample_interval, dump_path=resource_log),
         )
         await service.start(READ_TIMEOUT)
 
@@ -186,6 +175,18 @@ if __name__ == "__main__":
     )
     parser.add_argument("--dst_edge_uuid", required=False, help="Dest Edge UUID")
     parser.add_argument("--speed", type=float, default=1, help="Replay speed")
+    parser.add_argument(
+        "--sample_interval",
+        type=float,
+        default=1.0,
+        help="Resource sampling interval in seconds",
+    )
+    parser.add_argument(
+        "--resource_log",
+        type=Path,
+        default=None,
+        help="Output path of resource samples (.csv or .json)",
+    )
 
     args = parser.parse_args()
 
@@ -211,5 +212,7 @@ if __name__ == "__main__":
             args.dst_project_uuid,
             args.dst_edge_uuid if args.dst_edge_uuid else args.edge_uuid,
             args.speed,
+            args.sample_interval,
+            args.resource_log,
         )
     )
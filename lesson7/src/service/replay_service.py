@@ -1,11 +1,11 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import iscp
-import psutil
 from reader.measurement_reader import MeasurementReader
+from sampler.resource_sampler import ResourceSampler
 from upstreamer.upstreamer import Upstreamer
 from writer.measurement_writer import MeasurementWriter
 
@@ -22,17 +22,9 @@ class ReplayService:
         speed (float): 再生倍速（speed倍速でリプレイ）
         basetime (iscp.DateTime): 新計測の基準時刻
         datapoint_queue (asyncio.Queue): データポイントキュー
+        sampler (Optional[ResourceSampler]): リソースサンプラー
     """
 
-    @staticmethod
-    def log_memory_usage() -> None:
-        """
-        メモリ使用量出力
-        """
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        logging.info(f"Memory Usage: {mem_info.rss / 1024 / 1024:.2f} MB")
-
     def __init__(
         self,
         reader: MeasurementReader,
@@ -40,6 +32,7 @@ class ReplayService:
         upstreamer: Upstreamer,
         speed: float = 1,
         maxsize: int = 1000,
+        sampler: Optional[ResourceSampler] = None,
     ) -> None:
         self.reader = reader
         self.writer = writer
@@ -49,6 +42,9 @@ class ReplayService:
         self.datapoint_queue: asyncio.Queue[Tuple[int, str, str, Any]] = asyncio.Queue(
             maxsize=maxsize
         )
+        self.sampler = sampler
+        if self.sampler:
+            self.sampler.add_gauge("datapoint_queue", self.datapoint_queue.qsize)
 
     async def start(self, read_timeout: float = 60) -> None:
         """
@@ -57,6 +53,7 @@ class ReplayService:
         Args:
             read_timeout (float): キュー読み込みタイムアウト
 
+        リソースサンプラー開始
         リプレイ用計測作成
         アップストリーム開始
         基準時刻送信
@@ -70,7 +67,11 @@ class ReplayService:
             - 経過時間まで待機
             - データポイントをアップストリーム
         取得タイムアウト時に計測完了
+        リソースサンプラー停止（サマリー出力）
         """
+        if self.sampler:
+            self.sampler.start()
+
         try:
             # 計測作成
             measurement = self.writer.create_measurement("Created by ReplayService")
@@ -99,8 +100,12 @@ class ReplayService:
         except asyncio.CancelledError:
             pass
         finally:
-            self.writer.complete_measurement(measurement.uuid)
-            logging.info(f"Completed measurement: {measurement.uuid}")
+            try:
+                self.writer.complete_measurement(measurement.uuid)
+                logging.info(f"Completed measurement: {measurement.uuid}")
+            finally:
+                if self.sampler:
+                    self.sampler.stop()
 
     async def feed(self, basetime: datetime, sleep_time: float = 0.1) -> None:
         """
@@ -133,8 +138,6 @@ class ReplayService:
             logging.info(f"Put in Queue: {i} {elapsed_time}, {type}, {name}")
             i = i + 1
 
-            ReplayService.log_memory_usage()
-
     async def fetch(self, timeout: float) -> None:
         """
         データポイント取出
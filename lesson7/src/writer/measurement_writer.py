@@ -1,8 +1,9 @@
 from datetime import datetime, timezone
 
-from intdash import ApiClient
-from intdash.api import (
-    measurement_service_measurements_api,
+from client.client_factory import ClientFactory
+
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.meas_base_time_name import MeasBaseTimeName
 from intdash.model.meas_base_time_priority import MeasBaseTimePriority
@@ -16,13 +17,15 @@ class MeasurementWriter:
     計測作成
 
     Attributes:
-        client (ApiClient): APIクライアント
+        factory (ClientFactory): APIクライアント生成
         project_uuid (str): プロジェクトのUUID
         edge_uuid （str): エッジUUID
     """
 
-    def __init__(self, client: ApiClient, project_uuid: str, edge_uuid: str) -> None:
-        self.client = client
+    def __init__(
+        self, factory: ClientFactory, project_uuid: str, edge_uuid: str
+    ) -> None:
+        self.factory = factory
         self.project_uuid = project_uuid
         self.edge_uuid = edge_uuid
 
@@ -47,9 +50,7 @@ class MeasurementWriter:
             protected=False,
         )
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         measurement = api.create_project_measurement(
             self.project_uuid, meas_create=meas_create
         )
@@ -62,9 +63,7 @@ class MeasurementWriter:
         Args:
             measurement_uuid: 計測UUID
         """
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         api.complete_project_measurement(
             measurement_uuid=measurement_uuid, project_uuid=self.project_uuid
         )
@@ -0,0 +1,774 @@
+import asyncio
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+START_CODE = b"\x00\x00\x00\x01"
+
+# サンプル記述がH.264のもの
+AVC_FORMATS = (b"avc1", b"avc3")
+
+# サンプル記述がAACのもの
+AAC_FORMATS = (b"mp4a",)
+
+# サンプリング周波数インデックスに対応する周波数（Hz）
+AAC_SAMPLING_FREQUENCIES = (
+    96000,
+    88200,
+    64000,
+    48000,
+    44100,
+    32000,
+    24000,
+    22050,
+    16000,
+    12000,
+    11025,
+    8000,
+    7350,
+)
+
+# SBR/PS（HE-AAC）のAudio Object Type（コアのAudio Object Typeが続く）
+AAC_SBR_OBJECT_TYPES = (5, 29)
+
+# フレームのトラック種別（音声を含める場合にフレームの3番目の要素として返す）
+TRACK_VIDEO = "video"
+TRACK_AUDIO = "audio"
+
+# MP4の時刻の基準（1904-01-01T00:00:00Z）
+MP4_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)
+
+# 子ボックスを持つボックス
+CONTAINER_BOXES = (b"moov", b"trak", b"mdia", b"minf", b"stbl", b"edts")
+
+
+def iter_boxes(
+    buf: memoryview, start: int, end: int
+) -> Iterator[Tuple[bytes, int, int]]:
+    """
+    ボックス列挙
+
+    Args:
+        buf (memoryview): ファイル内容
+        start (int): 開始位置
+        end (int): 終了位置
+
+    Yields:
+        tuple: (ボックスタイプ, ペイロード開始位置, ボックス終了位置)
+
+    Raises:
+        ValueError: ボックスサイズが不正な場合
+    """
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buf, pos)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", buf, pos + 8)
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            raise ValueError(f"Invalid box size: {box_type!r} at {pos}")
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def read_uint32_table(buf: memoryview, pos: int, count: int, width: int = 1) -> array:
+    """
+    32bitビッグエンディアン整数テーブル読み込み
+
+    Args:
+        buf (memoryview): ファイル内容
+        pos (int): 開始位置
+        count (int): エントリー数
+        width (int): 1エントリーあたりの整数の数
+
+    Returns:
+        array: 整数配列（エントリー順に平坦化）
+    """
+    table = array("I")
+    table.frombytes(buf[pos : pos + count * width * 4])
+    if sys.byteorder == "little":
+        table.byteswap()
+    return table
+
+
+def read_creation_time(filepath: Path) -> Optional[datetime]:
+    """
+    作成日時読み込み（moov/mvhd）
+
+    Args:
+        filepath (Path): MP4ファイルパス
+
+    Returns:
+        Optional[datetime]: 作成日時（記録されていない場合はNone）
+    """
+    with (
+        open(filepath, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        buf = memoryview(mm)
+        try:
+            for box_type, start, end in iter_boxes(buf, 0, len(buf)):
+                if box_type != b"moov":
+                    continue
+                for child_type, child_start, _ in iter_boxes(buf, start, end):
+                    if child_type != b"mvhd":
+                        continue
+                    fmt = ">Q" if buf[child_start] == 1 else ">I"
+                    (seconds,) = struct.unpack_from(fmt, buf, child_start + 4)
+                    return MP4_EPOCH + timedelta(seconds=seconds) if seconds else None
+            return None
+        finally:
+            buf.release()
+
+
+@dataclass(slots=True)
+class Mp4Track:
+    """
+    トラック情報
+
+    Attributes:
+        handler (bytes): ハンドラータイプ（vide/soun など）
+        timescale (int): タイムスケール（1秒あたりの単位数）
+        sample_format (bytes): サンプル記述のフォーマット（avc1 など）
+        sample_entry (Optional[memoryview]): サンプル記述（フォーマット以降）
+        media_time (int): 編集リストの開始時刻（タイムスケール単位）
+        boxes (Dict[bytes, Tuple[int, int]]): stbl 内のボックス位置（ペイロード開始, 終了）
+    """
+
+    handler: bytes = b""
+    timescale: int = 0
+    sample_format: bytes = b""
+    sample_entry: Optional[memoryview] = None
+    media_time: int = 0
+    boxes: Dict[bytes, Tuple[int, int]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class SampleTable:
+    """
+    サンプルテーブル（デコード順）
+
+    Attributes:
+        offsets (List[int]): サンプル位置
+        sizes (array): サンプルサイズ
+        dts (List[int]): サンプルDTS（ナノ秒、編集リスト適用後）
+        pts (List[int]): サンプルPTS（ナノ秒、編集リスト適用後）
+        sync_samples (Optional[set]): 同期サンプルのインデックス（stss がない場合はNone）
+    """
+
+    offsets: List[int]
+    sizes: array
+    dts: List[int]
+    pts: List[int]
+    sync_samples: Optional[set] = None
+
+
+def adts_header(profile: int, sampling_index: int, channels: int, length: int) -> bytes:
+    """
+    ADTSヘッダー作成（CRCなし、7バイト）
+
+    Args:
+        profile (int): プロファイル（Audio Object Type - 1）
+        sampling_index (int): サンプリング周波数インデックス
+        channels (int): チャンネル構成
+        length (int): AACフレーム長（ヘッダーを除く）
+
+    Returns:
+        bytes: ADTSヘッダー
+    """
+    frame_length = length + 7
+    return bytes(
+        (
+            0xFF,
+            0xF1,  # MPEG-4, CRCなし
+            (profile << 6) | (sampling_index << 2) | (channels >> 2),
+            ((channels & 0x03) << 6) | (frame_length >> 11),
+            (frame_length >> 3) & 0xFF,
+            ((frame_length & 0x07) << 5) | 0x1F,
+            0xFC,
+        )
+    )
+
+
+def parse_audio_specific_config(config: bytes) -> Tuple[int, int, int]:
+    """
+    AudioSpecificConfig解析
+
+    ADTSヘッダーに書けるプロファイル・サンプリング周波数インデックス・チャンネル構成を求める
+    - Audio Object Type 31（拡張）、サンプリング周波数インデックス 15（周波数直接指定）に対応
+    - SBR/PS（HE-AAC）はコアのAudio Object Type（通常はAAC-LC）とコアの周波数を使う
+
+    Args:
+        config (bytes): AudioSpecificConfig
+
+    Returns:
+        Tuple[int, int, int]: プロファイル（Audio Object Type - 1）・サンプリング周波数インデックス・チャンネル構成
+
+    Raises:
+        ValueError: ADTSで表せない構成の場合
+    """
+    value = int.from_bytes(config, "big")
+    remaining = len(config) * 8
+
+    def read(bits: int) -> int:
+        nonlocal remaining
+        if remaining < bits:
+            raise ValueError("AudioSpecificConfig is truncated")
+        remaining -= bits
+        return (value >> remaining) & ((1 << bits) - 1)
+
+    def read_object_type() -> int:
+        object_type = read(5)
+        return 32 + read(6) if object_type == 31 else object_type
+
+    def read_sampling_index() -> int:
+        index = read(4)
+        if index != 15:
+            return index
+        frequency = read(24)
+        if frequency not in AAC_SAMPLING_FREQUENCIES:
+            raise ValueError(f"Unsupported AAC sampling frequency: {frequency}")
+        return AAC_SAMPLING_FREQUENCIES.index(frequency)
+
+    object_type = read_object_type()
+    sampling_index = read_sampling_index()
+    channels = read(4)
+    if object_type in AAC_SBR_OBJECT_TYPES:
+        read_sampling_index()  # 拡張（SBR）のサンプリング周波数
+        object_type = read_object_type()
+
+    if not 1 <= object_type <= 4:
+        raise ValueError(f"Unsupported AAC audio object type: {object_type}")
+    if sampling_index >= len(AAC_SAMPLING_FREQUENCIES):
+        raise ValueError(f"Unsupported AAC sampling frequency index: {sampling_index}")
+    if not 1 <= channels <= 7:
+        raise ValueError(f"Unsupported AAC channel configuration: {channels}")
+    return object_type - 1, sampling_index, channels
+
+
+class Mp4Demuxer:
+    """
+    MP4デマルチプレクサー
+
+    MP4ファイルをメモリマップし、moov/stbl のサンプルテーブルから
+    H.264トラックのサンプル位置・サイズ・PTSを求める。
+    フレームはmmapを切り出してAVCCの長さプレフィックスをスタートコードに置き換え、
+    Annex B形式で返す（IDRフレームの前にはSPS/PPSを付ける）。
+    Convertor と同じインターフェースで、GStreamerを使わずに UploadService に渡せる。
+
+    audio 指定時はAACトラックもADTSヘッダーを付けて返す。
+    映像・音声のサンプルはDTS順（音声はDTS=PTS）に混ぜて1回の読み出しで返すため、
+    ファイル内のインターリーブ順にほぼ先頭から読み進める。
+    映像はデコード順を保つため、PTSではなくDTSで並べる。
+
+    Attributes:
+        filepath (Path): MP4ファイルパス
+        audio (bool): AACトラックも返す
+        length_size (int): NALユニット長のバイト数
+        parameter_sets (bytes): SPS/PPS（Annex B形式）
+        video (Optional[SampleTable]): H.264トラックのサンプルテーブル
+        audio_table (Optional[SampleTable]): AACトラックのサンプルテーブル（音声なしはNone）
+        audio_config (Tuple[int, int, int]): ADTSのプロファイル・サンプリング周波数インデックス・チャンネル構成
+        order (List[Tuple[str, int]]): 返す順の（トラック種別, サンプルインデックス）（音声ありの場合）
+        position (int): 次に返すサンプルの位置
+    """
+
+    def __init__(self, filepath: Path, audio: bool = False) -> None:
+        """
+        コンストラクタ
+
+        Params:
+            filepath (Path): MP4ファイルパス
+            audio (bool): AACトラックも返す
+        """
+        self.filepath = filepath
+        self.audio = audio
+        self.length_size = 4
+        self.parameter_sets = b""
+        self.video: Optional[SampleTable] = None
+        self.audio_table: Optional[SampleTable] = None
+        self.audio_config = (1, 4, 2)
+        self.order: List[Tuple[str, int]] = []
+        self.position = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._buf: Optional[memoryview] = None
+
+    def start(self) -> None:
+        """
+        開始
+
+        ファイルをメモリマップしてサンプルテーブルを読み込む
+
+        Raises:
+            ValueError: H.264トラックがない、サンプルテーブルが不正、
+                またはAACの構成がADTSで表せない場合
+        """
+        self._file = open(self.filepath, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        self._buf = memoryview(self._mmap)
+
+        tracks = self._read_tracks(self._buf)
+        track = self._find_track(tracks)
+        self._read_avc_config(track)
+        self.video = self._read_sample_table(self._buf, track)
+
+        self.audio_table = None
+        if self.audio:
+            audio_track = next(
+                (
+                    t
+                    for t in tracks
+                    if t.handler == b"soun" and t.sample_format in AAC_FORMATS
+                ),
+                None,
+            )
+            if audio_track is None:
+                logging.warning(f"No AAC track found: {self.filepath}")
+            else:
+                self._read_aac_config(audio_track)
+                self.audio_table = self._read_sample_table(self._buf, audio_track)
+                self.order = [
+                    (kind, index)
+                    for _, _, kind, index in sorted(
+                        [(t, 0, TRACK_VIDEO, i) for i, t in enumerate(self.video.dts)]
+                        + [
+                            (t, 1, TRACK_AUDIO, i)
+                            for i, t in enumerate(self.audio_table.dts)
+                        ]
+                    )
+                ]
+        self.position = 0
+
+    def stop(self) -> None:
+        """
+        終了
+        """
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def fetch(self, size: int) -> list[tuple]:
+        """
+        フレーム取得
+
+        ページフォルトでイベントループを止めないよう、読み出しは別スレッドで行う
+
+        Args:
+            size (int): フェッチサイズ
+
+        Returns:
+            list:
+              (フレーム時刻(ns), 変換後フレームデータ)
+              音声ありの場合は (フレーム時刻(ns), フレームデータ, トラック種別)
+              終端時は空
+        """
+        return await asyncio.to_thread(self.read, size)
+
+    def read(self, size: int) -> list[tuple]:
+        """
+        フレーム読み出し
+
+        Args:
+            size (int): フェッチサイズ
+
+        Returns:
+            list: (フレーム時刻(ns), 変換後フレームデータ[, トラック種別])
+        """
+        if self._buf is None or self.video is None:
+            raise RuntimeError("Demuxer is not started")
+
+        if self.audio_table is None:
+            end = min(self.position + size, len(self.video.offsets))
+            frames: list = [
+                (self.video.pts[i], self.to_annexb(i))
+                for i in range(self.position, end)
+            ]
+        else:
+            end = min(self.position + size, len(self.order))
+            frames = [
+                (self.video.pts[i], self.to_annexb(i), kind)
+                if kind == TRACK_VIDEO
+                else (self.audio_table.pts[i], self.to_adts(i), kind)
+                for kind, i in self.order[self.position : end]
+            ]
+        self.position = end
+        return frames
+
+    def to_annexb(self, index: int) -> bytes:
+        """
+        AVCC→Annex B変換
+
+        同期サンプルにSPSがない場合は avcC のSPS/PPSを先頭に付ける
+
+        Args:
+            index (int): サンプルインデックス
+
+        Returns:
+            bytes: Annex B形式のフレーム
+
+        Raises:
+            ValueError: NALユニット長がサンプルを超える場合
+        """
+        buf = self._buf
+        video = self.video
+        pos = video.offsets[index]
+        end = pos + video.sizes[index]
+        parts: list = [b""]
+        has_sps = False
+
+        length_size = self.length_size
+        while pos + length_size <= end:
+            nal_size = int.from_bytes(buf[pos : pos + length_size], "big")
+            pos += length_size
+            if pos + nal_size > end:
+                raise ValueError(f"Invalid NAL unit size in sample {index}")
+            if nal_size and buf[pos] & 0x1F == 7:
+                has_sps = True
+            parts.append(START_CODE)
+            parts.append(buf[pos : pos + nal_size])
+            pos += nal_size
+
+        if not has_sps and (video.sync_samples is None or index in video.sync_samples):
+            parts[0] = self.parameter_sets
+        return b"".join(parts)
+
+    def to_adts(self, index: int) -> bytes:
+        """
+        AAC→ADTS変換
+
+        Args:
+            index (int): サンプルインデックス
+
+        Returns:
+            bytes: ADTSヘッダー付きのAACフレーム
+        """
+        table = self.audio_table
+        pos = table.offsets[index]
+        size = table.sizes[index]
+        return b"".join(
+            (adts_header(*self.audio_config, size), self._buf[pos : pos + size])
+        )
+
+    def _find_track(self, tracks: List[Mp4Track]) -> Mp4Track:
+        """
+        H.264トラック検索（最初の映像トラック）
+
+        Args:
+            tracks (List[Mp4Track]): トラック情報
+
+        Returns:
+            Mp4Track: トラック情報
+
+        Raises:
+            ValueError: H.264トラックがない場合
+        """
+        for track in tracks:
+            if track.handler == b"vide" and track.sample_format in AVC_FORMATS:
+                return track
+        raise ValueError(f"No H.264 track found: {self.filepath}")
+
+    def _read_tracks(self, buf: memoryview) -> List[Mp4Track]:
+        """
+        トラック読み込み
+
+        Args:
+            buf (memoryview): ファイル内容
+
+        Returns:
+            List[Mp4Track]: トラック情報
+        """
+        tracks = []
+        for box_type, start, end in iter_boxes(buf, 0, len(buf)):
+            if box_type != b"moov":
+                continue
+            for trak_type, trak_start, trak_end in iter_boxes(buf, start, end):
+                if trak_type == b"trak":
+                    track = Mp4Track()
+                    self._walk(buf, trak_start, trak_end, track)
+                    tracks.append(track)
+        return tracks
+
+    def _walk(
+        self,
+        buf: memoryview,
+        start: int,
+        end: int,
+        track: Mp4Track,
+        parent: bytes = b"trak",
+    ) -> None:
+        """
+        trak 内のボックス読み込み
+
+        トラック種別は mdia 直下の hdlr（メディアハンドラー）から取得する
+        （QuickTime形式の minf 直下の hdlr はデータハンドラーのため使わない）
+
+        Args:
+            buf (memoryview): ファイル内容
+            start (int): 開始位置
+            end (int): 終了位置
+            track (Mp4Track): トラック情報（読み込んだ内容を設定）
+            parent (bytes): 親ボックスの種別
+        """
+        for box_type, box_start, box_end in iter_boxes(buf, start, end):
+            if box_type in CONTAINER_BOXES:
+                self._walk(buf, box_start, box_end, track, box_type)
+            elif box_type == b"hdlr":
+                if parent != b"mdia":
+                    continue
+                track.handler = bytes(buf[box_start + 8 : box_start + 12])
+            elif box_type == b"mdhd":
+                offset = 20 if buf[box_start] == 1 else 12
+                (track.timescale,) = struct.unpack_from(">I", buf, box_start + offset)
+            elif box_type == b"elst":
+                version = buf[box_start]
+                (count,) = struct.unpack_from(">I", buf, box_start + 4)
+                fmt = ">Qq" if version == 1 else ">Ii"
+                pos = box_start + 8
+                for _ in range(count):
+                    _, media_time = struct.unpack_from(fmt, buf, pos)
+                    pos += struct.calcsize(fmt) + 4
+                    if media_time >= 0:  # 空の編集（-1）は読み飛ばす
+                        track.media_time = media_time
+                        break
+            elif box_type == b"stsd":
+                # version/flags(4) + entry_count(4) + size(4) + format(4)
+                (size,) = struct.unpack_from(">I", buf, box_start + 8)
+                track.sample_format = bytes(buf[box_start + 12 : box_start + 16])
+                track.sample_entry = buf[box_start + 16 : box_start + 8 + size]
+            else:
+                track.boxes[box_type] = (box_start, box_end)
+
+    def _read_avc_config(self, track: Mp4Track) -> None:
+        """
+        avcC（SPS/PPS・NALユニット長）読み込み
+
+        Args:
+            track (Mp4Track): トラック情報
+
+        Raises:
+            ValueError: avcC がない場合
+        """
+        entry = track.sample_entry
+        # VisualSampleEntry: reserved(6) + data_reference_index(2) + 70バイトの固定項目
+        for box_type, start, _ in iter_boxes(entry, 78, len(entry)):
+            if box_type != b"avcC":
+                continue
+            self.length_size = (entry[start + 4] & 0x03) + 1
+            parameter_sets = []
+            pos = start + 5
+            for mask in (0x1F, 0xFF):  # SPS数は下位5bit、PPS数は8bit
+                count = entry[pos] & mask
+                pos += 1
+                for _ in range(count):
+                    (length,) = struct.unpack_from(">H", entry, pos)
+                    pos += 2
+                    parameter_sets.append(START_CODE + bytes(entry[pos : pos + length]))
+                    pos += length
+            self.parameter_sets = b"".join(parameter_sets)
+            return
+        raise ValueError(f"No avcC found: {self.filepath}")
+
+    def _read_aac_config(self, track: Mp4Track) -> None:
+        """
+        esds（AudioSpecificConfig）読み込み
+
+        Args:
+            track (Mp4Track): トラック情報
+
+        Raises:
+            ValueError: esds・AudioSpecificConfig がない、またはADTSで表せない構成の場合
+        """
+        entry = track.sample_entry
+        # AudioSampleEntry: reserved(6) + data_reference_index(2) + 20バイトの固定項目
+        # （QuickTimeのバージョン1は16バイト、バージョン2は36バイト追加）
+        (version,) = struct.unpack_from(">H", entry, 8)
+        start = 28 + {1: 16, 2: 36}.get(version, 0)
+        for box_type, box_start, box_end in iter_boxes(entry, start, len(entry)):
+            if box_type != b"esds":
+                continue
+            config = self._find_descriptor(entry, box_start + 4, box_end, 0x05)
+            if config is None or len(config) < 2:
+                break
+            try:
+                self.audio_config = parse_audio_specific_config(config)
+            except ValueError as e:
+                raise ValueError(f"{e}: {self.filepath}") from e
+            return
+        raise ValueError(f"No AudioSpecificConfig found: {self.filepath}")
+
+    def _find_descriptor(
+        self, buf: memoryview, pos: int, end: int, tag: int
+    ) -> Optional[bytes]:
+        """
+        ES記述子検索（ES_Descriptor → DecoderConfigDescriptor → DecoderSpecificInfo）
+
+        Args:
+            buf (memoryview): 記述子を含むデータ
+            pos (int): 開始位置
+            end (int): 終了位置
+            tag (int): 検索するタグ
+
+        Returns:
+            Optional[bytes]: 記述子の内容（ない場合はNone）
+        """
+        while pos + 2 <= end:
+            current = buf[pos]
+            pos += 1
+            size = 0
+            for _ in range(4):  # 長さは1〜4バイト（上位ビットが継続フラグ）
+                byte = buf[pos]
+                pos += 1
+                size = (size << 7) | (byte & 0x7F)
+                if not byte & 0x80:
+                    break
+            if current == tag:
+                return bytes(buf[pos : pos + size])
+            if current == 0x03:  # ES_Descriptor: ES_ID(2) + フラグ(1) + 可変項目
+                flags = buf[pos + 2]
+                skip = 3
+                if flags & 0x80:
+                    skip += 2
+                if flags & 0x40:
+                    skip += 1 + buf[pos + skip]
+                if flags & 0x20:
+                    skip += 2
+                return self._find_descriptor(buf, pos + skip, pos + size, tag)
+            if current == 0x04:  # DecoderConfigDescriptor: 固定項目(13)
+                return self._find_descriptor(buf, pos + 13, pos + size, tag)
+            pos += size
+        return None
+
+    def _read_sample_table(self, buf: memoryview, track: Mp4Track) -> SampleTable:
+        """
+        サンプルテーブル読み込み
+
+        - stsz: サンプルサイズ
+        - stsc/stco/co64: チャンク位置からサンプル位置を算出
+        - stts/ctts: DTS・コンポジションオフセットからPTSを算出
+        - stss: 同期サンプル
+
+        Args:
+            buf (memoryview): ファイル内容
+            track (Mp4Track): トラック情報
+
+        Returns:
+            SampleTable: サンプルテーブル
+
+        Raises:
+            ValueError: 必須のボックスがない場合
+        """
+        boxes = track.boxes
+        for box_type in (b"stsz", b"stsc", b"stts"):
+            if box_type not in boxes:
+                raise ValueError(f"No {box_type.decode()} found: {self.filepath}")
+
+        # stsz
+        pos = boxes[b"stsz"][0]
+        sample_size, sample_count = struct.unpack_from(">II", buf, pos + 4)
+        if sample_size:
+            sizes = array("I", [sample_size]) * sample_count
+        else:
+            sizes = read_uint32_table(buf, pos + 12, sample_count)
+
+        # stco/co64
+        if b"co64" in boxes:
+            pos = boxes[b"co64"][0]
+            (count,) = struct.unpack_from(">I", buf, pos + 4)
+            chunk_offsets = list(struct.unpack_from(f">{count}Q", buf, pos + 8))
+        elif b"stco" in boxes:
+            pos = boxes[b"stco"][0]
+            (count,) = struct.unpack_from(">I", buf, pos + 4)
+            chunk_offsets = read_uint32_table(buf, pos + 8, count).tolist()
+        else:
+            raise ValueError(f"No stco/co64 found: {self.filepath}")
+
+        # stsc: (first_chunk, samples_per_chunk, sample_description_index)
+        pos = boxes[b"stsc"][0]
+        (count,) = struct.unpack_from(">I", buf, pos + 4)
+        stsc = read_uint32_table(buf, pos + 8, count, 3)
+        offsets: List[int] = []
+        sample = 0
+        for i in range(count):
+            first_chunk, samples_per_chunk = stsc[i * 3], stsc[i * 3 + 1]
+            last_chunk = stsc[(i + 1) * 3] if i + 1 < count else len(chunk_offsets) + 1
+            for chunk in range(first_chunk - 1, last_chunk - 1):
+                offset = chunk_offsets[chunk]
+                for _ in range(samples_per_chunk):
+                    offsets.append(offset)
+                    offset += sizes[sample]
+                    sample += 1
+        if sample != sample_count:
+            raise ValueError(
+                f"Sample count mismatch: stsz {sample_count}, stsc {sample}: {self.filepath}"
+            )
+
+        # stts: (sample_count, sample_delta)
+        pos = boxes[b"stts"][0]
+        (count,) = struct.unpack_from(">I", buf, pos + 4)
+        stts = read_uint32_table(buf, pos + 8, count, 2)
+        dts: List[int] = []
+        time = 0
+        for i in range(count):
+            for _ in range(stts[i * 2]):
+                dts.append(time)
+                time += stts[i * 2 + 1]
+        if len(dts) < sample_count:
+            raise ValueError(
+                f"Sample count mismatch: stsz {sample_count}, stts {len(dts)}: {self.filepath}"
+            )
+
+        # ctts: (sample_count, sample_offset)（version 1 は符号付き）
+        composition = [0] * sample_count
+        if b"ctts" in boxes:
+            pos = boxes[b"ctts"][0]
+            version = buf[pos]
+            (count,) = struct.unpack_from(">I", buf, pos + 4)
+            ctts = read_uint32_table(buf, pos + 8, count, 2)
+            sample = 0
+            for i in range(count):
+                offset = ctts[i * 2 + 1]
+                if version == 1 and offset >= 0x80000000:
+                    offset -= 0x100000000
+                for _ in range(ctts[i * 2]):
+                    composition[sample] = offset
+                    sample += 1
+
+        timescale = track.timescale or 1
+        media_time = track.media_time
+        table = SampleTable(
+            offsets=offsets,
+            sizes=sizes,
+            dts=[
+                (dts[i] - media_time) * 1_000_000_000 // timescale
+                for i in range(sample_count)
+            ],
+            pts=[
+                (dts[i] + composition[i] - media_time) * 1_000_000_000 // timescale
+                for i in range(sample_count)
+            ],
+        )
+
+        # stss（1始まり）
+        if b"stss" in boxes:
+            pos = boxes[b"stss"][0]
+            (count,) = struct.unpack_from(">I", buf, pos + 4)
+            table.sync_samples = {n - 1 for n in read_uint32_table(buf, pos + 8, count)}
+        return table
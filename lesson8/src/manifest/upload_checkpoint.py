@@ -0,0 +1,138 @@
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from manifest.upload_manifest import UploadManifest
+
+STATUS_UPLOADING = "uploading"
+CHECKPOINT_INTERVAL = 1.0  # 受理記録の保存間隔（秒）
+CHECKPOINT_FRAMES = 1000  # 受理記録を保存するフレーム数
+
+
+class UploadCheckpoint:
+    """
+    アップロードチェックポイント
+
+    ファイルの計測UUID・シーケンスUUID・先頭から連続して受理された
+    最後のシーケンス番号とそのフレームのPTSをアップロード記録に保存する。
+    再開時はこの記録から計測・シーケンスを引き継ぐ。
+
+    受理記録はメモリ上で更新し、前回の保存から interval 秒経過するか
+    frames フレーム進んだ場合に保存が必要（due）とする。保存（flush）は
+    呼び出し側がイベントループ外で行う。
+
+    Attributes:
+        manifest (UploadManifest): アップロード記録
+        filepath (Path): MP4ファイルパス
+        interval (float): 受理記録の保存間隔（秒）
+        frames (int): 受理記録を保存するフレーム数
+    """
+
+    def __init__(
+        self,
+        manifest: UploadManifest,
+        filepath: Path,
+        interval: float = CHECKPOINT_INTERVAL,
+        frames: int = CHECKPOINT_FRAMES,
+    ) -> None:
+        self.manifest = manifest
+        self.filepath = filepath
+        self.interval = interval
+        self.frames = frames
+        self._pending: Optional[Tuple[int, int]] = None
+        self._saved = 0
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        読み込み
+
+        Returns:
+            Optional[dict]: アップロード途中の記録（ない場合はNone）
+        """
+        entry = self.manifest.get(self.filepath)
+        if entry is None or entry.get("status") != STATUS_UPLOADING:
+            return None
+        return entry
+
+    def start(
+        self, measurement_uuid: str, sequence_uuid: str, basetime: datetime
+    ) -> None:
+        """
+        記録開始
+
+        Args:
+            measurement_uuid (str): 作成した計測UUID
+            sequence_uuid (str): シーケンスUUID
+            basetime (datetime): 計測の基準時刻
+        """
+        self.manifest.update(
+            self.filepath,
+            status=STATUS_UPLOADING,
+            measurement_uuid=measurement_uuid,
+            sequence_uuid=sequence_uuid,
+            basetime=basetime.isoformat(),
+            acknowledged=0,
+            acknowledged_pts=None,
+        )
+        with self._lock:
+            self._pending = None
+            self._saved = 0
+            self._saved_at = time.monotonic()
+
+    def ack(self, acknowledged: int, pts: int) -> None:
+        """
+        受理記録（保存は flush で行う）
+
+        Args:
+            acknowledged (int): 先頭から連続して受理された最後のシーケンス番号
+            pts (int): そのシーケンス番号のフレームのPTS（ナノ秒）
+        """
+        with self._lock:
+            self._pending = (acknowledged, pts)
+
+    @property
+    def due(self) -> bool:
+        """
+        受理記録の保存要否
+        """
+        with self._lock:
+            if self._pending is None:
+                return False
+            return (
+                self._pending[0] - self._saved >= self.frames
+                or time.monotonic() - self._saved_at >= self.interval
+            )
+
+    def flush(self) -> None:
+        """
+        受理記録保存
+
+        未保存の受理記録があれば保存する。
+        保存は直列に行い、常にその時点の最新の受理記録を書き込む。
+        """
+        with self._save_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = None
+                if pending is None:
+                    return
+                self._saved, _ = pending
+                self._saved_at = time.monotonic()
+            acknowledged, pts = pending
+            self.manifest.update(
+                self.filepath, acknowledged=acknowledged, acknowledged_pts=pts
+            )
+
+    def complete(self, measurement_uuid: str) -> None:
+        """
+        計測完了記録
+
+        Args:
+            measurement_uuid (str): 計測UUID
+        """
+        self.manifest.complete(self.filepath, measurement_uuid)
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+STATUS_COMPLETED = "completed"
+
+
+class UploadManifest:
+    """
+    アップロード記録
+
+    ファイルごとのアップロード状態をJSONファイルに保存する。
+    ファイルのサイズ・更新日時が記録時と異なる場合は別のファイルとして扱う。
+    保存は一時ファイルへの書き込み後に置き換えるため、途中で停止しても壊れない。
+
+    Attributes:
+        path (Path): 記録ファイルパス
+        entries (Dict[str, Dict[str, Any]]): ファイルパス（絶対パス）ごとの記録
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("files", {})
+
+    @staticmethod
+    def key(filepath: Path) -> str:
+        """
+        記録キー（絶対パス）
+        """
+        return str(filepath.resolve())
+
+    @staticmethod
+    def stat(filepath: Path) -> Dict[str, int]:
+        """
+        ファイルのサイズ・更新日時
+        """
+        st = filepath.stat()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def get(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """
+        記録取得
+
+        Args:
+            filepath (Path): ファイルパス
+
+        Returns:
+            Optional[dict]: 記録（ないか、ファイルが変更されている場合はNone）
+        """
+        with self._lock:
+            entry = self.entries.get(self.key(filepath))
+        if entry is None:
+            return None
+        stat = self.stat(filepath)
+        if any(entry.get(k) != v for k, v in stat.items()):
+            return None
+        return dict(entry)
+
+    def is_completed(self, filepath: Path) -> bool:
+        """
+        アップロード完了済み判定
+
+        Args:
+            filepath (Path): ファイルパス
+
+        Returns:
+            bool: True: 完了済み
+        """
+        entry = self.get(filepath)
+        return entry is not None and entry.get("status") == STATUS_COMPLETED
+
+    def update(self, filepath: Path, **fields: Any) -> None:
+        """
+        記録更新・保存
+
+        Args:
+            filepath (Path): ファイルパス
+            fields: 記録する項目
+        """
+        with self._lock:
+            key = self.key(filepath)
+            entry = self.entries.get(key, {})
+            entry.update(fields)
+            entry.update(self.stat(filepath))
+            entry["updated_at"] = datetime.now(tz=timezone.utc).isoformat()
+            self.entries[key] = entry
+            self._save()
+
+    def complete(self, filepath: Path, measurement_uuid: str) -> None:
+        """
+        アップロード完了記録
+
+        Args:
+            filepath (Path): ファイルパス
+            measurement_uuid (str): 計測UUID
+        """
+        self.update(
+            filepath, status=STATUS_COMPLETED, measurement_uuid=measurement_uuid
+        )
+
+    def _save(self) -> None:
+        """
+        保存（一時ファイルに書き込んでから置き換える）
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"files": self.entries}, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
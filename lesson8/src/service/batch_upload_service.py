@@ -0,0 +1,180 @@
+import asyncio
+import glob
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from convertor.mp4_demuxer import read_creation_time
+from manifest.upload_checkpoint import UploadCheckpoint
+from manifest.upload_manifest import UploadManifest
+from service.upload_service import UploadService
+
+
+@dataclass(slots=True)
+class FileResult:
+    """
+    ファイルアップロード結果
+
+    Attributes:
+        filepath (Path): MP4ファイルパス
+        status (str): 結果（completed/skipped/cancelled/failed）
+        measurement_uuid (Optional[str]): 計測UUID
+        error (Optional[Exception]): 失敗時の例外
+    """
+
+    filepath: Path
+    status: str
+    measurement_uuid: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+def find_files(src: Path, pattern: str = "*.mp4") -> List[Path]:
+    """
+    アップロード対象ファイル検索
+
+    Args:
+        src (Path): ファイル、ディレクトリ（pattern に一致するファイル）、またはglobパターン
+        pattern (str): ディレクトリ指定時のglobパターン
+
+    Returns:
+        List[Path]: ファイルパス（名前順）
+    """
+    if src.is_dir():
+        return sorted(p for p in src.glob(pattern) if p.is_file())
+    if src.exists():
+        return [src]
+    return sorted(Path(p) for p in glob.glob(str(src)) if Path(p).is_file())
+
+
+def derive_basetime(filepath: Path) -> datetime:
+    """
+    基準時刻算出
+
+    MP4（mvhd）の作成日時、記録されていない場合はファイルの更新日時
+
+    Args:
+        filepath (Path): MP4ファイルパス
+
+    Returns:
+        datetime: 基準時刻
+    """
+    try:
+        created = read_creation_time(filepath)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Failed to read creation time: {filepath}: {e}")
+        created = None
+    if created:
+        return created
+    return datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
+
+
+class BatchUploadService:
+    """
+    複数ファイルアップロードサービス
+
+    ファイルごとに計測を作成し、最大 max_files ファイルを並列にアップロードする
+    - アップロード記録で完了済みのファイルはスキップする
+    - アップロード記録がある場合はファイルごとのチェックポイントを MeasurementWriter に渡し、
+      resume 指定時はアップロード途中のファイルを続きから送信する
+    - 失敗したファイルがあっても他のファイルは続行する
+
+    Attributes:
+        create_service (Callable[[Path, Optional[UploadCheckpoint]], UploadService]):
+            ファイルごとのアップロードサービス作成
+        data_name (str): データ名
+        manifest (Optional[UploadManifest]): アップロード記録
+        max_files (int): 同時にアップロードするファイル数
+        resume (bool): アップロード途中のファイルを続きから送信
+    """
+
+    def __init__(
+        self,
+        create_service: Callable[[Path, Optional[UploadCheckpoint]], UploadService],
+        data_name: str,
+        manifest: Optional[UploadManifest] = None,
+        max_files: int = 2,
+        resume: bool = False,
+    ) -> None:
+        self.create_service = create_service
+        self.data_name = data_name
+        self.manifest = manifest
+        self.max_files = max_files
+        self.resume = resume
+
+    async def start(
+        self, files: List[Path], basetime: Optional[datetime] = None
+    ) -> List[FileResult]:
+        """
+        開始
+
+        Args:
+            files (List[Path]): MP4ファイルパス
+            basetime (Optional[datetime]): 基準時刻（省略時はファイルごとに算出）
+
+        Returns:
+            List[FileResult]: ファイルごとの結果（files と同じ順）
+        """
+        semaphore = asyncio.Semaphore(self.max_files)
+
+        async def run(filepath: Path) -> FileResult:
+            async with semaphore:
+                try:
+                    return await self.upload(filepath, basetime)
+                except Exception as e:
+                    logging.error(f"Failed to upload {filepath}: {e}", exc_info=True)
+                    return FileResult(filepath, "failed", error=e)
+
+        results = await asyncio.gather(*(run(f) for f in files))
+
+        counts = {
+            s: sum(r.status == s for r in results)
+            for s in ("completed", "skipped", "cancelled", "failed")
+        }
+        logging.info(
+            f"Files: {len(results):,} "
+            + " ".join(f"{k}: {v:,}" for k, v in counts.items())
+        )
+        return list(results)
+
+    async def upload(
+        self, filepath: Path, basetime: Optional[datetime] = None
+    ) -> FileResult:
+        """
+        ファイルアップロード
+
+        Args:
+            filepath (Path): MP4ファイルパス
+            basetime (Optional[datetime]): 基準時刻（省略時はファイルから算出）
+
+        Returns:
+            FileResult: 結果
+        """
+        if self.manifest and self.manifest.is_completed(filepath):
+            entry = self.manifest.get(filepath) or {}
+            logging.info(f"Skipped uploaded file: {filepath}")
+            return FileResult(filepath, "skipped", entry.get("measurement_uuid"))
+
+        basetime = basetime or derive_basetime(filepath)
+        logging.info(f"Uploading {filepath} basetime: {basetime.isoformat()}")
+
+        checkpoint = (
+            UploadCheckpoint(self.manifest, filepath) if self.manifest else None
+        )
+        service = self.create_service(filepath, checkpoint)
+        try:
+            completed = await service.start(
+                filepath, self.data_name, basetime, self.resume
+            )
+        finally:
+            await service.close()
+
+        measurement = service.writer.measurement
+        if not completed:
+            return FileResult(
+                filepath, "cancelled", measurement.uuid if measurement else None
+            )
+
+        logging.info(f"Uploaded {filepath} measurement: {measurement.uuid}")
+        return FileResult(filepath, "completed", measurement.uuid)
@@ -1,10 +1,18 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Set, Union
 
-from convertor.convertor import Convertor
-from writer.measurement_writer import MeasurementWriter
+from writer.measurement_writer import ChunkBatch, MeasurementWriter
+
+if TYPE_CHECKING:
+    from convertor.convertor import Convertor
+    from convertor.mp4_demuxer import Mp4Demuxer
+
+# チャンク送信リトライの初回待ち時間（秒、以降は2倍ずつ）
+RETRY_BACKOFF = 0.5
 
 
 class UploadService:
@@ -12,23 +20,44 @@ class UploadService:
     動画アップロードサービス
 
     MP4ファイル変換Gstreamerパイプライン、計測作成、フレーム送信を管理する
+    フレーム取得とチャンク送信はパイプライン化し、送信の完了を待たずに次のフレームを取得する
 
     Attributes:
-        convertor (Convertor): AVCC→AnnexBコンバーター
+        convertor (Union[Convertor, Mp4Demuxer]): AVCC→AnnexBコンバーター
         writer (MeasurementWriter): 計測作成
+        fetch_size (int): 1チャンク送信あたりのフレーム数
+        max_in_flight (int): 同時に送信するチャンク送信数
+        max_retries (int): チャンク送信のリトライ回数
+        audio_data_name (str): 音声のデータ名（コンバーターが音声フレームを返す場合）
+
+    MeasurementWriter にチェックポイントを指定した場合
+    - 失敗・中断時は計測を完了せず、再開できるようにする
+    - resume 指定時はチェックポイントの計測に、受理済みのフレームを読み飛ばして続きから送信する
     """
 
     def __init__(
         self,
-        convertor: Convertor,
+        convertor: Union["Convertor", "Mp4Demuxer"],
         writer: MeasurementWriter,
         fetch_size: int = 100,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        audio_data_name: str = "audio/aac",
     ) -> None:
         self.convertor = convertor
         self.writer = writer
         self.fetch_size = fetch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.audio_data_name = audio_data_name
 
-    async def start(self, filepath: Path, data_name: str, basetime: datetime) -> None:
+    async def start(
+        self,
+        filepath: Path,
+        data_name: str,
+        basetime: datetime,
+        resume: bool = False,
+    ) -> bool:
         """
         開始
 
@@ -36,8 +65,12 @@ class UploadService:
             filepath (Path): MP4ファイルパス
             data_name (str): データ名
             basetime (datetime): 基準時刻
+            resume (bool): チェックポイントから再開
+
+        Returns:
+            bool: True: 全フレーム送信済み, False: 中断
 
-        計測作成
+        計測作成（再開時はチェックポイントの計測を取得）
         Gstreamerパイプライン開始
         以下を実行
         - フレーム送信
@@ -45,26 +78,63 @@ class UploadService:
             - チャンク送信
         計測完了
         """
+        checkpoint = self.writer.checkpoint
+        completed = False
         try:
-            measurement = self.writer.create_measurement(
-                f"Created from {filepath.name}",
-                basetime,
-            )
-            logging.info(f"Created measurement: {measurement.uuid}")
+            state = checkpoint.load() if checkpoint else None
+            if state and resume:
+                measurement = self.writer.resume_measurement(
+                    state["measurement_uuid"],
+                    state["sequence_uuid"],
+                    state["acknowledged"],
+                )
+                logging.info(
+                    f"Resumed measurement: {measurement.uuid} from sequence number {self.writer.sequence_number}"
+                )
+            else:
+                if state:
+                    logging.warning(
+                        f"Restarting upload of {filepath.name}: measurement {state['measurement_uuid']} is left incomplete"
+                    )
+                    state = None
+                measurement = self.writer.create_measurement(
+                    f"Created from {filepath.name}",
+                    basetime,
+                )
+                logging.info(f"Created measurement: {measurement.uuid}")
 
             self.convertor.start()
 
-            fetch_task = asyncio.create_task(self.fetch(data_name))  # H.264フレーム取得
+            fetch_task = asyncio.create_task(
+                self.fetch(
+                    data_name,
+                    state["acknowledged"] if state else 0,
+                    state.get("acknowledged_pts") if state else None,
+                )
+            )  # H.264フレーム取得
 
             await asyncio.gather(fetch_task)
+            completed = True
+            return True
 
         except asyncio.CancelledError:
-            pass
+            return False
         finally:
-            self.writer.complete_measurement()
-            logging.info(f"Completed measurement: {measurement.uuid}")
+            if self.writer.measurement:
+                if completed or not checkpoint:
+                    self.writer.complete_measurement()
+                    logging.info(
+                        f"Completed measurement: {self.writer.measurement.uuid}"
+                    )
+                else:
+                    checkpoint.flush()
+                    logging.info(
+                        f"Left measurement incomplete for resume: {self.writer.measurement.uuid}"
+                    )
 
-    async def fetch(self, data_name: str) -> None:
+    async def fetch(
+        self, data_name: str, skip: int = 0, skip_pts: Optional[int] = None
+    ) -> None:
         """
         H.264フレーム取得
 
@@ -72,40 +142,146 @@ class UploadService:
 
         Args:
             data_name (str): データ名
+            skip (int): 読み飛ばすフレーム数（受理済みのシーケンス番号まで）
+            skip_pts (Optional[int]): 読み飛ばす最後のフレームのPTS（ナノ秒）
 
         - フレームリスト取得
-        - チャンク送信
+        - 受理済みフレームの読み飛ばし（最後のフレームのPTSがチェックポイントと一致するか確認）
+        - チャンク作成（シーケンス番号を割り当て）
+        - チャンク送信（最大 max_in_flight 件を並列に送信し、その間もフレームを取得）
+        - シーケンス作成（総フレーム数）
+
+        Raises:
+            ValueError: 読み飛ばしたフレームがチェックポイントと一致しない場合
+            Exception: チャンク送信がリトライ後も失敗した場合
         """
-        sequence_uuid = None
+        sequence_uuid = self.writer.sequence_uuid
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        tasks: Set[asyncio.Task] = set()
+        errors: List[BaseException] = []
+
+        def done(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            semaphore.release()
+            if not task.cancelled() and task.exception():
+                errors.append(task.exception())
+
         count = 0
         idr_count = 0
-        while True:
-            frames = await self.convertor.fetch(self.fetch_size)
-            if not frames:
-                break
+        audio_count = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="ChunkUpload"
+        )
+        try:
+            while True:
+                frames = await self.convertor.fetch(self.fetch_size)
+                if not frames:
+                    break
 
-            # シーケンス作成・更新
-            count = count + len(frames)
-            sequence = self.writer.replace_measurement_sequence(
-                sequence_uuid if sequence_uuid else None,
-                count,
-            )
+                # 受理済みフレーム読み飛ばし
+                if count < skip:
+                    n = min(skip - count, len(frames))
+                    count = count + n
+                    if count == skip:
+                        pts = frames[n - 1][0]
+                        if skip_pts is not None and pts != skip_pts:
+                            raise ValueError(
+                                f"Frame {skip} PTS {pts} does not match the checkpoint {skip_pts}"
+                            )
+                        logging.info(f"Skipped acknowledged frames: {skip:,}")
+                    frames = frames[n:]
+                    if not frames:
+                        continue
 
-            # チャンク送信
-            sequence_uuid = sequence.uuid
-            results = self.writer.send_chunks(sequence.uuid, data_name, frames)
-            for result in results[0].items:
-                logging.info(
-                    f"Sent sequence chunk: sequence number {result.sequence_number}, result: {result.result}"
+                # チャンク作成
+                batch = self.writer.build_chunks(
+                    sequence_uuid, data_name, frames, self.audio_data_name
                 )
-            idr_count = idr_count + sum(results[1])
+                count = count + len(frames)
+                idr_count = idr_count + sum(batch.idr_flags)
+                audio_count = audio_count + batch.audio_frames
+
+                # チャンク送信（送信中が max_in_flight 件の場合は空くまで待つ）
+                await semaphore.acquire()
+                if errors:
+                    semaphore.release()
+                    raise errors[0]
+                task = asyncio.create_task(self.upload(executor, batch))
+                tasks.add(task)
+                task.add_done_callback(done)
+
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # 送信中のスレッドの終了は待たない（イベントループを止めない）
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        if count < skip:
+            raise ValueError(
+                f"File has {count:,} frames, fewer than {skip:,} acknowledged frames"
+            )
 
-        non_idr_count = count - idr_count
-        ratio = (idr_count / count * 100.0) if count > 0 else 0.0
+        # シーケンス作成
+        if count > 0:
+            self.writer.replace_measurement_sequence(sequence_uuid, count)
+            logging.info(
+                f"Replaced sequence: {sequence_uuid} acknowledged: {self.writer.tracker.acknowledged:,}"
+            )
+
+        sent = count - skip
+        video_count = sent - audio_count
+        non_idr_count = video_count - idr_count
+        ratio = (idr_count / video_count * 100.0) if video_count > 0 else 0.0
         logging.info(
-            f"Total frames: {count:,} IDR: {idr_count:,} Non-IDR: {non_idr_count:,} IDR ratio: {ratio:.2f}%"
+            f"Total frames: {count:,} Sent: {sent:,} IDR: {idr_count:,} Non-IDR: {non_idr_count:,} IDR ratio: {ratio:.2f}% Audio: {audio_count:,}"
         )
 
+    async def upload(self, executor: ThreadPoolExecutor, batch: ChunkBatch) -> None:
+        """
+        チャンク送信
+
+        チャンク送信（POST）は HTTP クライアントでリトライされないため、ここでリトライする。
+        シーケンス番号は送信前に割り当て済みのため、同じチャンクを再送してよい。
+        再送要求があった場合もバッチごと再送する。
+
+        Args:
+            executor (ThreadPoolExecutor): 送信スレッドプール
+            batch (ChunkBatch): 送信するチャンク
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await loop.run_in_executor(
+                    executor, self.writer.post_chunks, batch
+                )
+                self.writer.acknowledge(batch, result)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logging.error(
+                        f"Failed to send chunks: sequence number {batch.first_sequence_number}-{batch.last_sequence_number}: {e}"
+                    )
+                    raise
+                delay = RETRY_BACKOFF * 2**attempt
+                logging.warning(
+                    f"Retrying chunks in {delay:.1f}s: sequence number {batch.first_sequence_number}-{batch.last_sequence_number}: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        # 受理記録保存（一定間隔・フレーム数ごとに、イベントループ外で保存）
+        checkpoint = self.writer.checkpoint
+        if checkpoint and checkpoint.due:
+            await asyncio.to_thread(checkpoint.flush)
+
+        for item in result.items:
+            logging.info(
+                f"Sent sequence chunk: sequence number {item.sequence_number}, result: {item.result}"
+            )
+
     async def close(self) -> None:
         """
         終了
@@ -4,13 +4,17 @@ import logging
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
-from convertor.convertor import Convertor
+from client.client_factory import ClientFactory
+from convertor.mp4_demuxer import Mp4Demuxer
+from manifest.upload_manifest import UploadManifest
+from service.batch_upload_service import BatchUploadService, find_files
 from service.upload_service import UploadService
 from writer.measurement_writer import MeasurementWriter
 
-from intdash.api_client import ApiClient
-from intdash.configuration import Configuration
+if TYPE_CHECKING:
+    from convertor.convertor import Convertor
 
 # ログ設定
 logging.basicConfig(
@@ -21,6 +25,10 @@ logging.basicConfig(
 
 # 定数
 FETCH_SIZE = 100
+MAX_IN_FLIGHT = 4
+MAX_FILES = 2
+PATTERN = "*.mp4"
+MANIFEST_NAME = ".upload_manifest.json"
 
 # GStreamer パイプライン
 PIPELINE = """
@@ -32,21 +40,28 @@ PIPELINE = """
 """
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
+def new_convertor(
+    filepath: Path, demuxer: str, audio: bool = False
+) -> Union["Convertor", Mp4Demuxer]:
     """
-    REST API設定
+    コンバーター作成
+
+    GStreamerは gstreamer 指定時のみ読み込む
 
     Args:
-        api_url (str): APIのURL
-        api_token (str): APIトークン
+        filepath: MP4ファイルパス
+        demuxer: デマルチプレクサー（gstreamer/mp4）
+        audio: 音声も送信（mp4のみ）
+
     Returns:
-        ApiClient: APIクライアント
+        Union[Convertor, Mp4Demuxer]: コンバーター
     """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
+    if demuxer == "mp4":
+        return Mp4Demuxer(filepath, audio)
+
+    from convertor.convertor import Convertor
+
+    return Convertor(PIPELINE.format(path=filepath))
 
 
 async def main(
@@ -57,7 +72,15 @@ async def main(
     filepath: Path,
     data_name: str,
     basetime: str,
-) -> None:
+    max_in_flight: int = MAX_IN_FLIGHT,
+    demuxer: str = "gstreamer",
+    pattern: str = PATTERN,
+    max_files: int = MAX_FILES,
+    manifest_path: Optional[Path] = None,
+    resume: bool = False,
+    audio: bool = False,
+    audio_data_name: str = "audio/aac",
+) -> bool:
     """
     メイン
 
@@ -66,34 +89,69 @@ async def main(
         api_token: 認証用のAPIトークン
         project_uuid: プロジェクトUUID
         edge_uuid: エッジUUID
-        filepath: MP4ファイルパス
+        filepath: MP4ファイルパス、ディレクトリ、またはglobパターン
         data_name: データ名
-        basetime: 基準時刻
+        basetime: 基準時刻（ディレクトリ・globパターン指定時はファイルごとに算出）
+        max_in_flight: 同時に送信するチャンク送信数
+        demuxer: デマルチプレクサー（gstreamer: GStreamerパイプライン, mp4: GStreamerを使わずにMP4を直接読む）
+        pattern: ディレクトリ指定時のファイル名パターン
+        max_files: 同時にアップロードするファイル数
+        manifest_path: アップロード記録ファイルパス（ディレクトリ・globパターン・resume指定時の省略時は .upload_manifest.json）
+        resume: アップロード途中のファイルを続きから送信
+        audio: AAC音声も映像と同じチャンクで送信（mp4のみ）
+        audio_data_name: 音声のデータ名
+
+    Returns:
+        bool: True: 全ファイル成功
     """
     logging.info(
         f"Processing project_uuid: {project_uuid}, edge_uuid: {edge_uuid} filepath: {filepath} data_name: {data_name} basetime: {basetime}"
     )
 
     try:
-        client = get_client(api_url, api_token)
-        service = UploadService(
-            Convertor(PIPELINE.format(path=filepath)),
-            MeasurementWriter(client, project_uuid, edge_uuid),
-            FETCH_SIZE,
+        single = filepath.is_file()
+        files = find_files(filepath, pattern)
+        if not files:
+            logging.warning(f"No files found: {filepath}")
+            return True
+        if audio and demuxer != "mp4":
+            raise ValueError("--audio requires --demuxer mp4")
+        if basetime and not single:
+            raise ValueError("--basetime cannot be used with a directory or pattern")
+
+        if manifest_path is None and (not single or resume):
+            manifest_path = (
+                filepath if filepath.is_dir() else files[0].parent
+            ) / MANIFEST_NAME
+        manifest = UploadManifest(manifest_path) if manifest_path else None
+
+        factory = ClientFactory(
+            api_url, api_token, pool_maxsize=max_in_flight * min(max_files, len(files))
         )
-        await service.start(
-            filepath,
+        service = BatchUploadService(
+            lambda f, checkpoint: UploadService(
+                new_convertor(f, demuxer, audio),
+                MeasurementWriter(factory, project_uuid, edge_uuid, checkpoint),
+                FETCH_SIZE,
+                max_in_flight,
+                audio_data_name=audio_data_name,
+            ),
             data_name,
-            datetime.fromisoformat(basetime)
-            if basetime
-            else datetime.now(tz=timezone.utc),
+            manifest,
+            max_files,
+            resume,
         )
+        # 単一ファイルは指定の基準時刻（省略時は現在時刻）、複数ファイルはファイルごとに算出
+        if basetime:
+            start_time: Optional[datetime] = datetime.fromisoformat(basetime)
+        else:
+            start_time = datetime.now(tz=timezone.utc) if single else None
+        results = await service.start(files, start_time)
+        return all(r.status != "failed" for r in results)
 
     except Exception as e:
         logging.error(f"Exception occurred: {e}", exc_info=True)
-    finally:
-        await service.close()
-        pass
+        return False
 
 
 if __name__ == "__main__":
@@ -110,7 +168,42 @@ if __name__ == "__main__":
     parser.add_argument("--edge_uuid", required=True, help="Edge UUID")
 
     parser.add_argument(
-        "--src_path", type=Path, required=True, help="Input MP4 file path"
+        "--src_path",
+        type=Path,
+        required=True,
+        help="Input MP4 file path, directory or glob pattern (e.g. 'clips/*.mp4')",
+    )
+    parser.add_argument(
+        "--pattern",
+        default=PATTERN,
+        help=f"File name pattern when --src_path is a directory (default: {PATTERN})",
+    )
+    parser.add_argument(
+        "--max_files",
+        type=int,
+        default=MAX_FILES,
+        help=f"Concurrent file uploads (default: {MAX_FILES})",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help=f"Manifest of uploaded files to skip on re-runs (default: {MANIFEST_NAME} in the source directory; none for a single file without --resume)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume partially uploaded files from the manifest instead of creating new measurements",
+    )
+    parser.add_argument(
+        "--audio",
+        action="store_true",
+        help="Also upload the AAC audio track as ADTS, interleaved with video (requires --demuxer mp4)",
+    )
+    parser.add_argument(
+        "--audio_data_name",
+        default="audio/aac",
+        help="Audio data name (default: audio/aac)",
     )
     parser.add_argument(
         "--data_name",
@@ -120,12 +213,24 @@ if __name__ == "__main__":
     parser.add_argument(
         "--basetime",
         default=None,
-        help="Base time (RFC3339, e.g. 2025-01-02T12:34:56.789+09:00 or ...Z)",
+        help="Base time (RFC3339, e.g. 2025-01-02T12:34:56.789+09:00 or ...Z). Single file only; derived from each file otherwise",
+    )
+    parser.add_argument(
+        "--max_in_flight",
+        type=int,
+        default=MAX_IN_FLIGHT,
+        help=f"Concurrent chunk uploads (default: {MAX_IN_FLIGHT})",
+    )
+    parser.add_argument(
+        "--demuxer",
+        choices=["gstreamer", "mp4"],
+        default="gstreamer",
+        help="Demuxer: gstreamer pipeline or built-in mp4 reader without GStreamer (default: gstreamer)",
     )
 
     args = parser.parse_args()
 
-    asyncio.run(
+    succeeded = asyncio.run(
         main(
             args.api_url,
             args.api_token,
@@ -134,5 +239,14 @@ if __name__ == "__main__":
             args.src_path,
             args.data_name,
             args.basetime,
+            args.max_in_flight,
+            args.demuxer,
+            args.pattern,
+            args.max_files,
+            args.manifest,
+            args.resume,
+            args.audio,
+            args.audio_data_name,
         )
     )
+    sys.exit(0 if succeeded else 1)
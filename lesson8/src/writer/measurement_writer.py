@@ -1,9 +1,15 @@
 import io
 import logging
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from client.client_factory import ClientFactory
+from convertor.mp4_demuxer import TRACK_AUDIO
+from manifest.upload_checkpoint import UploadCheckpoint
+from writer.sequence_tracker import SequenceTracker
+
 from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataChunk,
     StoreDataChunks,
@@ -11,10 +17,11 @@ from gen.intdash.v1.protocol_pb2 import (  # type: ignore
     StoreDataPoint,
     StoreDataPointGroup,
 )
-from intdash import ApiClient
-from intdash.api import (
-    measurement_service_measurement_sequences_api,
-    measurement_service_measurements_api,
+from intdash.api.measurement_service_measurement_sequences_api import (
+    MeasurementServiceMeasurementSequencesApi,
+)
+from intdash.api.measurement_service_measurements_api import (
+    MeasurementServiceMeasurementsApi,
 )
 from intdash.model.create_measurement_chunks_result import CreateMeasurementChunksResult
 from intdash.model.meas_create import MeasCreate
@@ -27,17 +34,49 @@ from intdash.model.measurement_sequence_group_replace import (
 
 NAL_START_CODES = [b"\x00\x00\x00\x01", b"\x00\x00\x01"]
 
+# 再送要求を示すチャンク送信結果
+RESULT_RESEND = "resend"
+
+# AAC（ADTS）フレームのデータ型名
+AAC_TYPE = "aac"
+
+
+@dataclass(slots=True)
+class ChunkBatch:
+    """
+    送信チャンク
+
+    Attributes:
+        body (bytes): シリアライズ済み StoreDataChunks（チャンクなしの場合は空）
+        first_sequence_number (int): 先頭のシーケンス番号
+        last_sequence_number (int): 末尾のシーケンス番号
+        idr_flags (List[bool]): 各映像フレームの IDR 判定結果
+        last_pts (Optional[int]): 末尾のフレームのPTS（ナノ秒）
+        audio_frames (int): 音声フレーム数
+    """
+
+    body: bytes
+    first_sequence_number: int
+    last_sequence_number: int
+    idr_flags: List[bool]
+    last_pts: Optional[int] = None
+    audio_frames: int = 0
+
 
 class MeasurementWriter:
     """
     計測作成
 
     Attributes:
-        client (ApiClient): APIクライアント
+        factory (ClientFactory): APIクライアント生成
         project_uuid (str): プロジェクトのUUID
         edge_uuid (str): エッジUUID
         measurement (Measurement): 新規計測
+        sequence_uuid (Optional[str]): シーケンスUUID
         sequence_number (int): シーケンス番号
+        tracker (SequenceTracker): 送信完了管理
+        checkpoint (Optional[UploadCheckpoint]): チェックポイント（指定時は受理状況を保存）
+        _last_pts (Dict[int, int]): 未連結のバッチ末尾シーケンス番号ごとのPTS
     """
 
     @staticmethod
@@ -145,17 +184,29 @@ class MeasurementWriter:
         # 全ての必要なNAL Unitが見つからなかった場合
         return False
 
-    def __init__(self, client: ApiClient, project_uuid: str, edge_uuid: str) -> None:
-        self.client = client
+    def __init__(
+        self,
+        factory: ClientFactory,
+        project_uuid: str,
+        edge_uuid: str,
+        checkpoint: Optional[UploadCheckpoint] = None,
+    ) -> None:
+        self.factory = factory
         self.project_uuid = project_uuid
         self.edge_uuid = edge_uuid
         self.measurement = None
+        self.sequence_uuid: Optional[str] = None
         self.sequence_number = 1
+        self.tracker = SequenceTracker()
+        self.checkpoint = checkpoint
+        self._last_pts: Dict[int, int] = {}
 
     def create_measurement(self, name: str, basetime: datetime) -> Measurement:
         """
         計測作成
 
+        シーケンスUUIDも作成し、チェックポイント指定時は記録を開始する
+
         Args:
             name (str): 名前
             basetime (datetime): 基準時刻
@@ -171,13 +222,41 @@ class MeasurementWriter:
         meas_dict["protected"] = False
         meas_create = MeasCreate(**meas_dict)
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         measurement = api.create_project_measurement(
             self.project_uuid, meas_create=meas_create
         )
         self.measurement = measurement
+        self.sequence_uuid = str(uuid.uuid4())
+        if self.checkpoint:
+            self.checkpoint.start(measurement.uuid, self.sequence_uuid, basetime)
+        return measurement
+
+    def resume_measurement(
+        self, measurement_uuid: str, sequence_uuid: str, acknowledged: int
+    ) -> Measurement:
+        """
+        計測再開
+
+        作成済みの計測・シーケンスに、受理済みの続きのシーケンス番号から送信する
+
+        Args:
+            measurement_uuid (str): 計測UUID
+            sequence_uuid (str): シーケンスUUID
+            acknowledged (int): 先頭から連続して受理された最後のシーケンス番号
+
+        Returns:
+            Measurement: 再開する計測オブジェクト
+        """
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
+        measurement = api.get_project_measurement(
+            project_uuid=self.project_uuid, measurement_uuid=measurement_uuid
+        )
+        self.measurement = measurement
+        self.sequence_uuid = sequence_uuid
+        self.sequence_number = acknowledged + 1
+        self.tracker = SequenceTracker(acknowledged)
+        self._last_pts = {}
         return measurement
 
     def replace_measurement_sequence(
@@ -207,9 +286,7 @@ class MeasurementWriter:
             final_sequence_number=count,
         )
 
-        api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementSequencesApi)
         sequence = api.replace_project_measurement_sequence(
             project_uuid=self.project_uuid,
             measurement_uuid=self.measurement.uuid,
@@ -218,48 +295,61 @@ class MeasurementWriter:
         )
         return sequence
 
-    def send_chunks(
+    def build_chunks(
         self,
         sequence_uuid: str,
         data_name: str,
-        frames: list[Tuple[int, bytes]],
-    ) -> Tuple[CreateMeasurementChunksResult, List[bool]]:
+        frames: list[tuple],
+        audio_data_name: str = "audio/aac",
+    ) -> ChunkBatch:
         """
-        チャンク送信
+        チャンク作成
 
         NAL Unit Type: AUD(9)をスキップする。Data Visualizerでのデコードのため。
         フレームのIDR/Non-IDR判定してデータ型名を決定する。
+        音声フレーム（トラック種別が audio）はADTSのままAACとして送信する。
+        シーケンス番号はここで割り当てるため、送信は並列・順不同でよい。
 
         Args:
             sequence_uuid (str): シーケンスのUUID
             dana_name (str): データ名
-            frames (list): フレームリスト [(pts_ns, payload), ...]
+            frames (list): フレームリスト [(pts_ns, payload[, track]), ...]
+            audio_data_name (str): 音声のデータ名
 
         Returns:
-            CreateMeasurementChunksResult: チャンク送信結果
-            list[bool]: 各フレームの IDR 判定結果（True=IDR, False=Non-IDR）
+            ChunkBatch: 送信するチャンク
         """
         if not self.measurement:
             raise RuntimeError("Measurement is None")
 
         chunks = []
         idr_flags: List[bool] = []
+        audio_frames = 0
+        first_sequence_number = self.sequence_number
 
-        for point_time, frame in frames:
+        for point_time, frame, *track in frames:
             elapsed_time = point_time
-            payload = MeasurementWriter.skip_aud(frame)
+            if track and track[0] == TRACK_AUDIO:
+                payload = frame
+                data_id = StoreDataID(type=AAC_TYPE, name=audio_data_name)
+                audio_frames += 1
+            else:
+                payload = MeasurementWriter.skip_aud(frame)
+
+                is_idr = self.is_idr_frame(payload)
+                idr_flags.append(is_idr)
+
+                type_name = (
+                    "h264_frame/idr_frame" if is_idr else "h264_frame/non_idr_frame"
+                )
+                data_id = StoreDataID(type=type_name, name=data_name)
 
             store_data_point = StoreDataPoint(
                 elapsed_time=elapsed_time,
                 payload=payload,
             )
-
-            is_idr = self.is_idr_frame(payload)
-            idr_flags.append(is_idr)
-
-            type_name = "h264_frame/idr_frame" if is_idr else "h264_frame/non_idr_frame"
             store_data_point_group = StoreDataPointGroup(
-                data_id=StoreDataID(type=type_name, name=data_name),
+                data_id=data_id,
                 data_points=[store_data_point],
             )
             store_data_chunk = StoreDataChunk(
@@ -272,30 +362,112 @@ class MeasurementWriter:
         chunk = StoreDataChunks(
             meas_uuid=self.measurement.uuid, sequence_uuid=sequence_uuid, chunks=chunks
         )
-        if not chunk.chunks:
+        return ChunkBatch(
+            body=chunk.SerializeToString() if chunks else b"",
+            first_sequence_number=first_sequence_number,
+            last_sequence_number=self.sequence_number - 1,
+            idr_flags=idr_flags,
+            last_pts=frames[-1][0] if frames else None,
+            audio_frames=audio_frames,
+        )
+
+    def post_chunks(self, batch: ChunkBatch) -> CreateMeasurementChunksResult:
+        """
+        チャンク送信（作成済み）
+
+        複数スレッドから同時に呼び出せる
+
+        Args:
+            batch (ChunkBatch): 送信するチャンク
+
+        Returns:
+            CreateMeasurementChunksResult: チャンク送信結果
+        """
+        if not batch.body:
             logging.warning("No chunks available to send.")
-            return CreateMeasurementChunksResult(), idr_flags
+            return CreateMeasurementChunksResult()
 
-        api = measurement_service_measurement_sequences_api.MeasurementServiceMeasurementSequencesApi(
-            self.client
-        )
-        results = api.create_project_measurement_sequence_chunks(
+        api = self.factory.api(MeasurementServiceMeasurementSequencesApi)
+        return api.create_project_measurement_sequence_chunks(
             project_uuid=self.project_uuid,
-            body=io.BytesIO(chunk.SerializeToString()),
+            body=io.BytesIO(batch.body),
             _content_type="application/vnd.iscp.v2.protobuf",
         )
-        return results, idr_flags
+
+    def acknowledge(
+        self, batch: ChunkBatch, result: CreateMeasurementChunksResult
+    ) -> int:
+        """
+        受理確認
+
+        再送要求がなければバッチを受理済みとし、先頭から連続して受理された
+        シーケンス番号が進んだ場合はチェックポイントに記録する（保存は呼び出し側）
+
+        Args:
+            batch (ChunkBatch): 送信したチャンク
+            result (CreateMeasurementChunksResult): チャンク送信結果
+
+        Returns:
+            int: 先頭から連続して受理された最後のシーケンス番号
+
+        Raises:
+            RuntimeError: 再送要求があった場合
+        """
+        resend = [
+            item.sequence_number
+            for item in result.get("items", [])
+            if item.result == RESULT_RESEND
+        ]
+        if resend:
+            raise RuntimeError(f"Resend requested: {len(resend)} chunks")
+
+        if batch.last_pts is not None:
+            self._last_pts[batch.last_sequence_number] = batch.last_pts
+        previous = self.tracker.acknowledged
+        acknowledged = self.tracker.complete(
+            batch.first_sequence_number, batch.last_sequence_number
+        )
+        if acknowledged > previous:
+            pts = self._last_pts.get(acknowledged)
+            for sequence_number in [n for n in self._last_pts if n <= acknowledged]:
+                del self._last_pts[sequence_number]
+            if self.checkpoint and pts is not None:
+                self.checkpoint.ack(acknowledged, pts)
+        return acknowledged
+
+    def send_chunks(
+        self,
+        sequence_uuid: str,
+        data_name: str,
+        frames: list[Tuple[int, bytes]],
+    ) -> Tuple[CreateMeasurementChunksResult, List[bool]]:
+        """
+        チャンク送信
+
+        Args:
+            sequence_uuid (str): シーケンスのUUID
+            dana_name (str): データ名
+            frames (list): フレームリスト [(pts_ns, payload), ...]
+
+        Returns:
+            CreateMeasurementChunksResult: チャンク送信結果
+            list[bool]: 各フレームの IDR 判定結果（True=IDR, False=Non-IDR）
+        """
+        batch = self.build_chunks(sequence_uuid, data_name, frames)
+        return self.post_chunks(batch), batch.idr_flags
 
     def complete_measurement(self) -> None:
         """
         計測完了
+
+        チェックポイント指定時は完了を記録する
         """
         if not self.measurement:
             raise RuntimeError("Measurement is None")
 
-        api = measurement_service_measurements_api.MeasurementServiceMeasurementsApi(
-            self.client
-        )
+        api = self.factory.api(MeasurementServiceMeasurementsApi)
         api.complete_project_measurement(
             project_uuid=self.project_uuid, measurement_uuid=self.measurement.uuid
         )
+        if self.checkpoint:
+            self.checkpoint.complete(self.measurement.uuid)
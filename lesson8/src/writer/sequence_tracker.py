@@ -0,0 +1,48 @@
+import threading
+from typing import Dict
+
+
+class SequenceTracker:
+    """
+    シーケンス送信完了管理
+
+    チャンクは並列に送信されるため、完了順はシーケンス番号順とは限らない。
+    完了した範囲を記録し、先頭から途切れなく完了したシーケンス番号を求める。
+
+    Attributes:
+        acknowledged (int): 先頭から途切れなく送信完了した最後のシーケンス番号
+        _pending (Dict[int, int]): 完了済みで未連結の範囲（先頭→末尾）
+        _lock (threading.Lock): 排他制御
+    """
+
+    def __init__(self, acknowledged: int = 0) -> None:
+        self.acknowledged = acknowledged
+        self._pending: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def complete(self, first: int, last: int) -> int:
+        """
+        送信完了
+
+        Args:
+            first (int): 先頭のシーケンス番号
+            last (int): 末尾のシーケンス番号
+
+        Returns:
+            int: 先頭から途切れなく送信完了した最後のシーケンス番号
+        """
+        with self._lock:
+            if last < first or last <= self.acknowledged:
+                return self.acknowledged
+            self._pending[first] = max(last, self._pending.get(first, last))
+            while self.acknowledged + 1 in self._pending:
+                self.acknowledged = self._pending.pop(self.acknowledged + 1)
+            return self.acknowledged
+
+    @property
+    def outstanding(self) -> int:
+        """
+        未連結の完了範囲の数
+        """
+        with self._lock:
+            return len(self._pending)
@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from client.client_factory import ClientFactory
 from const.const import (
     DATA_NAME_AAC,
     DATA_NAME_ALTITUDE,
@@ -18,9 +19,6 @@ from mux.muxer import Muxer
 from reader.measurement_reader import MeasurementReader
 from service.download_service import DownloadConfig, DownloadService
 
-from intdash.api_client import ApiClient
-from intdash.configuration import Configuration
-
 # ログ設定
 logging.basicConfig(
     level=logging.INFO,
@@ -29,23 +27,6 @@ logging.basicConfig(
 )
 
 
-def get_client(api_url: str, api_token: str) -> ApiClient:
-    """
-    REST API設定
-
-    Args:
-        api_url (str): APIのURL
-        api_token (str): APIトークン
-    Returns:
-        ApiClient: APIクライアント
-    """
-    configuration = Configuration(
-        host=f"{api_url}/api", api_key={"IntdashToken": api_token}
-    )
-    client = ApiClient(configuration)
-    return client
-
-
 def to_filter(*names: str) -> list[str]:
     """
     データID配列生成
@@ -99,7 +80,7 @@ def main(
     )
     service = None
     try:
-        client = get_client(api_url, api_token)
+        factory = ClientFactory(api_url, api_token)
 
         data_id_filter: list[str] = []
         emit_pcm = "pcm" in tracks
@@ -129,7 +110,7 @@ def main(
                 mux=mux,
             ),
             MeasurementReader(
-                client, project_uuid, edge_uuid, meas_uuid, start, end, data_id_filter
+                factory, project_uuid, edge_uuid, meas_uuid, start, end, data_id_filter
             ),
             resampler if emit_pcm else None,
             geocoder if emit_subtitle else None,